@@ -0,0 +1,126 @@
+"""
+YouTube Downloader Pro — Single-Pass Mux Benchmark
+
+Bytes written per item by yt-dlp's postprocessor chain (merge, then
+FFmpegEmbedSubtitle, then FFmpegMetadata — each a full rewrite) vs.
+SinglePassMuxPP. Synthetic video/audio streams and a subtitle file are
+generated with FFmpeg; no network access. Every FFmpeg output file is
+counted once at its final size.
+
+Usage:
+    python benchmarks/bench_ffmpeg_mux.py [seconds] [items]
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import yt_dlp
+from yt_dlp.postprocessor.ffmpeg import (
+    FFmpegEmbedSubtitlePP, FFmpegMergerPP, FFmpegMetadataPP, FFmpegPostProcessor,
+)
+
+from services.ffmpeg_mux import SinglePassMuxPP
+
+written = {"bytes": 0, "runs": 0}
+
+
+def counting(real_run_ffmpeg):
+    """Wrap real_run_ffmpeg to add up the size of every file it writes."""
+    def run(self, input_path_opts, output_path_opts, **kwargs):
+        result = real_run_ffmpeg(self, input_path_opts, output_path_opts, **kwargs)
+        for path, _ in output_path_opts:
+            if path:
+                written["bytes"] += os.path.getsize(path)
+        written["runs"] += 1
+        return result
+    return run
+
+
+def make_streams(folder: str, seconds: int) -> None:
+    """Video-only mp4, audio-only m4a and an English WebVTT file."""
+    ffmpeg = ["ffmpeg", "-y", "-loglevel", "error"]
+    subprocess.run(ffmpeg + [
+        "-f", "lavfi", "-i", f"testsrc2=size=1280x720:rate=30:duration={seconds}",
+        "-c:v", "libx264", "-preset", "ultrafast", "-b:v", "4M", "-an",
+        os.path.join(folder, "src.f137.mp4"),
+    ], check=True)
+    subprocess.run(ffmpeg + [
+        "-f", "lavfi", "-i", f"sine=frequency=440:duration={seconds}",
+        "-c:a", "aac", "-b:a", "128k", "-vn",
+        os.path.join(folder, "src.f140.m4a"),
+    ], check=True)
+    with open(os.path.join(folder, "src.en.vtt"), "w", encoding="utf-8") as f:
+        f.write("WEBVTT\n\n")
+        for n in range(0, seconds, 2):
+            f.write(f"00:{n // 60:02d}:{n % 60:02d}.000 --> 00:{n // 60:02d}:{n % 60:02d}.900\nLine {n}\n\n")
+
+
+def item_info(src: str, work: str, n: int) -> dict:
+    """A fresh copy of the downloaded files, as yt-dlp leaves them before post-processing."""
+    base = os.path.join(work, f"item{n}")
+    video, audio, subs = base + ".f137.mp4", base + ".f140.m4a", base + ".en.vtt"
+    for name, dest in (("src.f137.mp4", video), ("src.f140.m4a", audio), ("src.en.vtt", subs)):
+        shutil.copyfile(os.path.join(src, name), dest)
+    return {
+        "id": f"item{n}", "title": f"Item {n}", "ext": "mp4", "filepath": base + ".mp4",
+        "upload_date": "20240101", "uploader": "Bench", "webpage_url": "https://example.com",
+        "vcodec": "avc1", "acodec": "mp4a",
+        "requested_formats": [
+            {"format_id": "137", "vcodec": "avc1", "acodec": "none", "protocol": "https", "filepath": video},
+            {"format_id": "140", "vcodec": "none", "acodec": "mp4a", "protocol": "https", "filepath": audio},
+        ],
+        "requested_subtitles": {"en": {"ext": "vtt", "filepath": subs, "name": "English"}},
+        "__files_to_merge": [video, audio],
+        "__files_to_move": {},
+    }
+
+
+def run(name: str, pipeline, src: str, items: int) -> int:
+    written["bytes"] = written["runs"] = 0
+    with tempfile.TemporaryDirectory() as work, yt_dlp.YoutubeDL({"quiet": True}) as ydl:
+        start = time.perf_counter()
+        for n in range(items):
+            info = item_info(src, work, n)
+            for pp in pipeline(ydl):
+                info = ydl.run_pp(pp, info)
+        elapsed = time.perf_counter() - start
+    per_item = written["bytes"] / items
+    print(f"{name:<12} {per_item / 2**20:9.1f} MiB/item  "
+          f"{written['runs'] / items:4.1f} FFmpeg runs/item  {elapsed / items:6.2f} s/item")
+    return written["bytes"]
+
+
+def chain(ydl):
+    return [FFmpegMergerPP(ydl), FFmpegEmbedSubtitlePP(ydl), FFmpegMetadataPP(ydl)]
+
+
+def single_pass(ydl):
+    return [SinglePassMuxPP(ydl)]
+
+
+def main() -> None:
+    seconds = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    items = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    if not shutil.which("ffmpeg"):
+        sys.exit("ffmpeg not found on PATH")
+
+    FFmpegPostProcessor.real_run_ffmpeg = counting(FFmpegPostProcessor.real_run_ffmpeg)
+    with tempfile.TemporaryDirectory() as src:
+        make_streams(src, seconds)
+        size = sum(os.path.getsize(os.path.join(src, f)) for f in os.listdir(src))
+        print(f"{items} item(s), {seconds} s of 720p each ({size / 2**20:.1f} MiB downloaded)")
+
+        old = run("chain", chain, src, items)
+        new = run("single-pass", single_pass, src, items)
+
+    print(f"reduction    {old / new:9.1f}x fewer bytes written")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+YouTube Downloader Pro — YoutubeDL Pool Benchmark
+
+Per-item overhead of a fresh YoutubeDL per URL vs. a pooled instance.
+No network access: measures construction/teardown cost only, which is
+the part the pool removes (TLS and cookie reuse come on top of this).
+
+Usage:
+    python benchmarks/bench_ydl_pool.py [items] [workers]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import yt_dlp
+
+from services.downloader import DownloadService
+from services.ydl_pool import YoutubeDLPool
+
+OPTS = DownloadService._INFO_OPTS
+
+
+def per_call(count: int) -> None:
+    for _ in range(count):
+        with yt_dlp.YoutubeDL(dict(OPTS)) as ydl:
+            ydl.params.get("quiet")
+
+
+def pooled(pool: YoutubeDLPool, count: int) -> None:
+    for _ in range(count):
+        with pool.checkout(OPTS) as ydl:
+            ydl.params.get("quiet")
+
+
+def run(name: str, func, items: int, workers: int) -> float:
+    per_worker = items // workers
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        for future in [executor.submit(func, per_worker) for _ in range(workers)]:
+            future.result()
+    elapsed = time.perf_counter() - start
+    print(f"{name:<12} {elapsed:8.3f} s  {elapsed / items * 1000:8.3f} ms/item")
+    return elapsed
+
+
+def main() -> None:
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    print(f"{items} items, {workers} worker(s)")
+
+    fresh = run("per-call", per_call, items, workers)
+
+    pool = YoutubeDLPool()
+    pool.warm(OPTS, workers)
+    reused = run("pooled", lambda n: pooled(pool, n), items, workers)
+    pool.close()
+
+    print(f"speedup      {fresh / reused:8.1f}x  {pool.stats}")
+
+
+if __name__ == "__main__":
+    main()
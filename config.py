@@ -24,8 +24,11 @@ APP_ICON = "🎬"
 APP_DATA_DIR = Path(os.path.expanduser("~")) / ".ytdownloader_pro"
 SETTINGS_FILE = APP_DATA_DIR / "settings.json"
 HISTORY_FILE = APP_DATA_DIR / "download_history.json"
+QUEUE_JOURNAL_FILE = APP_DATA_DIR / "queue_journal.jsonl"
+PARTIALS_FILE = APP_DATA_DIR / "partial_files.json"  # Partial downloads this app started
 LOG_FILE = APP_DATA_DIR / "app.log"
 THUMBNAIL_CACHE_DIR = APP_DATA_DIR / "thumbnails"
+METADATA_STORE_DIR = APP_DATA_DIR / "metadata"
 
 # ============================================================
 # Catppuccin Mocha Color Palette
@@ -100,6 +103,30 @@ SPEED_LIMITS = [
     ("20 MB/s", 20 * 1024 * 1024),
 ]
 
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# In-memory metadata cache: bounded by size; TTL below YouTube's ~6 h stream URL expiry
+METADATA_CACHE_MAX_BYTES = 64 * 1024 * 1024
+METADATA_CACHE_TTL = 4 * 3600
+
+# Fragmented (DASH/HLS) and chunked HTTP downloads
+MAX_CONCURRENT_FRAGMENTS = 16
+
+CHUNK_SIZES = [
+    ("Off", None),
+    ("1 MB", 1 * 1024 * 1024),
+    ("5 MB", 5 * 1024 * 1024),
+    ("10 MB", 10 * 1024 * 1024),
+    ("50 MB", 50 * 1024 * 1024),
+]
+
+SCHEDULING_POLICIES = [
+    ("First In, First Out", "fifo"),
+    ("Priority", "priority"),
+    ("Shortest First", "shortest_first"),
+    ("Fair Share (Playlists)", "round_robin"),
+]
+
 SUBTITLE_LANGUAGES = [
     ("English", "en"),
     ("Russian", "ru"),
@@ -171,6 +198,20 @@ class AppSettings:
     clipboard_monitor: bool = True
     auto_download: bool = False
     max_concurrent: int = 1
+    adaptive_concurrency: bool = True  # Start at max_concurrent, grow/shrink with throughput; pause on failures
+    scheduling_policy: str = "fifo"
+    progress_interval_ms: int = 250  # How often progress consumers sample
+    concurrent_fragments: int = 4  # Parallel DASH/HLS fragments per download
+    http_chunk_size: Optional[int] = 10 * 1024 * 1024  # Ranged HTTP requests (None = off)
+    adaptive_fragments: bool = True  # Tune the two above from observed throughput
+    metadata_workers: int = 4  # Concurrent metadata extractions (all sources)
+    metadata_processes: int = 0  # Run extractions in this many processes (0 = threads)
+    prefetch_depth: int = 3  # Upcoming items resolved ahead of the workers (0 = off)
+    postprocess_workers: int = 0  # FFmpeg merge/convert threads (0 = from CPU count)
+    single_pass_mux: bool = True  # Merge, embed subtitles and tag in one FFmpeg run
+    avoid_transcode: bool = False  # Prefer native audio / stream-copy video over re-encoding
+    min_free_space_mb: int = 512  # Kept free on the output disk when admitting downloads
+    partial_max_age_days: int = 7  # Unreferenced .part files older than this are deleted
     window_width: int = 900
     window_height: int = 750
 
@@ -7,9 +7,9 @@ All data models (dataclass) and status enums.
 from __future__ import annotations
 
 import enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, asdict, fields
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class DownloadStatus(enum.Enum):
@@ -30,6 +30,13 @@ class DownloadFormat(enum.Enum):
     AUDIO = "audio"
 
 
+class MediaPath(enum.Enum):
+    """How the output file was produced from the downloaded streams."""
+    DIRECT = "direct"  # Saved as downloaded
+    REMUX = "remux"  # Streams copied into the output container
+    TRANSCODE = "transcode"  # Re-encoded
+
+
 @dataclass
 class VideoInfo:
     """YouTube video metadata."""
@@ -87,6 +94,18 @@ class VideoInfo:
             raw_info=info,
         )
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-safe dictionary (without ``raw_info``)."""
+        data = asdict(self)
+        data.pop("raw_info", None)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "VideoInfo":
+        """Create VideoInfo from ``to_dict()`` output (unknown keys ignored)."""
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in names})
+
 
 @dataclass
 class DownloadItem:
@@ -103,6 +122,12 @@ class DownloadItem:
     error_message: str = ""
     added_at: str = field(default_factory=lambda: datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
     completed_at: Optional[str] = None
+    priority: int = 0  # Higher runs first (priority scheduling)
+    group: str = ""  # Fair-share group, e.g. the playlist URL
+    bandwidth_weight: float = 1.0  # Relative share of the global speed limit
+    attempts: int = 0  # Failed attempts so far (reset on success or manual retry)
+    partial_files: List[str] = field(default_factory=list)  # .part files to resume
+    media_path: Optional[MediaPath] = None  # Set once the download is post-processed
 
     @property
     def title(self) -> str:
@@ -155,8 +180,54 @@ class DownloadItem:
             "filesize_str": self.video_info.filesize_str,
             "added_at": self.added_at,
             "completed_at": self.completed_at,
+            "media_path": self.media_path.value if self.media_path else None,
         }
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-safe dictionary for queue persistence."""
+        return {
+            "video_info": self.video_info.to_dict(),
+            "format": self.format.value,
+            "quality": self.quality,
+            "audio_quality": self.audio_quality,
+            "status": self.status.value,
+            "progress": self.progress,
+            "filepath": self.filepath,
+            "error_message": self.error_message,
+            "added_at": self.added_at,
+            "completed_at": self.completed_at,
+            "priority": self.priority,
+            "group": self.group,
+            "bandwidth_weight": self.bandwidth_weight,
+            "attempts": self.attempts,
+            "partial_files": list(self.partial_files),
+            "media_path": self.media_path.value if self.media_path else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DownloadItem":
+        """Create a DownloadItem from ``to_dict()`` output."""
+        item = cls(
+            video_info=VideoInfo.from_dict(data["video_info"]),
+            format=DownloadFormat(data.get("format", DownloadFormat.VIDEO.value)),
+            quality=data.get("quality", "best"),
+            audio_quality=data.get("audio_quality", "192"),
+            status=DownloadStatus(data.get("status", DownloadStatus.PENDING.value)),
+            progress=data.get("progress", 0.0),
+            filepath=data.get("filepath"),
+            error_message=data.get("error_message", ""),
+            completed_at=data.get("completed_at"),
+            priority=data.get("priority", 0),
+            group=data.get("group", ""),
+            bandwidth_weight=data.get("bandwidth_weight", 1.0),
+            attempts=data.get("attempts", 0),
+            partial_files=list(data.get("partial_files", [])),
+            media_path=MediaPath(data["media_path"]) if data.get("media_path") else None,
+        )
+        if data.get("added_at"):
+            item.added_at = data["added_at"]
+        return item
+
 
 @dataclass
 class DownloadProgress:
@@ -170,6 +241,33 @@ class DownloadProgress:
     filename: str = ""
 
 
+@dataclass
+class QueueChange:
+    """Delta of one queue operation (a batch is a single event).
+
+    ``added`` items were appended to the end of the queue; ``updated``
+    items changed in place. ``reordered`` means positions changed and the
+    receiver should re-read the whole queue.
+    """
+    added: List[DownloadItem] = field(default_factory=list)
+    removed: List[DownloadItem] = field(default_factory=list)
+    updated: List[DownloadItem] = field(default_factory=list)
+    reordered: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.updated or self.reordered)
+
+    def merge(self, other: "QueueChange") -> "QueueChange":
+        """Combine with a later change (coalescing several events)."""
+        removed_urls = {item.url for item in other.removed}
+        return QueueChange(
+            added=[i for i in self.added if i.url not in removed_urls] + other.added,
+            removed=self.removed + other.removed,
+            updated=[i for i in self.updated if i.url not in removed_urls] + other.updated,
+            reordered=self.reordered or other.reordered,
+        )
+
+
 def format_bytes(size: int | float) -> str:
     """Convert bytes to human-readable format."""
     if size <= 0:
@@ -0,0 +1,156 @@
+"""
+YouTube Downloader Pro — Disk-Space Admission
+
+Before a download starts it reserves the bytes it is expected to write.
+A download is admitted only while every reservation still fits in the
+free space of the output directory minus a safety margin; otherwise it is
+held until a running download releases its reservation. This avoids
+filling the disk and failing several downloads late, with their partial
+files left behind.
+"""
+
+from __future__ import annotations
+
+import enum
+import logging
+import os
+import shutil
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from models import VideoInfo
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+# Peak disk use of a download relative to its size: the downloaded streams
+# plus the file merge/convert writes before the inputs are deleted
+POSTPROCESS_FACTOR = 2
+
+
+class Admission(enum.Enum):
+    """Result of a reservation request."""
+    ADMITTED = "admitted"
+    HELD = "held"  # Doesn't fit now; will once running downloads finish
+    REJECTED = "rejected"  # Doesn't fit even with nothing else reserved
+
+
+def free_bytes(path: str) -> int:
+    """Free space on the filesystem that holds ``path`` (or would hold it)."""
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return shutil.disk_usage(path).free
+
+
+def selected_size(info: Dict[str, Any], ydl: Any) -> int:
+    """Bytes of the formats yt-dlp would pick for ``info`` (0 if unknown).
+
+    Args:
+        info: Resolved info dict with its ``formats``.
+        ydl: YoutubeDL configured with the download's format options.
+    """
+    formats = [dict(f) for f in info.get("formats") or []]
+    if not formats:
+        return 0
+    ydl.sort_formats({"formats": formats})  # Honours the download's format_sort
+    selector = ydl.build_format_selector(ydl.params.get("format") or "bestvideo*+bestaudio/best")
+    chosen = next(iter(selector({
+        "formats": formats,
+        "has_merged_format": any("none" not in (f.get("acodec"), f.get("vcodec")) for f in formats),
+        "incomplete_formats": (all(f.get("vcodec") == "none" for f in formats)
+                               or all(f.get("acodec") == "none" for f in formats)),
+    })), None)
+    if chosen is None:
+        return 0
+    parts = chosen.get("requested_formats") or [chosen]
+    if any(not (f.get("filesize") or f.get("filesize_approx")) for f in parts):
+        return 0  # A stream of unknown size: use the caller's fallback
+    return sum(int(f.get("filesize") or f.get("filesize_approx")) for f in parts)
+
+
+def expected_bytes(
+    video_info: VideoInfo,
+    ydl: Any = None,
+    partial_files: Iterable[str] = (),
+) -> int:
+    """Disk space a download will need at its peak.
+
+    The selected format sizes are used when the info is resolved (``ydl``
+    given), else ``VideoInfo.filesize_approx``. Bytes of resumable
+    ``.part`` files are already on disk and are subtracted.
+    """
+    size = 0
+    if ydl is not None and video_info.raw_info.get("formats"):
+        try:
+            size = selected_size(video_info.raw_info, ydl)
+        except Exception as e:
+            logger.debug(f"Format size estimate failed for {video_info.title}: {e}")
+    size = size or video_info.filesize_approx
+    on_disk = sum(os.path.getsize(p) for p in partial_files if os.path.exists(p))
+    return max(0, POSTPROCESS_FACTOR * size - on_disk)
+
+
+class DiskAdmission:
+    """Byte reservations against the free space of the output directory.
+
+    Free space is read on every request, so space freed or used outside
+    the app is taken into account. Reservations are not reduced while a
+    download writes; that errs on the side of holding.
+    """
+
+    def __init__(self, margin: int = 0, disk_free: Callable[[str], int] = free_bytes):
+        """
+        Args:
+            margin: Bytes always left free.
+            disk_free: Free-space probe (for tests).
+        """
+        self._margin = max(0, margin)
+        self._disk_free = disk_free
+        self._lock = threading.Lock()
+        self._reservations: Dict[str, int] = {}
+
+    @property
+    def reserved(self) -> int:
+        """Bytes reserved by running downloads."""
+        with self._lock:
+            return sum(self._reservations.values())
+
+    def reserve(self, key: str, nbytes: int, directory: str) -> Admission:
+        """Reserve ``nbytes`` for ``key`` if they fit (re-reserving replaces).
+
+        Args:
+            key: Download identity (the URL).
+            nbytes: Expected bytes (0 = unknown: admitted while above the margin).
+            directory: Output directory.
+        """
+        try:
+            free = self._disk_free(directory)
+        except OSError as e:
+            logger.warning(f"Free space check failed for {directory}: {e}")
+            free = None
+        with self._lock:
+            self._reservations.pop(key, None)
+            if free is None:
+                self._reservations[key] = nbytes  # Can't tell; don't block downloads
+                return Admission.ADMITTED
+            others = sum(self._reservations.values())
+            if others + nbytes <= free - self._margin:
+                self._reservations[key] = nbytes
+                return Admission.ADMITTED
+            return Admission.HELD if self._reservations else Admission.REJECTED
+
+    def release(self, key: str) -> bool:
+        """Drop ``key``'s reservation.
+
+        Returns:
+            True if it held one.
+        """
+        with self._lock:
+            return self._reservations.pop(key, None) is not None
+
+    def reservation(self, key: str) -> Optional[int]:
+        with self._lock:
+            return self._reservations.get(key)
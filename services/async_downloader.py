@@ -0,0 +1,409 @@
+"""
+YouTube Downloader Pro — Asyncio Download Engine
+
+asyncio-native front end for DownloadService: awaitable queue operations,
+async iterators for status and progress events, and cancellation by
+cancelling the awaiting task. Workers are coroutines; blocking yt-dlp work
+runs in executors owned by the engine, so queued items cost no threads
+until they start.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Set, Tuple,
+)
+
+from config import AppSettings
+from models import DownloadItem, DownloadProgress, DownloadStatus, QueueChange, VideoInfo
+from services.downloader import DownloadService
+from services.fetcher import FetchResult
+from services.journal import QueueJournal
+from services.metadata_store import MetadataStore
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+# Statuses an item does not leave without a new request (retry, re-add...)
+_FINAL_STATUSES = (DownloadStatus.COMPLETED, DownloadStatus.FAILED, DownloadStatus.CANCELLED)
+
+
+@dataclass
+class StatusEvent:
+    """An item's status change, captured when it happened."""
+    item: DownloadItem
+    status: DownloadStatus
+    error: str = ""
+
+
+class AsyncDownloadService:
+    """asyncio engine over a DownloadService.
+
+    The wrapped service keeps the queue, journal, scheduler, retries and
+    bandwidth limit; this class replaces its worker threads with
+    worker tasks (``max_concurrent``, or up to ``MAX_CONCURRENT_DOWNLOADS``
+    with adaptive concurrency). Each claimed item runs on the
+    download executor, whose threads are created on demand.
+
+    Must be used from one event loop. It registers the service's
+    callbacks, so don't call ``service.set_callbacks`` yourself.
+
+    Example::
+
+        async with AsyncDownloadService(settings) as engine:
+            info = await engine.get_video_info(url)
+            item = await engine.download(DownloadItem(video_info=info))
+    """
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        journal: Optional[QueueJournal] = None,
+        metadata_store: Optional[MetadataStore] = None,
+        service: Optional[DownloadService] = None,
+    ):
+        """
+        Args:
+            settings: Application settings.
+            journal: Optional queue journal for crash-safe persistence.
+            metadata_store: Optional on-disk VideoInfo cache.
+            service: Existing DownloadService to drive (default: a new one).
+        """
+        self._settings = settings
+        self._service = service or DownloadService(
+            settings, journal=journal, metadata_store=metadata_store,
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._download_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_size = 0
+        # Queue mutations journal to disk; one thread keeps them in order
+        self._control_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="AsyncQueueOps",
+        )
+        self._workers: Set[asyncio.Task] = set()
+        self._wake: Optional[asyncio.Event] = None
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._waiters: Dict[str, List[asyncio.Future]] = {}  # url -> download() futures
+
+        self._service.set_callbacks(
+            on_complete=lambda item: self._emit(StatusEvent(item, DownloadStatus.COMPLETED)),
+            on_error=lambda item, error: self._emit(
+                StatusEvent(item, DownloadStatus.FAILED, error)),
+            on_status_changed=lambda item: self._emit(
+                StatusEvent(item, item.status, item.error_message)),
+            on_queue_delta=self._on_queue_delta,
+        )
+
+    # ========================================================
+    # Properties
+    # ========================================================
+
+    @property
+    def service(self) -> DownloadService:
+        """The wrapped service (read-only queries: queue, counts, stats)."""
+        return self._service
+
+    @property
+    def is_running(self) -> bool:
+        return bool(self._workers)
+
+    async def __aenter__(self) -> "AsyncDownloadService":
+        self._bind_loop()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    # ========================================================
+    # Metadata
+    # ========================================================
+
+    async def get_video_info(self, url: str) -> VideoInfo:
+        """Resolve a URL on the service's metadata pool (cache-aware)."""
+        self._bind_loop()
+        return await asyncio.wrap_future(self._service.fetch_video_info(url))
+
+    async def fetch_video_infos(self, urls: Iterable[str]) -> AsyncIterator[FetchResult]:
+        """Resolve many URLs, yielding ``(url, info, error)`` as each completes."""
+        self._bind_loop()
+
+        async def resolve(url: str) -> FetchResult:
+            try:
+                return url, await asyncio.wrap_future(self._service.fetch_video_info(url)), None
+            except Exception as e:
+                return url, None, e
+
+        for next_done in asyncio.as_completed([resolve(url) for url in dict.fromkeys(urls)]):
+            yield await next_done
+
+    # ========================================================
+    # Queue Operations
+    # ========================================================
+
+    async def add(self, item: DownloadItem) -> bool:
+        """Add an item to the queue. Returns False for a duplicate URL."""
+        return bool(await self.add_many([item]))
+
+    async def add_many(self, items: Iterable[DownloadItem]) -> List[DownloadItem]:
+        """Add several items (one lock acquisition, one change event)."""
+        return await self._control(self._service.add_many, list(items))
+
+    async def remove_many(self, items: Iterable[DownloadItem]) -> List[DownloadItem]:
+        """Remove several items; ``download()`` calls waiting on them return."""
+        return await self._control(self._service.remove_many, list(items))
+
+    async def update_many(self, items: Iterable[DownloadItem], **changes: Any) -> List[DownloadItem]:
+        """Change quality/priority/bandwidth weight of several items."""
+        return await self._control(lambda: self._service.update_many(list(items), **changes))
+
+    async def retry_failed(self) -> int:
+        """Reset all FAILED items to PENDING (workers pick them up)."""
+        return await self._control(self._service.retry_failed)
+
+    async def cancel_item(self, item: DownloadItem) -> bool:
+        return await self._control(self._service.cancel_item, item)
+
+    async def pause_item(self, item: DownloadItem) -> bool:
+        return await self._control(self._service.pause_item, item)
+
+    async def resume_item(self, item: DownloadItem) -> bool:
+        return await self._control(self._service.resume_item, item)
+
+    # ========================================================
+    # Running
+    # ========================================================
+
+    def start(self) -> None:
+        """Start worker tasks (or top them up to the pool size).
+
+        Workers exit once the queue is drained; call again after adding
+        more work, or use ``download()`` which starts them as needed.
+        """
+        loop = self._bind_loop()
+        new_run, worker_ids, generation = self._service._begin_run()
+        if new_run:
+            self._wake.set()
+        self._size_executor(self._service._max_workers())
+        for worker_id in worker_ids:
+            task = loop.create_task(
+                self._worker(worker_id, generation), name=f"DownloadWorker-{worker_id}",
+            )
+            self._workers.add(task)
+            task.add_done_callback(self._workers.discard)
+        if worker_ids:
+            logger.info(f"Async download started ({len(worker_ids)} worker task(s))")
+
+    async def join(self) -> None:
+        """Wait until the workers have drained the queue."""
+        while self._workers:
+            await asyncio.gather(*list(self._workers), return_exceptions=True)
+
+    async def run(self) -> None:
+        """Process the queue until it is drained.
+
+        Cancelling the task running this cancels every active download.
+        """
+        self.start()
+        try:
+            await self.join()
+        except asyncio.CancelledError:
+            await asyncio.shield(self.cancel())
+            raise
+
+    async def download(self, item: DownloadItem) -> DownloadItem:
+        """Queue an item (if needed) and wait until it is finished.
+
+        Cancelling the awaiting task cancels the item.
+
+        Returns:
+            The queued item — check its status (COMPLETED, FAILED after
+            the last retry, CANCELLED). An item removed from the queue
+            is returned as is.
+        """
+        loop = self._bind_loop()
+        waiter = loop.create_future()
+        self._waiters.setdefault(item.url, []).append(waiter)
+        try:
+            if not await self.add(item):
+                queued = next((i for i in self._service.queue if i.url == item.url), None)
+                if queued is None or queued.status in _FINAL_STATUSES:
+                    return queued or item
+            self.start()
+            return await waiter
+        except asyncio.CancelledError:
+            self._control_executor.submit(self._service.cancel_item, item)
+            raise
+        finally:
+            waiters = self._waiters.get(item.url, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+            if not waiters:
+                self._waiters.pop(item.url, None)
+
+    async def pause(self) -> None:
+        await self._control(self._service.pause)
+
+    async def resume(self) -> None:
+        await self._control(self._service.resume)
+        self._wake_workers()
+
+    async def cancel(self) -> None:
+        """Cancel all downloads; workers exit once their threads unwind."""
+        await self._control(self._service.cancel)
+        self._wake_workers()
+        await self.join()
+
+    async def aclose(self) -> None:
+        """Stop everything, keeping interrupted items resumable (journal)."""
+        await self._control(self._service.shutdown)
+        self._wake_workers()
+        await self.join()
+        if self._download_executor:
+            self._download_executor.shutdown(wait=False)
+        self._control_executor.shutdown(wait=False)
+
+    # ========================================================
+    # Event Streams
+    # ========================================================
+
+    async def events(self) -> AsyncIterator[StatusEvent]:
+        """Status changes of queued items, in order, from subscription on.
+
+        Each iterator has its own buffer; stop iterating to unsubscribe.
+        """
+        self._bind_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers.discard(queue)
+
+    async def progress(
+        self, interval: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[DownloadItem, DownloadProgress]]:
+        """Progress of active downloads, sampled every ``interval`` seconds.
+
+        Pull-based like ``create_progress_sampler``: downloads never hop
+        to the event loop per chunk, and only changed items are yielded.
+        """
+        sampler = self._service.create_progress_sampler()
+        if interval is None:
+            interval = max(10, int(self._settings.progress_interval_ms or 250)) / 1000
+        while True:
+            for item, progress in sampler.poll():
+                yield item, progress
+            await asyncio.sleep(interval)
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _bind_loop(self) -> asyncio.AbstractEventLoop:
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+            self._wake = asyncio.Event()
+        elif self._loop is not loop:
+            raise RuntimeError("AsyncDownloadService is bound to another event loop")
+        return loop
+
+    async def _control(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a (briefly blocking) service call on the queue-ops thread."""
+        loop = self._bind_loop()
+        return await loop.run_in_executor(self._control_executor, func, *args)
+
+    def _size_executor(self, size: int) -> None:
+        """(Re)create the download executor when more workers are needed."""
+        if self._download_executor is not None and self._executor_size >= size:
+            return
+        if self._download_executor is not None:
+            self._download_executor.shutdown(wait=False)  # Running downloads finish
+        self._download_executor = ThreadPoolExecutor(
+            max_workers=size, thread_name_prefix="AsyncDownload",
+        )
+        self._executor_size = size
+
+    async def _worker(self, worker_id: int, generation: int) -> None:
+        """Worker task — claim items and run them on the download executor."""
+        service = self._service
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                self._wake.clear()
+                with service._lock:
+                    item, finished, due = service._poll_work(worker_id, generation)
+                if finished:
+                    break
+                if item is None:
+                    timeout = None if due is None else max(0.0, due - time.monotonic())
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass  # A parked retry is due
+                    continue
+
+                future = loop.run_in_executor(
+                    self._download_executor, service._run_claimed, worker_id, item,
+                )
+                try:
+                    await asyncio.shield(future)
+                except asyncio.CancelledError:
+                    # The thread unwinds at its next progress checkpoint
+                    self._control_executor.submit(service.cancel_item, item)
+                    await asyncio.wait([future])
+                    raise
+                finally:
+                    if item.status in _FINAL_STATUSES:
+                        self._resolve(item)
+                    self._wake.set()  # Idle peers re-check the drain condition
+        finally:
+            service._on_worker_finished(generation)
+
+    def _wake_workers(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    def _post(self, callback: Callable[..., None], *args: Any) -> None:
+        """Run a callback on the engine's loop (from any thread)."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(callback, *args)
+        except RuntimeError:
+            pass  # Loop closed meanwhile
+
+    def _emit(self, event: StatusEvent) -> None:
+        """Service callback (any thread)."""
+        self._post(self._publish, event)
+
+    def _on_queue_delta(self, change: QueueChange) -> None:
+        """Service callback (any thread)."""
+        self._post(self._apply_delta, change)
+
+    def _publish(self, event: StatusEvent) -> None:
+        self._wake.set()  # Resumed or re-queued items are claimable
+        for queue in self._subscribers:
+            queue.put_nowait(event)
+        # Finished outside a worker (cancelled while queued, post-processed);
+        # items a worker still holds are settled by that worker
+        item = event.item
+        if item.status in _FINAL_STATUSES and self._service.get_control(item) is None:
+            self._resolve(item)
+
+    def _apply_delta(self, change: QueueChange) -> None:
+        self._wake.set()  # New or re-queued items are claimable
+        for item in change.removed:
+            self._resolve(item)
+
+    def _resolve(self, item: DownloadItem) -> None:
+        """Finish the ``download()`` calls waiting on an item (loop thread)."""
+        for waiter in self._waiters.pop(item.url, []):
+            if not waiter.done():
+                waiter.set_result(item)
@@ -0,0 +1,239 @@
+"""
+YouTube Downloader Pro — Bandwidth Limiter
+
+Process-wide token bucket shared by all active downloads.
+The rate can be changed live and takes effect within a fraction of a second.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+# Waits shorter than this are below clock resolution — treat the debt as paid
+_MIN_WAIT = 1e-6
+
+
+class TokenBucket:
+    """Classic token bucket that may run into debt.
+
+    Not thread-safe on its own — BandwidthLimiter guards it.
+    """
+
+    def __init__(self, rate: float, burst_seconds: float, now: float):
+        """
+        Args:
+            rate: Refill rate in bytes/second (0 = unlimited).
+            burst_seconds: Capacity expressed as seconds of rate.
+            now: Current clock value.
+        """
+        self._burst_seconds = burst_seconds
+        self.rate = rate
+        self.tokens = self.capacity
+        self._last = now
+
+    @property
+    def capacity(self) -> float:
+        return self.rate * self._burst_seconds
+
+    def set_rate(self, rate: float, now: float) -> None:
+        """Change the refill rate, keeping tokens within the new capacity."""
+        self.refill(now)
+        self.rate = rate
+        self.tokens = min(self.tokens, self.capacity)
+
+    def refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill."""
+        elapsed = max(0.0, now - self._last)
+        self._last = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+
+    def take(self, amount: float) -> None:
+        """Remove tokens (the balance may go negative)."""
+        self.tokens -= amount
+
+    def wait_time(self) -> float:
+        """Seconds until the balance is back to zero."""
+        if self.rate <= 0 or self.tokens >= 0:
+            return 0.0
+        wait = -self.tokens / self.rate
+        return wait if wait > _MIN_WAIT else 0.0
+
+
+class BandwidthLimiter:
+    """Global rate limit with weighted per-download shares.
+
+    Every byte a download receives is charged to the global bucket and
+    to the download's own share bucket. A share's rate is
+    ``rate * weight / total_weight`` of the downloads that are actually
+    transferring, so the aggregate never exceeds the global limit.
+
+    Shares are work-conserving: a registered download that has not
+    received data for ``idle_after`` seconds (paused, post-processing,
+    waiting to retry) drops out of the split until it transfers again,
+    so a lone active download always gets the full rate.
+
+    Consumers sleep in short slices and re-check the rate each time,
+    so ``set_rate()`` applies to in-flight downloads almost immediately.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[int] = None,
+        burst_seconds: float = 1.0,
+        max_sleep: float = 0.2,
+        idle_after: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Args:
+            rate: Global limit in bytes/second (None or 0 = unlimited).
+            burst_seconds: How many seconds of traffic may burst at once.
+            max_sleep: Longest single sleep before re-checking the rate.
+            idle_after: Seconds without data before a share is considered idle.
+            clock: Monotonic clock (injectable for tests).
+            sleep: Sleep function (injectable for tests).
+        """
+        self._lock = threading.Lock()
+        self._clock = clock
+        self._sleep = sleep
+        self._burst_seconds = burst_seconds
+        self._max_sleep = max_sleep
+        self._idle_after = idle_after
+        self._global = TokenBucket(float(rate or 0), burst_seconds, clock())
+        self._weights: Dict[Hashable, float] = {}
+        self._shares: Dict[Hashable, TokenBucket] = {}
+        self._last_active: Dict[Hashable, float] = {}  # Transferring shares only
+
+    # ========================================================
+    # Configuration
+    # ========================================================
+
+    @property
+    def rate(self) -> Optional[int]:
+        """Current global limit in bytes/second (None = unlimited)."""
+        return int(self._global.rate) or None
+
+    def set_rate(self, rate: Optional[int]) -> None:
+        """Change the global limit; in-flight downloads follow within ``max_sleep``."""
+        with self._lock:
+            now = self._clock()
+            self._global.set_rate(float(rate or 0), now)
+            self._rebalance(now)
+        logger.info(f"Bandwidth limit: {rate or 'unlimited'}")
+
+    def register(self, key: Hashable, weight: float = 1.0) -> None:
+        """Add a download that draws from the bucket."""
+        with self._lock:
+            now = self._clock()
+            self._weights[key] = max(weight, 0.01)
+            self._shares[key] = TokenBucket(0.0, self._burst_seconds, now)
+            self._last_active[key] = now  # About to transfer
+            self._rebalance(now)
+
+    def unregister(self, key: Hashable) -> None:
+        """Remove a finished download and give its share to the rest."""
+        with self._lock:
+            self._weights.pop(key, None)
+            self._shares.pop(key, None)
+            self._last_active.pop(key, None)
+            self._rebalance(self._clock())
+
+    def set_weight(self, key: Hashable, weight: float) -> None:
+        """Change the relative share of a registered download."""
+        with self._lock:
+            if key in self._weights:
+                self._weights[key] = max(weight, 0.01)
+                self._rebalance(self._clock())
+
+    def share_rate(self, key: Hashable) -> Optional[float]:
+        """Current bytes/second allotted to a download (None = unlimited)."""
+        with self._lock:
+            share = self._shares.get(key)
+            if share is None or share.rate <= 0:
+                return None
+            return share.rate
+
+    # ========================================================
+    # Consumption
+    # ========================================================
+
+    def consume(
+        self,
+        key: Hashable,
+        amount: int,
+        should_abort: Optional[Callable[[], bool]] = None,
+    ) -> None:
+        """Charge ``amount`` bytes and block until the buckets allow more.
+
+        Args:
+            key: Registered download key (unknown keys only hit the global bucket).
+            amount: Bytes just received.
+            should_abort: Polled between sleeps; return True to stop waiting.
+        """
+        if amount <= 0:
+            return
+
+        with self._lock:
+            if self._global.rate <= 0:
+                return
+            now = self._clock()
+            self._mark_active(key, now)
+            self._global.refill(now)
+            self._global.take(amount)
+            share = self._shares.get(key)
+            if share is not None:
+                share.refill(now)
+                share.take(amount)
+
+        while True:
+            with self._lock:
+                if self._global.rate <= 0:
+                    return
+                now = self._clock()
+                self._mark_active(key, now)
+                self._global.refill(now)
+                wait = self._global.wait_time()
+                share = self._shares.get(key)
+                if share is not None:
+                    share.refill(now)
+                    wait = max(wait, share.wait_time())
+            if wait <= 0:
+                return
+            self._sleep(min(wait, self._max_sleep))
+            if should_abort is not None and should_abort():
+                return
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _mark_active(self, key: Hashable, now: float) -> None:
+        """Refresh a share's activity and expire idle peers (lock held)."""
+        changed = False
+        if key in self._shares:
+            changed = key not in self._last_active
+            self._last_active[key] = now
+        for other, seen in list(self._last_active.items()):
+            if now - seen > self._idle_after:
+                del self._last_active[other]
+                changed = True
+        if changed:
+            self._rebalance(now)
+
+    def _rebalance(self, now: float) -> None:
+        """Split the global rate over the transferring shares (lock held).
+
+        Idle shares are priced as if they were joining, so their first
+        chunk after resuming is charged at a sensible rate.
+        """
+        total = sum(self._weights[key] for key in self._last_active)
+        for key, share in self._shares.items():
+            weight = self._weights[key]
+            divisor = total if key in self._last_active else total + weight
+            share.set_rate(self._global.rate * weight / divisor, now)
@@ -0,0 +1,184 @@
+"""
+YouTube Downloader Pro — Metadata Cache
+
+In-memory cache bounded by an estimate of its size in bytes, with LRU
+eviction and a per-entry TTL (yt-dlp stream URLs expire after a few hours).
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+V = TypeVar("V")
+
+_MISSING: Any = object()
+
+
+def estimate_size(obj: Any) -> int:
+    """Approximate memory footprint of nested dicts/lists/strings (bytes).
+
+    Walks containers and dataclass-like objects once; shared objects are
+    counted once. Good enough for a cache budget, not exact accounting.
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        elif hasattr(current, "__dict__"):
+            stack.append(vars(current))
+    return total
+
+
+class MetadataCache(Generic[V]):
+    """Thread-safe LRU cache with a byte budget and a TTL per entry.
+
+    Supports the dict operations the service needs (``in``, ``[]``,
+    ``len``, ``clear``); expired entries behave as missing.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl: float,
+        size_of: Callable[[Any], int] = estimate_size,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            max_bytes: Total estimated size kept before evicting (LRU first).
+            ttl: Default seconds an entry stays valid.
+            size_of: Size estimator for values (injectable for tests).
+            clock: Monotonic time source (injectable for tests).
+        """
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._size_of = size_of
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (value, size, expires_at); ordered by last use (LRU first)
+        self._entries: "OrderedDict[Hashable, Tuple[V, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    # ========================================================
+    # Properties
+    # ========================================================
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters plus current size."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    # ========================================================
+    # Access
+    # ========================================================
+
+    def get(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        """Return a fresh entry (marking it recently used) or ``default``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] <= self._clock():
+                self._drop(key)
+                self._expirations += 1
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: V, ttl: Optional[float] = None) -> None:
+        """Insert or replace an entry, evicting LRU entries over budget.
+
+        Args:
+            key: Cache key.
+            value: Value to cache.
+            ttl: Seconds until the entry expires (default: the cache TTL).
+        """
+        size = self._size_of(value)
+        expires_at = self._clock() + (self._ttl if ttl is None else ttl)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            if size > self._max_bytes:
+                logger.debug(f"Cache entry too large to keep ({size} bytes): {key}")
+                return
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._evictions += 1
+
+    def pop(self, key: Hashable, default: Optional[V] = None) -> Optional[V]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._drop(key)
+            return entry[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[2] > self._clock()
+
+    def __getitem__(self, key: Hashable) -> V:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: V) -> None:
+        self.put(key, value)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _drop(self, key: Hashable) -> None:
+        """Remove one entry and its size (lock held)."""
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
@@ -0,0 +1,372 @@
+"""
+YouTube Downloader Pro — Adaptive Concurrency
+
+Decides how many downloads may run at once. AIMD: while the aggregate
+throughput of all downloads keeps improving, one more download is
+allowed; on throttling (HTTP 429) or a throughput collapse the limit is
+cut multiplicatively. A circuit breaker stops the whole engine for a
+cool-down when most recent attempts failed, instead of letting every
+queued item burn its retries against a server that is refusing us.
+"""
+
+from __future__ import annotations
+
+import collections
+import enum
+import logging
+import threading
+from typing import Deque, Optional, Tuple
+
+from services.retry import ErrorClass
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+MB = 1024 * 1024
+
+# Relative throughput gain that justifies another download (filters noise)
+_TOLERANCE = 0.05
+# Weight of a new epoch in the throughput average at the current limit
+_EWMA_ALPHA = 0.3
+# Epochs moving less than this say nothing about the network
+_MIN_EPOCH_BYTES = 1 * MB
+
+
+class BreakerState(enum.Enum):
+    """Circuit breaker states."""
+    CLOSED = "closed"  # Normal operation
+    OPEN = "open"  # Cooling down — nothing starts
+    HALF_OPEN = "half_open"  # One probe download decides
+
+
+class CircuitBreaker:
+    """Engine-wide stop when the failure rate spikes.
+
+    Opens when at least ``min_samples`` of the last ``window`` attempts
+    were recorded and ``threshold`` of them failed. After ``cooldown``
+    seconds downloads run one at a time: the first success closes the
+    breaker, a failure re-opens it with twice the cool-down (up to
+    ``max_cooldown``).
+
+    Not thread-safe on its own — ConcurrencyController guards it.
+    """
+
+    def __init__(
+        self,
+        window: int = 10,
+        min_samples: int = 5,
+        threshold: float = 0.6,
+        cooldown: float = 60.0,
+        max_cooldown: float = 600.0,
+    ):
+        self._outcomes: Deque[bool] = collections.deque(maxlen=max(1, window))
+        self._min_samples = max(1, min_samples)
+        self._threshold = threshold
+        self._base_cooldown = cooldown
+        self._max_cooldown = max(cooldown, max_cooldown)
+        self._cooldown = cooldown
+        self.state = BreakerState.CLOSED
+        self.open_until = 0.0
+
+    def state_at(self, now: float) -> BreakerState:
+        """Current state (an elapsed cool-down turns OPEN into HALF_OPEN)."""
+        if self.state == BreakerState.OPEN and now >= self.open_until:
+            self.state = BreakerState.HALF_OPEN
+        return self.state
+
+    def record(self, ok: bool, now: float) -> bool:
+        """Add an attempt outcome.
+
+        Returns:
+            True if this outcome opened the breaker.
+        """
+        if self.state == BreakerState.HALF_OPEN:
+            if ok:
+                self.state = BreakerState.CLOSED
+                self._cooldown = self._base_cooldown
+                self._outcomes.clear()
+                return False
+            self._cooldown = min(self._max_cooldown, self._cooldown * 2)
+            return self._open(now)
+        if self.state == BreakerState.OPEN:
+            return False  # Stragglers from before it opened
+
+        self._outcomes.append(ok)
+        failures = self._outcomes.count(False)
+        if len(self._outcomes) >= self._min_samples and failures >= self._threshold * len(self._outcomes):
+            return self._open(now)
+        return False
+
+    def _open(self, now: float) -> bool:
+        self.state = BreakerState.OPEN
+        self.open_until = now + self._cooldown
+        self._outcomes.clear()
+        return True
+
+
+class ConcurrencyController:
+    """Limit on simultaneously running downloads (AIMD + circuit breaker).
+
+    Throughput is sampled in epochs from the total bytes transferred.
+    Only epochs in which every allowed slot was busy say anything about
+    the limit. The first saturated epoch probes one slot up; an increase
+    is kept going while throughput improves by more than 5 %, then the
+    limit settles and probes again after ``reprobe_epochs`` quiet epochs.
+    Throttling or a throughput drop below ``collapse`` of the average
+    multiplies the limit by ``decrease``.
+
+    With ``adaptive=False`` the limit stays at ``initial`` and the
+    circuit breaker is off. Thread-safe.
+    """
+
+    def __init__(
+        self,
+        initial: int = 1,
+        maximum: int = 8,
+        minimum: int = 1,
+        adaptive: bool = True,
+        epoch: float = 5.0,
+        decrease: float = 0.5,
+        collapse: float = 0.5,
+        reprobe_epochs: int = 12,
+        breaker: Optional[CircuitBreaker] = None,
+    ):
+        """
+        Args:
+            initial: Limit before anything was observed.
+            maximum: Upper bound for the limit.
+            minimum: Lower bound for the limit.
+            adaptive: Tune the limit and use the breaker (False: fixed limit).
+            epoch: Seconds per throughput sample.
+            decrease: Factor applied on throttling or collapse.
+            collapse: Throughput below this fraction of the average is a collapse.
+            reprobe_epochs: Settled epochs before probing one slot up again.
+            breaker: Circuit breaker (default: ``CircuitBreaker()``).
+        """
+        self._minimum = max(1, minimum)
+        self._maximum = max(self._minimum, maximum)
+        self._limit = max(self._minimum, min(initial, self._maximum))
+        self._initial = initial
+        self._adaptive = adaptive
+        self._epoch = epoch
+        self._decrease = decrease
+        self._collapse = collapse
+        self._reprobe_epochs = reprobe_epochs
+        self._breaker = breaker or CircuitBreaker()
+        self._lock = threading.Lock()
+
+        self._epoch_start: Optional[Tuple[float, int]] = None  # (time, total bytes)
+        # Read without the lock by sample_due() on the progress hot path
+        self._next_sample = 0.0 if adaptive else float("inf")
+        self._saturated = True  # Every epoch slot stayed busy so far
+        self._average: Optional[float] = None  # Throughput at the current limit
+        self._probe_from: Optional[float] = None  # Throughput before the last increase
+        self._settled = 0  # Epochs since the limit last changed
+        self._probed = False  # Probed at least once since the start or a decrease
+        self._last_decrease = float("-inf")
+
+    # ========================================================
+    # Properties
+    # ========================================================
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def breaker_state(self) -> BreakerState:
+        return self._breaker.state
+
+    @property
+    def adaptive(self) -> bool:
+        return self._adaptive
+
+    def reset(self, initial: int, adaptive: Optional[bool] = None) -> None:
+        """Start over from a changed ``initial`` / ``adaptive`` setting.
+
+        A no-op when both are unchanged, so a new run keeps what was
+        learned (a throttling server still throttles). The breaker always
+        keeps its state.
+
+        Args:
+            initial: Starting limit.
+            adaptive: Switch tuning on or off (None: unchanged).
+        """
+        if adaptive is None:
+            adaptive = self._adaptive
+        with self._lock:
+            if (initial, adaptive) == (self._initial, self._adaptive):
+                return
+            self._initial = initial
+            self._adaptive = adaptive
+            self._limit = max(self._minimum, min(initial, self._maximum))
+            self._average = self._probe_from = None
+            self._settled = 0
+            self._probed = False
+            self._epoch_start = None
+            self._next_sample = 0.0 if self._adaptive else float("inf")
+
+    def set_maximum(self, maximum: int) -> None:
+        """Change the upper bound (a fixed limit follows it)."""
+        with self._lock:
+            self._maximum = max(self._minimum, maximum)
+            self._limit = self._maximum if not self._adaptive else min(self._limit, self._maximum)
+
+    # ========================================================
+    # Gate
+    # ========================================================
+
+    def allowed(self, now: float, active: int) -> bool:
+        """Whether one more download may start with ``active`` running."""
+        if not self._adaptive:
+            return active < self._limit
+        with self._lock:
+            state = self._breaker.state_at(now)
+            if state == BreakerState.OPEN:
+                return False
+            if state == BreakerState.HALF_OPEN:
+                return active == 0  # One download at a time decides
+            return active < self._limit
+
+    def next_check(self, now: float) -> Optional[float]:
+        """Time a download held back by the gate should ask again.
+
+        Returns:
+            The end of the cool-down or of the throughput epoch (the limit
+            may rise then), or None to wait for a running download.
+        """
+        if not self._adaptive:
+            return None
+        with self._lock:
+            if self._breaker.state_at(now) == BreakerState.OPEN:
+                return self._breaker.open_until
+            if self._epoch_start is not None:
+                return self._next_sample
+            return None
+
+    def sample_due(self, now: float) -> bool:
+        """Cheap check (no lock) whether ``observe`` would act."""
+        return now >= self._next_sample
+
+    # ========================================================
+    # Feedback
+    # ========================================================
+
+    def observe(self, now: float, total_bytes: int, active: int) -> None:
+        """Sample the aggregate throughput (call often; acts once per epoch).
+
+        Args:
+            now: Monotonic clock.
+            total_bytes: Bytes transferred by all downloads so far (monotonic).
+            active: Downloads running right now.
+        """
+        if not self._adaptive:
+            return
+        with self._lock:
+            if self._breaker.state != BreakerState.CLOSED:
+                self._epoch_start = None  # Sample again once closed
+                self._next_sample = now + self._epoch
+                return
+            if self._epoch_start is None:
+                self._start_epoch(now, total_bytes)
+                return
+            self._saturated = self._saturated and active >= self._limit
+            started, start_bytes = self._epoch_start
+            if now - started < self._epoch:
+                return
+            saturated = self._saturated
+            self._start_epoch(now, total_bytes)
+            moved = total_bytes - start_bytes
+            if not saturated or moved < _MIN_EPOCH_BYTES:
+                return  # Fewer downloads than slots: the limit wasn't the constraint
+            self._on_epoch(moved / (now - started), now)
+
+    def record(self, now: float, error_class: Optional[ErrorClass] = None) -> bool:
+        """Feed back the outcome of a download attempt.
+
+        Args:
+            now: Monotonic clock.
+            error_class: Classification of the failure (None on success).
+                Permanent errors are the video's fault and are ignored.
+
+        Returns:
+            True if this outcome opened the circuit breaker.
+        """
+        if not self._adaptive or error_class == ErrorClass.PERMANENT:
+            return False
+        with self._lock:
+            if error_class == ErrorClass.THROTTLED:
+                self._cut(now, "throttled")
+            was_closed = self._breaker.state == BreakerState.CLOSED
+            opened = self._breaker.record(error_class is None, now)
+            if opened:
+                self._reset_epoch()
+                logger.warning(
+                    f"Too many failed downloads — pausing all downloads for "
+                    f"{self._breaker.open_until - now:.0f}s"
+                )
+            elif not was_closed and self._breaker.state == BreakerState.CLOSED:
+                logger.info("Downloads succeeding again — resuming")
+            return opened
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _start_epoch(self, now: float, total_bytes: int) -> None:
+        self._epoch_start = (now, total_bytes)
+        self._saturated = True
+        self._next_sample = now + self._epoch
+
+    def _reset_epoch(self) -> None:
+        """Discard the running sample (lock held)."""
+        self._epoch_start = None
+        self._next_sample = 0.0
+
+    def _on_epoch(self, rate: float, now: float) -> None:
+        """One saturated throughput sample (lock held)."""
+        if self._average is not None and rate < self._collapse * self._average:
+            self._cut(now, f"throughput fell to {rate / MB:.1f} MB/s")
+            return
+
+        if self._probe_from is not None:
+            # Last epoch ran with one more slot than before
+            if rate > self._probe_from * (1 + _TOLERANCE):
+                self._average = rate
+                self._grow(rate)
+            else:
+                # No gain from the extra download: step back and settle
+                self._average, self._probe_from = self._probe_from, None
+                self._limit -= 1
+            return
+
+        self._average = rate if self._average is None else (
+            (1 - _EWMA_ALPHA) * self._average + _EWMA_ALPHA * rate)
+        self._settled += 1
+        if not self._probed or self._settled >= self._reprobe_epochs:
+            self._grow(self._average)
+
+    def _grow(self, rate: float) -> None:
+        """Additive increase (lock held)."""
+        self._probed = True
+        self._settled = 0
+        if self._limit >= self._maximum:
+            self._probe_from = None
+            return
+        self._probe_from = rate
+        self._limit += 1
+        logger.info(f"Concurrency raised to {self._limit} ({rate / MB:.1f} MB/s)")
+
+    def _cut(self, now: float, reason: str) -> None:
+        """Multiplicative decrease, at most once per epoch (lock held)."""
+        if now - self._last_decrease < self._epoch:
+            return  # One wave of 429s is one signal
+        self._last_decrease = now
+        self._probe_from = None
+        self._average = None
+        self._settled = 0
+        self._reset_epoch()
+        self._probed = True  # Wait the re-probe period before growing again
+        limit = max(self._minimum, int(self._limit * self._decrease))
+        if limit < self._limit:
+            logger.warning(f"Concurrency cut to {limit} ({reason})")
+        self._limit = limit
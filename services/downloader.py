@@ -8,20 +8,47 @@ retry logic, duplicate detection, proper postprocessors.
 from __future__ import annotations
 
 import os
+import itertools
 import logging
 import threading
 import shutil
+import time
+from dataclasses import replace
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Callable, Optional, List, Dict, Any, Set
+from typing import Callable, Iterable, Iterator, Optional, List, Dict, Any, Set, Tuple
 
 import yt_dlp
 
 from models import (
     DownloadItem, DownloadStatus, DownloadFormat,
-    DownloadProgress, VideoInfo,
+    DownloadProgress, QueueChange, VideoInfo, format_bytes,
 )
-from config import AppSettings
-from utils.validators import sanitize_filename
+from config import (
+    AppSettings, MAX_CONCURRENT_DOWNLOADS, MAX_CONCURRENT_FRAGMENTS,
+    METADATA_CACHE_MAX_BYTES, METADATA_CACHE_TTL,
+)
+from services.admission import Admission, DiskAdmission, expected_bytes
+from services.bandwidth import BandwidthLimiter
+from services.fetcher import FetchResult, MetadataFetcher, ResultCallback
+from services.cache import MetadataCache
+from services.concurrency import ConcurrencyController
+from services.extraction import ProcessExtractor
+from services.ffmpeg_mux import SinglePassMuxPP, use_single_pass
+from services.formats import audio_postprocessor, format_options, media_path
+from services.fragments import FragmentTuner, fragment_options
+from services.journal import QueueJournal
+from services.metadata_store import MetadataStore, stream_urls_expire_at
+from services.postprocess import DeferringYoutubeDL, PostProcessJob, PostProcessStage
+from services.prefetch import Prefetcher
+from services.partials import (
+    PartialRegistry, cleanup_stale_partials, discard_partials, partial_sizes, verify_partials,
+)
+from services.progress import ProgressSampler, ProgressSlot
+from services.retry import DelayQueue, ErrorClass, backoff_delay, classify_error
+from services.scheduler import QueueScheduler, SchedulingPolicy
+from services.ydl_pool import YoutubeDLPool
+from utils.validators import extract_video_id
 
 logger = logging.getLogger("YouTube Downloader Pro")
 
@@ -30,6 +57,60 @@ ProgressCallback = Callable[[DownloadItem, DownloadProgress], None]
 CompletionCallback = Callable[[DownloadItem], None]
 ErrorCallback = Callable[[DownloadItem, str], None]
 AllCompleteCallback = Callable[[], None]
+QueueDeltaCallback = Callable[[QueueChange], None]
+
+
+class DownloadCancelled(yt_dlp.utils.DownloadCancelled):
+    """Raised from the progress hook when an item's download is cancelled.
+
+    Subclasses yt-dlp's own exception so ``ignoreerrors`` does not swallow it.
+    """
+
+
+class DownloadControl:
+    """Pause/resume/cancel handle for a single download.
+
+    Each active DownloadItem gets its own handle, so one item can be
+    paused or cancelled without affecting the others. The worker thread
+    calls ``checkpoint()`` from the yt-dlp progress hook.
+    """
+
+    def __init__(self):
+        self._resume_event = threading.Event()
+        self._resume_event.set()  # Not paused initially
+        self._cancel_event = threading.Event()
+
+    @property
+    def is_paused(self) -> bool:
+        return not self._resume_event.is_set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def pause(self) -> None:
+        """Block the download at its next checkpoint."""
+        if not self._cancel_event.is_set():
+            self._resume_event.clear()
+
+    def resume(self) -> None:
+        """Let a paused download continue."""
+        self._resume_event.set()
+
+    def cancel(self) -> None:
+        """Abort the download at its next checkpoint (unblocks if paused)."""
+        self._cancel_event.set()
+        self._resume_event.set()
+
+    def checkpoint(self) -> None:
+        """Wait while paused; raise if cancelled.
+
+        Raises:
+            DownloadCancelled: The handle was cancelled.
+        """
+        self._resume_event.wait()
+        if self._cancel_event.is_set():
+            raise DownloadCancelled("Download cancelled by user")
 
 
 def check_ffmpeg() -> bool:
@@ -46,37 +127,140 @@ class DownloadService:
 
     Features:
         - Thread-safe queue management (with Lock)
-        - Real pause/resume (threading.Event)
+        - N concurrent workers (``AppSettings.max_concurrent``; adaptive up to
+          ``MAX_CONCURRENT_DOWNLOADS``)
+        - Real pause/resume, per item (DownloadControl handles)
         - Retry logic (automatic retries on failure)
         - Duplicate URL detection
         - Postprocessor conflict fixed
         - Single extract_info call (no duplicate fetches)
         - Playlist splitting into individual items
+        - Optional crash-safe queue journal (resume on startup)
+        - O(log n) next-item scheduling with pluggable policies
+        - Global live-adjustable bandwidth limit shared by all downloads
+        - Adaptive concurrency (AIMD) with an engine-wide circuit breaker
     """
 
     MAX_RETRIES = 3
-    RETRY_DELAY = 2  # seconds
-
-    def __init__(self, settings: AppSettings):
+    # Reused stream URLs must stay valid this long (ranged requests mid-download)
+    URL_EXPIRY_MARGIN = 1800
+    RETRY_DELAY = 2  # seconds — base of the exponential backoff
+    MAX_RETRY_DELAY = 300  # seconds
+    ADMISSION_RECHECK = 30  # seconds — held items re-check free space at least this often
+
+    # yt-dlp option profiles for metadata calls (pooled, see YoutubeDLPool)
+    _INFO_OPTS: Dict[str, Any] = {
+        "quiet": True,
+        "no_warnings": True,
+        "extract_flat": False,
+        "socket_timeout": 15,
+    }
+    _PLAYLIST_OPTS: Dict[str, Any] = {
+        "quiet": True,
+        "no_warnings": True,
+        "extract_flat": True,
+        "ignoreerrors": True,
+        "socket_timeout": 15,
+    }
+
+    # Statuses that mean "interrupted mid-download" when found in the journal
+    _INTERRUPTED_STATUSES = (
+        DownloadStatus.FETCHING_INFO,
+        DownloadStatus.DOWNLOADING,
+        DownloadStatus.CONVERTING,
+    )
+
+    def __init__(
+        self,
+        settings: AppSettings,
+        journal: Optional[QueueJournal] = None,
+        metadata_store: Optional[MetadataStore] = None,
+        partials: Optional[PartialRegistry] = None,
+    ):
+        """
+        Args:
+            settings: Application settings.
+            journal: Optional queue journal for crash-safe persistence.
+            metadata_store: Optional on-disk VideoInfo cache (survives restarts).
+            partials: Optional record of the partial files downloads created
+                (only these are ever cleaned up).
+        """
         self._settings = settings
+        self._journal = journal
+        self._metadata_store = metadata_store
+        self._partials = partials
         self._queue: List[DownloadItem] = []
         self._lock = threading.Lock()
+        self._work_available = threading.Condition(self._lock)
         self._pause_event = threading.Event()
         self._pause_event.set()  # Not paused initially
         self._cancel_event = threading.Event()
+        self._stopping = False  # shutdown(): interrupted attempts keep their partials
         self._is_running = False
-        self._current_item: Optional[DownloadItem] = None
-        self._worker_thread: Optional[threading.Thread] = None
+        self._active_items: Dict[int, DownloadItem] = {}  # worker id -> item
+        self._controls: Dict[str, DownloadControl] = {}  # url -> handle (active items)
+        self._worker_threads: List[threading.Thread] = []
+        self._active_workers = 0  # Workers of the current run
+        self._generation = 0  # Bumped by start(); stale workers exit
+        self._worker_ids = itertools.count()
         self._url_set: Set[str] = set()  # For duplicate detection
+        self._scheduler = QueueScheduler(self._parse_policy(settings.scheduling_policy))
+        self._delayed = DelayQueue()  # Failed items waiting for their retry time
+        self._last_errors: Dict[str, ErrorClass] = {}  # url -> class of last failure
+        self._bandwidth = BandwidthLimiter(settings.speed_limit)
+        self._progress: Dict[str, ProgressSlot] = {}  # url -> slot (active items)
+        self._ydl_pool = YoutubeDLPool(factory=DeferringYoutubeDL)
+        # FFmpeg work runs here, off the download workers (see _download_item)
+        self._postprocess_stage = PostProcessStage(
+            self._postprocess, workers=settings.postprocess_workers,
+        )
+        self._postprocessing: Set[str] = set()  # urls handed to the stage
+        self._deferred_jobs: Dict[str, PostProcessJob] = {}  # url -> job of a finished download
+        self._admission = DiskAdmission(margin=settings.min_free_space_mb * 1024 * 1024)
+        self._held: Dict[str, DownloadItem] = {}  # Waiting for disk space (parked in _delayed)
+        # Gates claims in _poll_work: AIMD limit (starting at max_concurrent,
+        # up to MAX_CONCURRENT_DOWNLOADS) + circuit breaker
+        self._concurrency = ConcurrencyController(
+            initial=self._start_concurrency(), maximum=self._max_workers(),
+            adaptive=settings.adaptive_concurrency,
+        )
+        self._finished_bytes = 0  # Transferred by downloads no longer active
+        self._fragment_tuner = FragmentTuner(
+            start_fragments=settings.concurrent_fragments,
+            max_fragments=MAX_CONCURRENT_FRAGMENTS,
+            start_chunk=settings.http_chunk_size or FragmentTuner.DEFAULT_CHUNK,
+        )
+        # CPU-heavy extraction off the GIL (optional); the fetcher's threads
+        # then only wait on the worker processes
+        self._extractor: Optional[ProcessExtractor] = (
+            ProcessExtractor(self._INFO_OPTS, settings.metadata_processes)
+            if settings.metadata_processes > 0 else None
+        )
+        self._fetcher = MetadataFetcher(
+            lookup=lambda url: self.get_video_info(url),
+            refresh=lambda url: self._extract_video_info(url),
+            max_workers=settings.metadata_workers,
+        )
+        self._prefetcher = Prefetcher(
+            upcoming=self._upcoming_items,
+            needs_refresh=lambda item: self._reusable_info(item) is None,
+            resolve=self._prefetch_item,
+            depth=settings.prefetch_depth,
+        )
+        self._stats_lock = threading.Lock()
         self._completed_count = 0
         self._failed_count = 0
-        self._video_info_cache: Dict[str, VideoInfo] = {}  # Info cache
+        # url -> VideoInfo; bounded because raw_info holds the full format table
+        self._video_info_cache: MetadataCache[VideoInfo] = MetadataCache(
+            METADATA_CACHE_MAX_BYTES, METADATA_CACHE_TTL
+        )
 
         # Callbacks
         self._on_progress: Optional[ProgressCallback] = None
         self._on_complete: Optional[CompletionCallback] = None
         self._on_error: Optional[ErrorCallback] = None
         self._on_queue_changed: Optional[Callable[[], None]] = None
+        self._on_queue_delta: Optional[QueueDeltaCallback] = None
         self._on_status_changed: Optional[Callable[[DownloadItem], None]] = None
         self._on_all_complete: Optional[AllCompleteCallback] = None
 
@@ -100,7 +284,21 @@ class DownloadService:
 
     @property
     def current_item(self) -> Optional[DownloadItem]:
-        return self._current_item
+        """The first item currently being downloaded, if any."""
+        items = self.active_items
+        return items[0] if items else None
+
+    @property
+    def active_items(self) -> List[DownloadItem]:
+        """Items currently held by a worker (one per busy worker)."""
+        with self._lock:
+            return [self._active_items[k] for k in sorted(self._active_items)]
+
+    @property
+    def worker_count(self) -> int:
+        """Number of worker threads still running."""
+        with self._lock:
+            return self._active_workers
 
     @property
     def queue_count(self) -> int:
@@ -124,6 +322,11 @@ class DownloadService:
     def has_ffmpeg(self) -> bool:
         return check_ffmpeg()
 
+    @property
+    def speed_limit(self) -> Optional[int]:
+        """Global bandwidth limit in bytes/second (None = unlimited)."""
+        return self._bandwidth.rate
+
     # ========================================================
     # Callback Registration
     # ========================================================
@@ -136,14 +339,21 @@ class DownloadService:
         on_queue_changed: Optional[Callable[[], None]] = None,
         on_status_changed: Optional[Callable[[DownloadItem], None]] = None,
         on_all_complete: Optional[AllCompleteCallback] = None,
+        on_queue_delta: Optional[QueueDeltaCallback] = None,
     ) -> None:
-        """Register event callbacks."""
+        """Register event callbacks.
+
+        ``on_queue_changed`` only says "something changed"; ``on_queue_delta``
+        receives a QueueChange describing what did (one per batch operation),
+        so a view can patch itself instead of redrawing the whole queue.
+        """
         self._on_progress = on_progress
         self._on_complete = on_complete
         self._on_error = on_error
         self._on_queue_changed = on_queue_changed
         self._on_status_changed = on_status_changed
         self._on_all_complete = on_all_complete
+        self._on_queue_delta = on_queue_delta
 
     # ========================================================
     # Video Info (with cache)
@@ -152,6 +362,10 @@ class DownloadService:
     def get_video_info(self, url: str) -> VideoInfo:
         """Fetch video metadata (with caching).
 
+        Lookup order: in-memory cache, on-disk metadata store (by video
+        ID; no network call — stream URLs are resolved when the download
+        starts), then a full yt-dlp extraction.
+
         Args:
             url: YouTube URL.
 
@@ -162,23 +376,51 @@ class DownloadService:
             Exception: yt-dlp errors.
         """
         # Check cache first
-        if url in self._video_info_cache:
+        cached = self._video_info_cache.get(url)
+        if cached is not None:
             logger.debug(f"Video info from cache: {url}")
-            return self._video_info_cache[url]
+            return cached
+
+        video_id = extract_video_id(url)
+        if self._metadata_store and video_id:
+            stored = self._metadata_store.load(video_id)
+            if stored is not None:
+                logger.debug(f"Video info from metadata store: {video_id}")
+                stored.url = url
+                self._video_info_cache.put(url, stored)
+                return stored
 
         logger.info(f"Fetching video info: {url}")
-        ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-            "extract_flat": False,
-            "socket_timeout": 15,
-        }
+        return self._extract_video_info(url)
+
+    def fetch_video_info(self, url: str) -> "Future[VideoInfo]":
+        """Resolve a URL on the shared metadata pool (non-blocking).
 
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+        Concurrent requests for the same video share one extraction.
+        """
+        return self._fetcher.submit(url)
+
+    def fetch_video_infos(self, urls: Iterable[str]) -> Iterator[FetchResult]:
+        """Resolve many URLs on the shared pool, yielding (url, info, error) as each completes."""
+        return self._fetcher.fetch_many(urls)
+
+    def fetch_video_infos_async(self, urls: Iterable[str], on_result: ResultCallback) -> None:
+        """Resolve many URLs; ``on_result(url, info, error)`` runs on a pool thread per URL."""
+        self._fetcher.fetch_many_async(urls, on_result)
+
+    def _extract_video_info(self, url: str) -> VideoInfo:
+        """Full extraction (network); refreshes both cache layers."""
+        if self._extractor is not None:
+            video_info = self._extractor.extract(url, [self._settings.subtitle_language])
+        else:
+            with self._ydl_pool.checkout(self._INFO_OPTS) as ydl:
+                info = ydl.extract_info(url, download=False)
             video_info = VideoInfo.from_yt_dlp(url, info)
-            self._video_info_cache[url] = video_info
-            return video_info
+        self._video_info_cache.put(url, video_info)
+        video_id = extract_video_id(url)
+        if self._metadata_store and video_id:
+            self._metadata_store.save(video_id, video_info)
+        return video_info
 
     def get_playlist_items(self, url: str) -> List[VideoInfo]:
         """Fetch metadata for all videos in a playlist.
@@ -189,32 +431,89 @@ class DownloadService:
         Returns:
             List of VideoInfo objects.
         """
-        logger.info(f"Fetching playlist info: {url}")
-        ydl_opts = {
-            "quiet": True,
-            "no_warnings": True,
-            "extract_flat": True,
-            "ignoreerrors": True,
-            "socket_timeout": 15,
-        }
-
-        items = []
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
-            if info and info.get("_type") == "playlist":
-                for entry in info.get("entries", []):
-                    if entry:
-                        entry_url = entry.get("url", "")
-                        if not entry_url.startswith("http"):
-                            entry_url = f"https://www.youtube.com/watch?v={entry.get('id', '')}"
-                        items.append(VideoInfo(
-                            url=entry_url,
-                            title=entry.get("title", "Unknown"),
-                            duration=entry.get("duration", 0) or 0,
-                        ))
+        items = list(self.iter_playlist_entries(url))
         logger.info(f"Playlist: found {len(items)} videos")
         return items
 
+    def iter_playlist_entries(self, url: str) -> Iterator[VideoInfo]:
+        """Yield a playlist's videos as yt-dlp enumerates them.
+
+        Uses ``extract_info(process=False)``, whose ``entries`` is lazy:
+        yt-dlp fetches the next page only when iteration reaches it, so
+        the first entries are available after one page request.
+
+        Args:
+            url: Playlist URL.
+
+        Yields:
+            Flat VideoInfo objects (title, duration; no formats).
+        """
+        logger.info(f"Fetching playlist info: {url}")
+        with self._ydl_pool.checkout(self._PLAYLIST_OPTS) as ydl:
+            info = ydl.extract_info(url, download=False, process=False)
+            if info and info.get("_type") in ("url", "url_transparent"):
+                # e.g. a channel URL resolving to its videos tab
+                info = ydl.extract_info(info["url"], download=False, process=False)
+            if not info or info.get("_type") not in ("playlist", "multi_video"):
+                return
+            for entry in info.get("entries") or []:
+                if not entry:
+                    continue
+                entry_url = entry.get("url", "")
+                if not entry_url.startswith("http"):
+                    entry_url = f"https://www.youtube.com/watch?v={entry.get('id', '')}"
+                yield VideoInfo(
+                    url=entry_url,
+                    title=entry.get("title") or "Unknown",
+                    duration=int(entry.get("duration") or 0),
+                    uploader=entry.get("uploader") or entry.get("channel") or "Unknown",
+                )
+
+    def ingest_playlist(
+        self,
+        url: str,
+        make_item: Callable[[VideoInfo], DownloadItem],
+        on_chunk: Optional[Callable[[int, int], None]] = None,
+        max_chunk: int = 200,
+    ) -> Tuple[int, int]:
+        """Stream a playlist into the queue in growing bulk chunks.
+
+        The first chunk is small so downloads can start on the first
+        entries while the rest is still being enumerated; chunks then
+        double (up to ``max_chunk``) to keep per-insert overhead low.
+
+        Args:
+            url: Playlist URL.
+            make_item: Builds the queue item for an entry.
+            on_chunk: Called after each insert with (added, skipped) so far.
+            max_chunk: Largest number of entries inserted at once.
+
+        Returns:
+            (added, skipped) totals; skipped entries were duplicates.
+        """
+        added = skipped = 0
+        chunk: List[DownloadItem] = []
+        chunk_size = min(10, max_chunk)
+
+        def flush() -> None:
+            nonlocal added, skipped, chunk
+            inserted = len(self.add_many(chunk))
+            added += inserted
+            skipped += len(chunk) - inserted
+            chunk = []
+            if on_chunk:
+                on_chunk(added, skipped)
+
+        for video_info in self.iter_playlist_entries(url):
+            chunk.append(make_item(video_info))
+            if len(chunk) >= chunk_size:
+                flush()
+                chunk_size = min(chunk_size * 2, max_chunk)
+        if chunk:
+            flush()
+        logger.info(f"Playlist ingested: {added} added, {skipped} skipped")
+        return added, skipped
+
     # ========================================================
     # Queue Management
     # ========================================================
@@ -228,19 +527,49 @@ class DownloadService:
         Returns:
             True if added successfully, False if duplicate.
         """
-        with self._lock:
-            # Duplicate detection
-            if item.url in self._url_set:
-                logger.warning(f"Duplicate URL skipped: {item.url}")
-                return False
-            self._queue.append(item)
-            self._url_set.add(item.url)
-
-        logger.info(f"Added to queue: {item.title}")
-        if self._on_queue_changed:
-            self._on_queue_changed()
+        if not self.add_many([item]):
+            logger.warning(f"Duplicate URL skipped: {item.url}")
+            return False
         return True
 
+    def add_many(self, items: Iterable[DownloadItem]) -> List[DownloadItem]:
+        """Add several items with one lock acquisition and one change event.
+
+        Duplicates (already queued, or repeated within ``items``) are skipped.
+
+        Args:
+            items: DownloadItems to add, in queue order.
+
+        Returns:
+            The items actually added.
+        """
+        added: List[DownloadItem] = []
+        with self._lock:
+            for item in items:
+                if item.url in self._url_set:
+                    continue
+                self._queue.append(item)
+                self._url_set.add(item.url)
+                self._scheduler.register(item)
+                if item.status == DownloadStatus.PENDING:
+                    self._scheduler.push(item)
+                if self._journal:
+                    self._journal.record_add(item, flush=False)
+                added.append(item)
+            if added:
+                self._work_available.notify_all()
+                self._prefetcher.wake()
+        if not added:
+            return added
+        self._flush_journal()
+
+        if len(added) == 1:
+            logger.info(f"Added to queue: {added[0].title}")
+        else:
+            logger.info(f"Added {len(added)} item(s) to queue")
+        self._notify_queue(QueueChange(added=added))
+        return added
+
     def remove_from_queue(self, index: int) -> Optional[DownloadItem]:
         """Remove an item from the queue by index.
 
@@ -251,14 +580,88 @@ class DownloadService:
             Removed item or None.
         """
         with self._lock:
-            if 0 <= index < len(self._queue):
-                item = self._queue.pop(index)
-                self._url_set.discard(item.url)
-                logger.info(f"Removed from queue: {item.title}")
-                if self._on_queue_changed:
-                    self._on_queue_changed()
-                return item
-        return None
+            if not 0 <= index < len(self._queue):
+                return None
+            removed, partials = self._remove_locked([self._queue[index]])
+        self._flush_journal()
+        self._discard_partials(partials)
+
+        logger.info(f"Removed from queue: {removed[0].title}")
+        self._notify_queue(QueueChange(removed=removed))
+        return removed[0]
+
+    def remove_many(self, items: Iterable[DownloadItem]) -> List[DownloadItem]:
+        """Remove several items with one lock acquisition and one change event.
+
+        Items are matched by URL; ones no longer queued are ignored.
+        Their partial downloads are deleted.
+
+        Returns:
+            The queued items actually removed.
+        """
+        with self._lock:
+            removed, partials = self._remove_locked(items)
+        if not removed:
+            return removed
+        self._flush_journal()
+        self._discard_partials(partials)
+
+        logger.info(f"Removed {len(removed)} item(s) from queue")
+        self._notify_queue(QueueChange(removed=removed))
+        return removed
+
+    def update_many(
+        self,
+        items: Iterable[DownloadItem],
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None,
+        priority: Optional[int] = None,
+        bandwidth_weight: Optional[float] = None,
+    ) -> List[DownloadItem]:
+        """Change settings of several queued items at once (one change event).
+
+        Quality changes only apply to items that haven't started (PENDING,
+        PAUSED or FAILED); no extraction happens, the download selects the
+        new format from the cached format list. Priority and bandwidth
+        weight apply to any queued item.
+
+        Returns:
+            The items actually updated.
+        """
+        updated: List[DownloadItem] = []
+        editable = (DownloadStatus.PENDING, DownloadStatus.PAUSED, DownloadStatus.FAILED)
+        with self._lock:
+            for item in items:
+                if item.url not in self._url_set:
+                    continue
+                changed = False
+                if item.status in editable:
+                    if quality is not None and item.quality != quality:
+                        item.quality = quality
+                        changed = True
+                    if audio_quality is not None and item.audio_quality != audio_quality:
+                        item.audio_quality = audio_quality
+                        changed = True
+                if priority is not None and item.priority != priority:
+                    self._scheduler.set_priority(item, priority)
+                    changed = True
+                if bandwidth_weight is not None and item.bandwidth_weight != bandwidth_weight:
+                    item.bandwidth_weight = bandwidth_weight
+                    self._bandwidth.set_weight(item.url, bandwidth_weight)
+                    changed = True
+                if not changed:
+                    continue
+                if self._journal:
+                    self._journal.record_add(item, flush=False)  # Replaces the stored item
+                updated.append(item)
+            if updated and priority is not None:
+                self._prefetcher.wake()
+        if not updated:
+            return updated
+        self._flush_journal()
+
+        self._notify_queue(QueueChange(updated=updated))
+        return updated
 
     def clear_queue(self) -> None:
         """Clear the queue (excluding items currently downloading)."""
@@ -267,20 +670,86 @@ class DownloadService:
                 item for item in self._queue
                 if item.status == DownloadStatus.DOWNLOADING
             ]
+            if self._journal:
+                kept_urls = {item.url for item in kept}
+                self._journal.record_remove(
+                    [item.url for item in self._queue if item.url not in kept_urls],
+                    flush=False,
+                )
+            removed = [
+                item for item in self._queue if item.status != DownloadStatus.DOWNLOADING
+            ]
+            partials = self._release_partials(removed)
+            for item in removed:
+                self._prefetcher.forget(item.url)
             self._url_set = {item.url for item in kept}
             self._queue = kept
+            self._scheduler.clear()
+            self._delayed.clear()
+        self._flush_journal()
+        self._discard_partials(partials)
         logger.info("Queue cleared")
-        if self._on_queue_changed:
-            self._on_queue_changed()
+        self._notify_queue(QueueChange(removed=removed))
+
+    def set_item_quality(
+        self,
+        item: DownloadItem,
+        quality: Optional[str] = None,
+        audio_quality: Optional[str] = None,
+    ) -> bool:
+        """Change the quality of a queued item before it starts.
+
+        No extraction happens here: the download selects the new format
+        from the item's cached format list.
+
+        Returns:
+            True if the item was updated (it must not be active or finished).
+        """
+        with self._lock:
+            editable = item.url in self._url_set and item.status in (
+                DownloadStatus.PENDING, DownloadStatus.PAUSED, DownloadStatus.FAILED
+            )
+        if not editable:
+            return False
+        self.update_many([item], quality=quality, audio_quality=audio_quality)
+        return True
 
     def move_in_queue(self, from_idx: int, to_idx: int) -> None:
-        """Move an item within the queue."""
+        """Move an item within the queue.
+
+        The scheduler sees this as an O(log n) order-key change: the item
+        gets a key between its new neighbours.
+        """
         with self._lock:
             if 0 <= from_idx < len(self._queue) and 0 <= to_idx < len(self._queue):
                 item = self._queue.pop(from_idx)
                 self._queue.insert(to_idx, item)
-        if self._on_queue_changed:
-            self._on_queue_changed()
+                self._scheduler.set_order(item, self._order_between(to_idx))
+                self._prefetcher.wake()
+        self._notify_queue(QueueChange(reordered=True))
+
+    def set_priority(self, item: DownloadItem, priority: int) -> None:
+        """Set an item's explicit priority (higher runs first). O(log n)."""
+        self.update_many([item], priority=priority)
+
+    def set_speed_limit(self, limit: Optional[int]) -> None:
+        """Change the global bandwidth limit, including running downloads.
+
+        Args:
+            limit: Bytes/second shared by all downloads (None = unlimited).
+        """
+        self._settings.speed_limit = limit
+        self._bandwidth.set_rate(limit)
+
+    def set_bandwidth_weight(self, item: DownloadItem, weight: float) -> None:
+        """Change an item's relative share of the bandwidth limit."""
+        if not self.update_many([item], bandwidth_weight=weight):
+            item.bandwidth_weight = weight  # Not queued (yet): applies when it is
+
+    def set_scheduling_policy(self, policy: str) -> None:
+        """Switch the scheduling policy (value of ``SchedulingPolicy``)."""
+        with self._lock:
+            self._scheduler.set_policy(self._parse_policy(policy))
 
     def is_duplicate(self, url: str) -> bool:
         """Check if a URL is already in the queue."""
@@ -293,19 +762,24 @@ class DownloadService:
         Returns:
             Number of items retried.
         """
-        count = 0
+        retried: List[DownloadItem] = []
         with self._lock:
             for item in self._queue:
                 if item.status == DownloadStatus.FAILED:
-                    item.status = DownloadStatus.PENDING
                     item.progress = 0.0
                     item.error_message = ""
-                    count += 1
-        if count > 0:
-            logger.info(f"{count} failed download(s) re-queued")
-            if self._on_queue_changed:
-                self._on_queue_changed()
-        return count
+                    item.attempts = 0
+                    self._set_status(item, DownloadStatus.PENDING, notify=False, flush=False)
+                    self._scheduler.push(item)
+                    self._prefetcher.forget(item.url)
+                    retried.append(item)
+            if retried:
+                self._work_available.notify_all()
+        self._flush_journal()
+        if retried:
+            logger.info(f"{len(retried)} failed download(s) re-queued")
+            self._notify_queue(QueueChange(updated=retried))
+        return len(retried)
 
     def remove_completed(self) -> int:
         """Remove all COMPLETED items from the queue.
@@ -313,130 +787,661 @@ class DownloadService:
         Returns:
             Number of items removed.
         """
-        with self._lock:
-            before = len(self._queue)
-            completed_urls = {i.url for i in self._queue if i.status == DownloadStatus.COMPLETED}
-            self._queue = [i for i in self._queue if i.status != DownloadStatus.COMPLETED]
-            self._url_set -= completed_urls
-            removed = before - len(self._queue)
-        if removed > 0:
-            if self._on_queue_changed:
-                self._on_queue_changed()
-        return removed
+        return len(self.remove_many(
+            [i for i in self.queue if i.status == DownloadStatus.COMPLETED]
+        ))
 
     # ========================================================
     # Download Control
     # ========================================================
 
     def start(self) -> None:
-        """Start processing the download queue."""
-        if self._is_running:
-            return
+        """Start processing the download queue.
 
-        self._is_running = True
-        self._cancel_event.clear()
-        self._pause_event.set()
-        self._completed_count = 0
-        self._failed_count = 0
+        Spawns the worker threads (``settings.max_concurrent``, or
+        ``MAX_CONCURRENT_DOWNLOADS`` with adaptive concurrency, where
+        the controller decides how many of them download at once); each
+        one pulls the next PENDING item until the queue is drained. While
+        running, tops the pool back up (e.g. after the setting was raised).
+        """
+        new_run, worker_ids, generation = self._begin_run()
 
-        self._worker_thread = threading.Thread(
-            target=self._process_queue, daemon=True, name="DownloadWorker"
-        )
-        self._worker_thread.start()
-        logger.info("Download started")
+        threads = [
+            threading.Thread(
+                target=self._process_queue, args=(worker_id, generation),
+                daemon=True, name=f"DownloadWorker-{worker_id}",
+            )
+            for worker_id in worker_ids
+        ]
+        if new_run and self._on_progress:
+            threading.Thread(
+                target=self._dispatch_progress, args=(generation,),
+                daemon=True, name="ProgressDispatch",
+            ).start()
+        self._worker_threads = [t for t in self._worker_threads if t.is_alive()] + threads
+        for thread in threads:
+            thread.start()
+        if threads:
+            logger.info(f"Download started ({len(threads)} worker(s))")
 
     def pause(self) -> None:
-        """Pause the current download."""
+        """Pause all active downloads (fan-out over their handles).
+
+        Workers also stop picking up new items until ``resume()``.
+        """
         if self._is_running and self._pause_event.is_set():
             self._pause_event.clear()
-            if self._current_item:
-                self._current_item.status = DownloadStatus.PAUSED
-                if self._on_status_changed:
-                    self._on_status_changed(self._current_item)
+            for item in self.active_items:
+                self.pause_item(item)
             logger.info("Download paused")
 
     def resume(self) -> None:
-        """Resume the paused download."""
+        """Resume all paused downloads."""
         if self._is_running and not self._pause_event.is_set():
             self._pause_event.set()
-            if self._current_item:
-                self._current_item.status = DownloadStatus.DOWNLOADING
-                if self._on_status_changed:
-                    self._on_status_changed(self._current_item)
+            for item in self.active_items:
+                self.resume_item(item)
+            with self._lock:
+                self._work_available.notify_all()
             logger.info("Download resumed")
 
     def cancel(self) -> None:
         """Cancel all downloads."""
         self._cancel_event.set()
         self._pause_event.set()  # Unblock if paused
-        self._is_running = False
+        with self._lock:
+            self._is_running = False
+            self._work_available.notify_all()  # Wake idle workers so they exit
 
-        if self._current_item:
-            self._current_item.status = DownloadStatus.CANCELLED
-            if self._on_status_changed:
-                self._on_status_changed(self._current_item)
+        for item in self.active_items:
+            self.cancel_item(item)
 
         logger.info("Download cancelled")
 
+    def shutdown(self) -> None:
+        """Stop all downloads on application exit, keeping them resumable.
+
+        Unlike ``cancel()``, active items are journaled back as PENDING
+        with their partial files, which are left on disk so the next
+        launch resumes them.
+        """
+        self._stopping = True
+        if self._journal:
+            for item in self.active_items:
+                item.status = DownloadStatus.PENDING
+                self._journal.record_status(item)
+            self._journal.close()
+        self.cancel()
+        self._prefetcher.stop()
+        self._postprocess_stage.stop()
+        self._fetcher.shutdown()
+        if self._extractor is not None:
+            self._extractor.shutdown()
+        self._ydl_pool.close()
+
+    def warm_up(self) -> None:
+        """Pre-create pooled YoutubeDL instances for the metadata profiles.
+
+        Blocking (extractor initialization) — call from a background thread.
+        """
+        self._ydl_pool.warm(self._INFO_OPTS)
+        self._ydl_pool.warm(self._PLAYLIST_OPTS)
+        logger.debug("YoutubeDL pool warmed up")
+
+    def restore_queue(self) -> int:
+        """Rebuild the queue from the journal (no network calls).
+
+        Items interrupted mid-download are reset to PENDING.
+
+        Returns:
+            Number of items restored.
+        """
+        if not self._journal:
+            return 0
+
+        items = self._journal.replay()
+        restored: List[DownloadItem] = []
+        with self._lock:
+            for item in items:
+                if item.url in self._url_set:
+                    continue
+                if item.status in self._INTERRUPTED_STATUSES:
+                    item.status = DownloadStatus.PENDING
+                    item.progress = 0.0
+                self._queue.append(item)
+                self._url_set.add(item.url)
+                self._scheduler.register(item)
+                if item.status == DownloadStatus.PENDING:
+                    self._scheduler.push(item)
+                restored.append(item)
+            self._work_available.notify_all()
+        self._journal.compact()
+
+        if restored:
+            logger.info(f"Restored {len(restored)} queued item(s) from journal")
+            self._notify_queue(QueueChange(added=restored))
+        return len(restored)
+
+    def cleanup_partials(self) -> int:
+        """Delete stale partial downloads this app started.
+
+        Only files in the partial registry are considered (never other
+        programs' files in the output directory). Ones still referenced by
+        a queued item are kept; the rest are removed once older than
+        ``settings.partial_max_age_days``. Blocking — call from a
+        background thread.
+
+        Returns:
+            Number of recorded partial downloads dropped (deleted or already gone).
+        """
+        if self._partials is None:
+            return 0
+        with self._lock:
+            keep = {path for item in self._queue for path in item.partial_files}
+        gone = cleanup_stale_partials(
+            self._partials.paths,
+            self._settings.partial_max_age_days * 86400,
+            keep,
+        )
+        self._partials.forget(gone)
+        return len(gone)
+
+    def create_progress_sampler(self) -> ProgressSampler:
+        """Create a sampler over the active downloads' progress slots.
+
+        Each consumer (UI, API, metrics) should own one and poll it at
+        its own rate, e.g. every ``settings.progress_interval_ms``.
+        """
+        return ProgressSampler(self._active_progress)
+
+    def get_control(self, item: DownloadItem) -> Optional[DownloadControl]:
+        """Return the control handle of an active item (None if not active)."""
+        with self._lock:
+            return self._controls.get(item.url)
+
+    def pause_item(self, item: DownloadItem) -> bool:
+        """Pause a single item.
+
+        An active download blocks at its next progress checkpoint; a
+        PENDING item is held back until resumed.
+
+        Returns:
+            True if the item was paused.
+        """
+        with self._lock:
+            control = self._controls.get(item.url)
+            if control is None and item.status != DownloadStatus.PENDING:
+                return False
+            if control is not None:
+                control.pause()
+            self._scheduler.discard(item)
+            self._delayed.discard(item)
+            self._set_status(item, DownloadStatus.PAUSED, notify=False, flush=False)
+
+        self._flush_journal()
+        if self._on_status_changed:
+            self._on_status_changed(item)
+        logger.info(f"Paused: {item.title}")
+        return True
+
+    def resume_item(self, item: DownloadItem) -> bool:
+        """Resume a single paused item.
+
+        Returns:
+            True if the item was resumed.
+        """
+        with self._lock:
+            if item.status != DownloadStatus.PAUSED:
+                return False
+            control = self._controls.get(item.url)
+            if control is not None:
+                control.resume()
+                self._set_status(item, DownloadStatus.DOWNLOADING, notify=False, flush=False)
+            else:
+                self._set_status(item, DownloadStatus.PENDING, notify=False, flush=False)
+                self._scheduler.push(item)
+                self._work_available.notify()
+
+        self._flush_journal()
+        if self._on_status_changed:
+            self._on_status_changed(item)
+        logger.info(f"Resumed: {item.title}")
+        return True
+
+    def cancel_item(self, item: DownloadItem) -> bool:
+        """Cancel a single item without touching the rest of the queue.
+
+        Returns:
+            True if the item was cancelled.
+        """
+        with self._lock:
+            control = self._controls.get(item.url)
+            if control is None and item.status not in (
+                DownloadStatus.PENDING, DownloadStatus.PAUSED
+            ):
+                return False
+            if control is not None:
+                control.cancel()  # The attempt discards its partials when it unwinds
+            self._scheduler.discard(item)
+            self._delayed.discard(item)
+            partials = [] if control is not None else self._release_partials([item])
+            self._set_status(item, DownloadStatus.CANCELLED, notify=False, flush=False)
+
+        self._flush_journal()
+        self._discard_partials(partials)
+        if self._on_status_changed:
+            self._on_status_changed(item)
+        logger.info(f"Cancelled: {item.title}")
+        return True
+
     # ========================================================
     # Internal Processing
     # ========================================================
 
-    def _process_queue(self) -> None:
-        """Process the queue sequentially (worker thread)."""
-        while self._is_running:
-            # Find next PENDING item
-            item = None
+    def _process_queue(self, worker_id: int = 0, generation: Optional[int] = None) -> None:
+        """Worker loop — pull PENDING items until the queue is drained.
+
+        An idle worker waits for new work while other downloads are still
+        in flight (they may be followed by additions or retries), so the
+        pool does not shrink when the queue is briefly empty.
+
+        Args:
+            worker_id: Unique id of this worker (key into ``_active_items``).
+            generation: Run this worker belongs to (default: the current one).
+        """
+        if generation is None:
+            generation = self._generation
+        try:
+            while True:
+                with self._lock:
+                    item = self._wait_for_work(worker_id, generation)
+                if item is None:
+                    break
+                self._run_claimed(worker_id, item)
+        finally:
+            self._on_worker_finished(generation)
+
+    # The run/claim/execute steps below are shared with AsyncDownloadService,
+    # which drives them from asyncio tasks instead of worker threads.
+
+    def _begin_run(self) -> Tuple[bool, List[int], int]:
+        """Start a run, or top an active one up to ``_max_workers()`` workers.
+
+        Returns:
+            (whether a new run started, ids for the workers to spawn,
+            the run's generation).
+        """
+        target = self._max_workers()
+
+        with self._lock:
+            new_run = not self._is_running
+            if not new_run:
+                spawn = max(0, target - self._active_workers)
+            else:
+                # New run — workers left over from a cancelled run see the
+                # generation change and exit without touching this one
+                self._generation += 1
+                self._active_workers = 0
+                self._is_running = True
+                self._cancel_event.clear()
+                self._pause_event.set()
+                with self._stats_lock:
+                    self._completed_count = 0
+                    self._failed_count = 0
+                spawn = target
+            self._active_workers += spawn
+            self._concurrency.set_maximum(target)
+            if new_run:
+                self._concurrency.reset(self._start_concurrency(), self._settings.adaptive_concurrency)
+            generation = self._generation
+            worker_ids = list(itertools.islice(self._worker_ids, spawn))
+
+        self._prefetcher.start()
+        return new_run, worker_ids, generation
+
+    def _wait_for_work(self, worker_id: int, generation: int) -> Optional[DownloadItem]:
+        """Block until an item can be claimed or the run is over (lock held).
+
+        Returns:
+            The claimed item, or None when this worker should exit.
+        """
+        while True:
+            item, finished, due = self._poll_work(worker_id, generation)
+            if item is not None or finished:
+                return item
+            self._work_available.wait(None if due is None else max(0.0, due - time.monotonic()))
+
+    def _poll_work(
+        self, worker_id: int, generation: int,
+    ) -> Tuple[Optional[DownloadItem], bool, Optional[float]]:
+        """Try to claim an item for a worker without blocking (lock held).
+
+        Returns:
+            (claimed item or None, whether the worker should exit, monotonic
+            time the next parked retry is due — wait at most until then).
+        """
+        if self._generation != generation or self._cancel_event.is_set():
+            return None, True, None
+        if self._pause_event.is_set():
+            self._release_due_retries()
+            now = time.monotonic()
+            self._observe_throughput(now)
+            if self._scheduler and not self._concurrency.allowed(now, len(self._active_items)):
+                # Over the adaptive limit or cooling down: ask again later
+                due = [t for t in (self._delayed.next_due(), self._concurrency.next_check(now))
+                       if t is not None]
+                return None, False, min(due) if due else None
+            item = self._pop_pending()
+            if item is not None:
+                self._active_items[worker_id] = item
+                return item, False, None
+            if not self._active_items and not self._delayed and not self._postprocessing:
+                return None, True, None  # Drained — nothing can add more work
+        return None, False, self._delayed.next_due()
+
+    def _run_claimed(self, worker_id: int, item: DownloadItem) -> None:
+        """Download an item claimed by ``_poll_work`` and release it (blocking)."""
+        self._bandwidth.register(item.url, item.bandwidth_weight)
+        try:
+            self._download_item_with_retry(item)
+        finally:
+            self._bandwidth.unregister(item.url)
             with self._lock:
-                for q_item in self._queue:
-                    if q_item.status == DownloadStatus.PENDING:
-                        item = q_item
-                        break
+                self._active_items.pop(worker_id, None)
+                self._controls.pop(item.url, None)
+                slot = self._progress.pop(item.url, None)
+                if slot is not None:
+                    self._finished_bytes += slot.transferred_bytes
+                self._work_available.notify_all()  # Idle peers re-check
+
+    def _start_concurrency(self) -> int:
+        return max(1, int(self._settings.max_concurrent or 1))
+
+    def _max_workers(self) -> int:
+        """Worker pool size: room for the adaptive limit to grow, else the setting."""
+        start = self._start_concurrency()
+        if self._settings.adaptive_concurrency:
+            return max(start, MAX_CONCURRENT_DOWNLOADS)
+        return start
+
+    def _observe_throughput(self, now: float) -> None:
+        """Feed the aggregate transferred bytes to the concurrency controller (lock held)."""
+        total = self._finished_bytes + sum(slot.transferred_bytes for slot in self._progress.values())
+        self._concurrency.observe(now, total, len(self._active_items))
+
+    def _release_due_retries(self) -> None:
+        """Move parked items whose backoff has elapsed to the scheduler (lock held)."""
+        for item in self._delayed.pop_due(time.monotonic()):
+            if item.status == DownloadStatus.PENDING and item.url in self._url_set:
+                self._scheduler.push(item)
+
+    def _upcoming_items(self, count: int) -> List[DownloadItem]:
+        """The next ``count`` items workers will claim (empty when not running)."""
+        with self._lock:
+            if not self._is_running:
+                return []
+            return [
+                item for item in self._scheduler.peek(count)
+                if item.status == DownloadStatus.PENDING
+            ]
+
+    def _prefetch_item(self, item: DownloadItem) -> None:
+        """Resolve an upcoming item's info and stream URLs (prefetch thread).
+
+        Goes through the shared metadata pool, so it counts against the
+        same concurrency limit and joins a user request for the same video.
+        """
+        info = self._fetcher.submit(item.url, fresh=True).result()
+        if info.url != item.url:  # Joined a request made with another URL form
+            info = replace(info, url=item.url)
+        item.video_info = info
+
+    def _active_progress(self) -> List[Tuple[DownloadItem, ProgressSlot]]:
+        """(item, slot) pairs of the active downloads."""
+        with self._lock:
+            return [
+                (item, self._progress[item.url])
+                for item in self._active_items.values()
+                if item.url in self._progress
+            ]
+
+    def _dispatch_progress(self, generation: int) -> None:
+        """Sample progress and feed ``on_progress`` while a run is active.
 
+        Runs on its own thread, so download workers never call back into
+        consumers from the hot path.
+        """
+        sampler = self.create_progress_sampler()
+        interval = max(10, int(self._settings.progress_interval_ms or 250)) / 1000
+        while True:
+            finished = self._cancel_event.wait(interval) or not (
+                self._is_running and self._generation == generation
+            )
+            on_progress = self._on_progress
+            if on_progress:
+                for item, progress in sampler.poll():
+                    on_progress(item, progress)
+            if finished:
+                return
+
+    def _claim_next_item(self) -> Optional[DownloadItem]:
+        """Atomically take the next scheduled item so no two workers share it.
+
+        Returns:
+            The claimed item, or None if nothing is pending.
+        """
+        with self._lock:
+            return self._pop_pending()
+
+    def _pop_pending(self) -> Optional[DownloadItem]:
+        """Pop the next claimable item from the scheduler (lock held)."""
+        while True:
+            item = self._scheduler.pop()
             if item is None:
-                break  # Queue empty
+                return None
+            if item.status == DownloadStatus.PENDING and item.url in self._url_set:
+                item.status = DownloadStatus.DOWNLOADING
+                control = DownloadControl()
+                self._controls[item.url] = control
+                self._progress[item.url] = ProgressSlot(control)
+                self._prefetcher.forget(item.url)
+                self._prefetcher.wake()  # The look-ahead window moved
+                return item
 
-            if self._cancel_event.is_set():
-                break
+    def _order_between(self, index: int) -> float:
+        """Order key placing an item between its queue neighbours (lock held)."""
+        prev_key = next_key = None
+        if index > 0:
+            self._scheduler.register(self._queue[index - 1])
+            prev_key = self._scheduler.order_of(self._queue[index - 1])
+        if index + 1 < len(self._queue):
+            self._scheduler.register(self._queue[index + 1])
+            next_key = self._scheduler.order_of(self._queue[index + 1])
+        if prev_key is not None and next_key is not None:
+            return (prev_key + next_key) / 2
+        if prev_key is not None:
+            return prev_key + 1.0
+        if next_key is not None:
+            return next_key - 1.0
+        return 0.0
+
+    @staticmethod
+    def _parse_policy(policy: str) -> SchedulingPolicy:
+        """Map a settings value to a SchedulingPolicy (FIFO if unknown)."""
+        try:
+            return SchedulingPolicy(policy)
+        except ValueError:
+            logger.warning(f"Unknown scheduling policy: {policy!r} — using FIFO")
+            return SchedulingPolicy.FIFO
 
-            self._current_item = item
-            self._download_item_with_retry(item)
-            self._current_item = None
+    def _on_worker_finished(self, generation: int) -> None:
+        """Bookkeeping when a worker exits; the last one fires on_all_complete.
+
+        Workers from an earlier run are not counted against the current one.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._active_workers -= 1
+            is_last = self._active_workers == 0
+            if is_last:
+                self._is_running = False
+            self._work_available.notify_all()  # Peers re-check the drain condition
+
+        if not is_last:
+            return
 
-        self._is_running = False
         logger.info(f"Finished: {self._completed_count} downloaded, {self._failed_count} failed")
 
         if self._on_all_complete:
             self._on_all_complete()
 
     def _download_item_with_retry(self, item: DownloadItem) -> None:
-        """Download an item with automatic retry logic.
+        """Run one download attempt; park retryable failures.
+
+        Failures are classified (permanent / throttled / transient).
+        Retryable ones go back to PENDING in the delay queue with an
+        exponential, jittered backoff, so this worker can move on to
+        another item immediately instead of sleeping.
 
         Args:
             item: DownloadItem to download.
         """
-        for attempt in range(1, self.MAX_RETRIES + 1):
-            if self._cancel_event.is_set():
-                return
+        if self._cancel_event.is_set() or self._is_cancelled(item):
+            return
+        if item.attempts:
+            logger.info(f"Retry {item.attempts + 1}/{self.MAX_RETRIES}: {item.title}")
 
-            if attempt > 1:
-                logger.info(f"Retry {attempt}/{self.MAX_RETRIES}: {item.title}")
-                item.progress = 0.0
-                item.status = DownloadStatus.DOWNLOADING
-                if self._on_status_changed:
-                    self._on_status_changed(item)
-                # Wait before retrying
-                import time
-                time.sleep(self.RETRY_DELAY)
+        if not self._admit(item):
+            return
 
+        slot = self._progress.get(item.url)
+        started = time.monotonic()
+        success = False
+        try:
             success = self._download_item(item)
-            if success:
-                self._completed_count += 1
-                return
+        finally:
+            if not (success and item.url in self._deferred_jobs):
+                self._release_space(item)  # Else released once post-processed
+        classified = self._last_errors.pop(item.url, None)
+        error_class = classified or ErrorClass.TRANSIENT
+        cancelled = self._cancel_event.is_set() or self._is_cancelled(item)
+        # A cancel says nothing about the network; only real errors tune fragments
+        if self._settings.adaptive_fragments and slot is not None and (
+            success or (classified is not None and not cancelled)
+        ):
+            self._fragment_tuner.record(
+                item, slot.transferred_bytes, time.monotonic() - started,
+                None if success else classified,
+            )
+        if success or not cancelled:
+            self._concurrency.record(time.monotonic(), None if success else error_class)
+        if success:
+            item.attempts = 0
+            job = self._deferred_jobs.pop(item.url, None)
+            if job is not None:
+                self._hand_off(job)  # Completion is counted by the stage
+            else:
+                with self._stats_lock:
+                    self._completed_count += 1
+            return
+        if self._cancel_event.is_set() or self._is_cancelled(item):
+            return
 
-        # All attempts failed
-        self._failed_count += 1
-        logger.error(f"All {self.MAX_RETRIES} attempts failed: {item.title}")
+        item.attempts += 1
+        if error_class == ErrorClass.PERMANENT or item.attempts >= self.MAX_RETRIES:
+            with self._stats_lock:
+                self._failed_count += 1
+            if error_class == ErrorClass.PERMANENT:
+                logger.error(f"Permanent error, not retrying: {item.title}")
+            else:
+                logger.error(f"All {self.MAX_RETRIES} attempts failed: {item.title}")
+            return
+
+        delay = backoff_delay(item.attempts, error_class, self.RETRY_DELAY, self.MAX_RETRY_DELAY)
+        with self._lock:
+            if item.url not in self._url_set or item.status in (
+                DownloadStatus.CANCELLED, DownloadStatus.PAUSED
+            ):
+                return  # Removed, cancelled or paused meanwhile
+            item.progress = 0.0
+            self._set_status(item, DownloadStatus.PENDING, notify=False, flush=False)
+            self._delayed.push(item, time.monotonic() + delay)
+            self._work_available.notify_all()
+        self._flush_journal()
+        if self._on_status_changed:
+            self._on_status_changed(item)
+        logger.info(
+            f"{error_class.value.capitalize()} error — retry "
+            f"{item.attempts + 1}/{self.MAX_RETRIES} in {delay:.1f}s: {item.title}"
+        )
+
+    def _admit(self, item: DownloadItem) -> bool:
+        """Reserve disk space for a claimed item before it downloads.
+
+        An item that doesn't fit next to the running downloads goes back
+        to PENDING and is parked until a reservation is released (or
+        ``ADMISSION_RECHECK`` passes, for space freed elsewhere). One that
+        wouldn't fit even alone fails.
+
+        Returns:
+            True if the download may start.
+        """
+        output_dir = self._settings.output_dir
+        nbytes = self._expected_bytes(item, output_dir)
+        result = self._admission.reserve(item.url, nbytes, output_dir)
+        if result == Admission.ADMITTED:
+            with self._lock:
+                self._held.pop(item.url, None)
+            return True
+
+        if result == Admission.REJECTED:
+            with self._lock:
+                self._held.pop(item.url, None)
+            item.error_message = f"Not enough disk space: {format_bytes(nbytes)} needed"
+            with self._stats_lock:
+                self._failed_count += 1
+            self._set_status(item, DownloadStatus.FAILED, notify=False)
+            logger.error(f"{item.error_message} — {item.title}")
+            if self._on_error:
+                self._on_error(item, item.error_message)
+            return False
+
+        with self._lock:
+            if item.url not in self._url_set or item.status in (
+                DownloadStatus.CANCELLED, DownloadStatus.PAUSED
+            ):
+                return False  # Removed, cancelled or paused meanwhile
+            self._held[item.url] = item
+            self._set_status(item, DownloadStatus.PENDING, notify=False, flush=False)
+            self._delayed.push(item, time.monotonic() + self.ADMISSION_RECHECK)
+            self._work_available.notify_all()
+        self._flush_journal()
+        if self._on_status_changed:
+            self._on_status_changed(item)
+        logger.info(f"Waiting for disk space ({format_bytes(nbytes)}): {item.title}")
+        return False
+
+    def _expected_bytes(self, item: DownloadItem, output_dir: str) -> int:
+        """Bytes to reserve for an item (see ``services.admission.expected_bytes``)."""
+        if not item.video_info.raw_info.get("formats"):
+            return expected_bytes(item.video_info, partial_files=item.partial_files)
+        opts = self._build_ydl_opts(item, output_dir)
+        with self._ydl_pool.checkout(opts) as ydl:  # The instance the download will reuse
+            return expected_bytes(item.video_info, ydl, item.partial_files)
+
+    def _release_space(self, item: DownloadItem) -> None:
+        """Drop an item's reservation and let held items try again."""
+        if not self._admission.release(item.url):
+            return
+        now = time.monotonic()
+        with self._lock:
+            for url, held in list(self._held.items()):
+                if url not in self._url_set or held.status != DownloadStatus.PENDING:
+                    del self._held[url]
+                elif held in self._delayed:
+                    self._delayed.push(held, now)
+            self._work_available.notify_all()
 
     def _download_item(self, item: DownloadItem) -> bool:
         """Download a single item.
@@ -447,45 +1452,246 @@ class DownloadService:
         Returns:
             True if downloaded successfully.
         """
-        item.status = DownloadStatus.DOWNLOADING
-        if self._on_status_changed:
-            self._on_status_changed(item)
+        self._set_status(item, DownloadStatus.DOWNLOADING)
 
         output_path = self._settings.output_dir
         os.makedirs(output_path, exist_ok=True)
 
+        # Resume what the last attempt (or session) left, if it is still usable
+        if item.partial_files:
+            item.partial_files = verify_partials(item.partial_files)
+            slot = self._progress.get(item.url)
+            if slot is not None:
+                # Already on disk: not charged to the bandwidth limit or the tuners
+                slot.resume_sizes = partial_sizes(item.partial_files)
+
         ydl_opts = self._build_ydl_opts(item, output_path)
+        mux = self._mux_options(item)
+        item.filepath = None  # Set by the hooks as yt-dlp names the output
+        item.media_path = None
+        deferred: List[PostProcessJob] = []
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([item.url])
+            with self._ydl_pool.checkout(ydl_opts) as ydl:
+                # Merge/convert later on the post-processing stage, not on this worker
+                ydl.defer_postprocess = lambda filename, info, files_to_move: deferred.append(
+                    PostProcessJob(item, filename, info, files_to_move, ydl_opts, mux)
+                )
+                try:
+                    self._run_download(ydl, item)
+                finally:
+                    ydl.defer_postprocess = None
+
+            item.partial_files = []
+            if deferred:
+                item.media_path = media_path(deferred[-1].info, ydl_opts)
+                self._deferred_jobs[item.url] = deferred[-1]
+            else:
+                self._finish_item(item)
+            return True
 
-            # Find the downloaded file
-            item.filepath = self._find_downloaded_file(
-                output_path, item.title,
-                "mp4" if item.format == DownloadFormat.VIDEO else "mp3"
-            )
-            item.status = DownloadStatus.COMPLETED
-            item.progress = 100.0
-            item.completed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        except Exception as e:
+            if self._is_cancelled(item) and self._stopping:
+                logger.info(f"Stopped for shutdown, resumable: {item.title}")
+                return False  # Journaled as PENDING; the partials stay for the next launch
+            if self._is_cancelled(item):
+                partials, item.partial_files = item.partial_files, []
+                self._discard_partials(partials)
+                self._set_status(item, DownloadStatus.CANCELLED, notify=False)
+                logger.info(f"Download cancelled: {item.title}")
+                return False
 
-            logger.info(f"Downloaded: {item.title} -> {item.filepath}")
+            error_msg = str(e)
+            error_class = classify_error(e)
+            self._last_errors[item.url] = error_class
+            item.error_message = error_msg
+            self._set_status(item, DownloadStatus.FAILED, notify=False)
+            logger.error(f"Download error ({error_class.value}): {item.title} - {error_msg}")
 
-            if self._on_complete:
-                self._on_complete(item)
+            if self._on_error:
+                self._on_error(item, error_msg)
 
-            return True
+            return False
 
+    def _hand_off(self, job: PostProcessJob) -> None:
+        """Queue a downloaded item for post-processing (blocks while the stage is full)."""
+        item = job.item
+        with self._lock:
+            self._postprocessing.add(item.url)
+        if item.status != DownloadStatus.CONVERTING:
+            self._set_status(item, DownloadStatus.CONVERTING)
+        logger.debug(f"Handed off for post-processing: {item.title}")
+        self._postprocess_stage.submit(job)
+
+    def _postprocess(self, job: PostProcessJob) -> None:
+        """Run a downloaded item's merge and postprocessors (post-processing thread)."""
+        item = job.item
+        try:
+            with self._ydl_pool.checkout(job.opts) as ydl:
+                for pp in job.info.get("__postprocessors") or []:
+                    pp.set_downloader(ydl)  # Bound to the downloading instance
+                if job.mux is not None:
+                    use_single_pass(job.info, SinglePassMuxPP(ydl, **job.mux))
+                info = ydl.post_process(job.filename, job.info, job.files_to_move)
+            item.filepath = info.get("filepath") or item.filepath
+            with self._stats_lock:
+                self._completed_count += 1
+            self._finish_item(item)
         except Exception as e:
             error_msg = str(e)
-            item.status = DownloadStatus.FAILED
             item.error_message = error_msg
-            logger.error(f"Download error: {item.title} - {error_msg}")
-
+            with self._stats_lock:
+                self._failed_count += 1
+            self._set_status(item, DownloadStatus.FAILED, notify=False)
+            logger.error(f"Post-processing error: {item.title} - {error_msg}")
             if self._on_error:
                 self._on_error(item, error_msg)
+        finally:
+            self._release_space(item)
+            with self._lock:
+                self._postprocessing.discard(item.url)
+                self._work_available.notify_all()  # Idle workers re-check the drain condition
+
+    def _finish_item(self, item: DownloadItem) -> None:
+        """Mark a downloaded (and post-processed) item COMPLETED."""
+        if item.filepath is None:
+            logger.warning(f"yt-dlp reported no output file for: {item.title}")
+        item.progress = 100.0
+        # Done with the format table; the finished item no longer pins it in memory
+        item.video_info = replace(item.video_info, raw_info={})
+        item.completed_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._set_status(item, DownloadStatus.COMPLETED, notify=False)
+
+        path = f" ({item.media_path.value})" if item.media_path else ""
+        logger.info(f"Downloaded: {item.title} -> {item.filepath}{path}")
+
+        if self._on_complete:
+            self._on_complete(item)
+
+    def _run_download(self, ydl: Any, item: DownloadItem) -> None:
+        """Download an item, reusing its extracted info when still valid.
+
+        ``get_video_info`` already ran the extraction; feeding that info
+        dict to ``process_ie_result`` skips a second page/player request.
+        Format selection runs against the download options, so a changed
+        quality is reselected from the cached format list. Falls back to
+        a full ``download()`` (re-extraction) when the stream URLs have
+        expired or the reused info fails, as yt-dlp's own
+        ``download_with_info_file`` does.
+        """
+        info = self._reusable_info(item)
+        if info is None:
+            ydl.download([item.url])
+            return
 
-            return False
+        logger.debug(f"Reusing extracted info: {item.title}")
+        try:
+            ydl.process_ie_result(ydl.sanitize_info(info, remove_private_keys=True), download=True)
+            return
+        except (yt_dlp.utils.DownloadError, yt_dlp.utils.ReExtractInfo) as e:
+            if self._is_cancelled(item):
+                raise
+            logger.warning(f"Reused info failed ({e}); re-extracting: {item.title}")
+        self._video_info_cache.pop(item.url)
+        ydl.download([item.url])
+
+    def _reusable_info(self, item: DownloadItem) -> Optional[Dict[str, Any]]:
+        """The item's cached info dict if its stream URLs are still usable."""
+        info = item.video_info.raw_info
+        if not info or info.get("_type", "video") != "video" or not info.get("formats"):
+            return None
+        expire_at = stream_urls_expire_at(info)
+        if expire_at is None:
+            # No expiry in the URLs — trust them only while the cache entry lives
+            return info if item.url in self._video_info_cache else None
+        if expire_at - time.time() < self.URL_EXPIRY_MARGIN:
+            return None  # Expired or about to (0.0 = no URLs at all)
+        return info
+
+    def _set_status(
+        self, item: DownloadItem, status: DownloadStatus,
+        notify: bool = True, flush: bool = True,
+    ) -> None:
+        """Change an item's status, journal it, and optionally notify the UI.
+
+        Args:
+            item: Item to update.
+            status: New status.
+            notify: Fire ``on_status_changed`` (keep False while holding ``_lock``).
+            flush: Write the journal record now (keep False while holding
+                ``_lock`` and call ``_flush_journal()`` after releasing it).
+        """
+        item.status = status
+        if self._journal:
+            self._journal.record_status(item, flush=flush)
+        if notify and self._on_status_changed:
+            self._on_status_changed(item)
+
+    def _remove_locked(
+        self, items: Iterable[DownloadItem],
+    ) -> Tuple[List[DownloadItem], List[str]]:
+        """Drop items from the queue in one O(n) pass (lock held).
+
+        Returns:
+            (removed queued items, their partial files to discard after
+            releasing the lock).
+        """
+        urls = {item.url for item in items} & self._url_set
+        if not urls:
+            return [], []
+        removed = [item for item in self._queue if item.url in urls]
+        self._queue = [item for item in self._queue if item.url not in urls]
+        self._url_set -= urls
+        for item in removed:
+            self._scheduler.forget(item)
+            self._delayed.discard(item)
+            self._prefetcher.forget(item.url)
+        if self._journal:
+            self._journal.record_remove(list(urls), flush=False)
+        return removed, self._release_partials(removed)
+
+    def _notify_queue(self, change: QueueChange) -> None:
+        """Emit one queue-change event (call without ``_lock``)."""
+        if self._on_queue_delta:
+            self._on_queue_delta(change)
+        if self._on_queue_changed:
+            self._on_queue_changed()
+
+    def _track_partial(self, item: DownloadItem, tmpfilename: str) -> None:
+        """Remember a new partial file so a retry or restart can resume it."""
+        item.partial_files = item.partial_files + [tmpfilename]
+        if self._partials is not None:
+            self._partials.add(tmpfilename)
+        if self._journal:
+            self._journal.record_status(item)
+
+    def _release_partials(self, items: List[DownloadItem]) -> List[str]:
+        """Detach the partial files of items leaving the queue (lock held).
+
+        Delete the returned paths with ``_discard_partials`` after
+        releasing the lock.
+        """
+        partials: List[str] = []
+        for item in items:
+            partials.extend(item.partial_files)
+            item.partial_files = []
+        return partials
+
+    def _discard_partials(self, paths: List[str]) -> None:
+        """Delete partial files (call without ``_lock``) and drop them from the registry."""
+        discard_partials(paths)
+        if self._partials is not None and paths:
+            self._partials.forget(paths)
+
+    def _flush_journal(self) -> None:
+        """Write buffered journal records to disk (call without ``_lock``)."""
+        if self._journal:
+            self._journal.flush()
+
+    def _is_cancelled(self, item: DownloadItem) -> bool:
+        """True if the item's own handle has been cancelled."""
+        control = self.get_control(item)
+        return control is not None and control.is_cancelled
 
     def _build_ydl_opts(self, item: DownloadItem, output_path: str) -> Dict[str, Any]:
         """Build yt-dlp options (postprocessor conflict fixed).
@@ -500,144 +1706,143 @@ class DownloadService:
         ydl_opts: Dict[str, Any] = {
             "outtmpl": os.path.join(output_path, "%(title)s.%(ext)s"),
             "progress_hooks": [lambda d: self._progress_hook(d, item)],
+            "postprocessor_hooks": [lambda d: self._postprocessor_hook(d, item)],
+            "post_hooks": [lambda path: self._post_hook(path, item)],
             "quiet": True,
             "no_warnings": True,
             "noplaylist": True,
-            "ignoreerrors": True,
+            "ignoreerrors": False,  # Errors must surface to be classified and retried
+            "continuedl": True,  # Resume .part files with Range requests / .ytdl fragment state
             "socket_timeout": 30,
             "retries": 5,
             "fragment_retries": 5,
             "extractor_retries": 3,
         }
 
+        # Parallel DASH/HLS fragments and ranged HTTP chunks
+        if self._settings.adaptive_fragments:
+            ydl_opts.update(self._fragment_tuner.options_for(item))
+        else:
+            ydl_opts.update(fragment_options(
+                self._settings.concurrent_fragments, self._settings.http_chunk_size
+            ))
+
         # Build postprocessor list properly (no conflicts!)
         postprocessors: List[Dict[str, Any]] = []
 
-        if item.format == DownloadFormat.VIDEO:
-            res = item.quality
-            if res == "best":
-                fmt = "bestvideo[height<=2160]+bestaudio/best"
-            else:
-                height = res.replace("p", "")
-                fmt = f"bestvideo[height<={height}]+bestaudio/best"
-            ydl_opts["format"] = fmt
-            ydl_opts["merge_output_format"] = "mp4"
-        else:
-            ydl_opts["format"] = "bestaudio/best"
-            postprocessors.append({
-                "key": "FFmpegExtractAudio",
-                "preferredcodec": "mp3",
-                "preferredquality": item.audio_quality,
-            })
+        avoid_transcode = self._settings.avoid_transcode
+        ydl_opts.update(format_options(item, avoid_transcode))
+        if item.format == DownloadFormat.AUDIO:
+            postprocessors.append(audio_postprocessor(item, avoid_transcode))
 
         # Subtitle options (video only)
+        single_pass = self._mux_options(item) is not None
         if self._settings.subtitle_enabled and item.format == DownloadFormat.VIDEO:
             ydl_opts["writesubtitles"] = True
             ydl_opts["subtitleslangs"] = [self._settings.subtitle_language]
             ydl_opts["writeautomaticsub"] = True
 
-            if self._settings.embed_subtitles:
+            if self._settings.embed_subtitles and not single_pass:
                 postprocessors.append({
                     "key": "FFmpegEmbedSubtitle",
                     "already_have_subtitle": False,
                 })
 
-        # Metadata embedding
-        postprocessors.append({
-            "key": "FFmpegMetadata",
-            "add_metadata": True,
-        })
-
-        # Speed limit
-        if self._settings.speed_limit:
-            ydl_opts["ratelimit"] = self._settings.speed_limit
+        # Metadata embedding (the single-pass mux tags the file itself)
+        if not single_pass:
+            postprocessors.append({
+                "key": "FFmpegMetadata",
+                "add_metadata": True,
+            })
 
         ydl_opts["postprocessors"] = postprocessors
 
         return ydl_opts
 
+    def _mux_options(self, item: DownloadItem) -> Optional[Dict[str, Any]]:
+        """SinglePassMuxPP arguments for a video, or None for yt-dlp's own chain.
+
+        The chain (merge, FFmpegEmbedSubtitle, FFmpegMetadata) rewrites the
+        whole file once per step; the mux writes it once.
+        """
+        if not self._settings.single_pass_mux or item.format != DownloadFormat.VIDEO:
+            return None
+        return {
+            "embed_subtitles": self._settings.subtitle_enabled and self._settings.embed_subtitles,
+        }
+
     def _progress_hook(self, d: Dict[str, Any], item: DownloadItem) -> None:
-        """Progress callback (thread-safe, with real pause).
+        """Progress callback (hot path — called on every chunk).
+
+        Only overwrites the item's progress slot; consumers sample it
+        (see ``create_progress_sampler``). No allocation or UI dispatch
+        here. With concurrent fragments several yt-dlp threads call
+        this at once; the slot's ``charge()`` keeps the bandwidth
+        accounting exact.
 
         Args:
             d: yt-dlp progress dictionary.
             item: Current download item.
         """
-        # Real pause — blocks the thread
-        self._pause_event.wait()
+        slot = self._progress.get(item.url)
+        if slot is None:
+            return
 
-        if self._cancel_event.is_set():
-            raise Exception("Download cancelled by user")
+        # Real pause — blocks this item's thread only
+        slot.control.checkpoint()
 
         if d["status"] == "downloading":
-            progress = DownloadProgress(
-                status="downloading",
-                filename=d.get("filename", ""),
-            )
+            slot.update(d)
 
-            total = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
-            downloaded = d.get("downloaded_bytes", 0)
+            tmpfilename = d.get("tmpfilename")
+            if tmpfilename and tmpfilename not in item.partial_files:
+                self._track_partial(item, tmpfilename)
 
-            if total > 0:
-                progress.percent = (downloaded / total) * 100
-                progress.total_bytes = total
-            progress.downloaded_bytes = downloaded
-            progress.speed = d.get("speed", 0) or 0
-            progress.eta = d.get("eta", 0) or 0
+            # Global bandwidth limit — charge the bytes received since the last chunk
+            delta = slot.charge(slot.downloaded_bytes, tmpfilename or "")
+            if delta:
+                self._bandwidth.consume(item.url, delta, should_abort=slot.should_abort)
 
-            # Update item state
-            item.progress = progress.percent
-            item.speed = progress.speed
-            item.eta = progress.eta
-
-            if self._on_progress:
-                self._on_progress(item, progress)
+            # Throughput sample for the concurrency limit (once per epoch)
+            now = time.monotonic()
+            if self._concurrency.sample_due(now):
+                with self._lock:
+                    self._observe_throughput(now)
 
         elif d["status"] == "finished":
-            item.status = DownloadStatus.CONVERTING
-            if self._on_status_changed:
-                self._on_status_changed(item)
-
-    def _find_downloaded_file(
-        self, output_path: str, title: str, extension: str
-    ) -> Optional[str]:
-        """Find the downloaded file on disk.
-
-        Args:
-            output_path: Directory path.
-            title: Video title.
-            extension: File extension.
-
-        Returns:
-            File path or None.
+            slot.reset_charge()  # Next file (e.g. audio stream) starts at 0
+            filename = d.get("filename")
+            if filename and item.partial_files:
+                item.partial_files = [p for p in item.partial_files if not p.startswith(filename)]
+            # Provisional: merge/extract-audio/move rename it (see the hooks below)
+            item.filepath = (d.get("info_dict") or {}).get("filepath") or filename or item.filepath
+            self._set_status(item, DownloadStatus.CONVERTING)
+
+    def _postprocessor_hook(self, d: Dict[str, Any], item: DownloadItem) -> None:
+        """Postprocessor callback: follow the output file through renames.
+
+        Each postprocessor starts on the file the previous one produced
+        (merged ``.mp4``, extracted ``.mp3``...). The "finished" event
+        carries a copy of the info dict taken *before* the run, so only
+        "started" is reliable here.
         """
-        safe_title = sanitize_filename(title)
+        if d.get("status") == "started":
+            filepath = (d.get("info_dict") or {}).get("filepath")
+            if filepath:
+                item.filepath = filepath
 
-        # Direct match
-        direct = os.path.join(output_path, f"{safe_title}.{extension}")
-        if os.path.exists(direct):
-            return direct
+    def _post_hook(self, filepath: str, item: DownloadItem) -> None:
+        """Final path of the item, after every postprocessor and the move."""
+        item.filepath = filepath
 
-        # Try with original title
-        original = os.path.join(output_path, f"{title}.{extension}")
-        if os.path.exists(original):
-            return original
-
-        # Find the most recently modified matching file
-        try:
-            files = [
-                os.path.join(output_path, f)
-                for f in os.listdir(output_path)
-                if f.endswith(f".{extension}")
-            ]
-            if files:
-                return max(files, key=os.path.getmtime)
-        except Exception:
-            pass
-
-        return None
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Video info cache hits, misses, evictions and size."""
+        return self._video_info_cache.stats
 
     def clear_cache(self) -> None:
-        """Clear the video info cache."""
+        """Clear the video info cache (memory and on-disk store)."""
+        logger.debug(f"Video info cache cleared (stats: {self._video_info_cache.stats})")
         self._video_info_cache.clear()
-        logger.debug("Video info cache cleared")
+        if self._metadata_store:
+            self._metadata_store.clear()
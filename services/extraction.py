@@ -0,0 +1,154 @@
+"""
+YouTube Downloader Pro — Process-Pool Extraction
+
+Optional backend that runs ``extract_info`` in worker processes. Signature
+deciphering, JSON parsing and format sorting are pure Python and hold the
+GIL; in a separate process they no longer stall progress hooks or the Tk
+main loop, and a batch scales across cores. Workers return trimmed,
+picklable VideoInfo objects.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Dict, Iterable, Optional
+
+from models import VideoInfo
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+# Large info-dict fields nothing downstream reads (formats are re-selected
+# at download time, thumbnails beyond "thumbnail" are unused)
+_DROPPED_KEYS = (
+    "heatmap", "thumbnails", "requested_formats", "requested_downloads",
+    "requested_subtitles", "_format_sort_fields", "storyboards",
+)
+
+# The worker process's YoutubeDL (one per process, created by the initializer)
+_worker_ydl: Any = None
+
+
+def trim_info(info: Dict[str, Any], caption_langs: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+    """Drop bulky fields from a sanitized info dict before pickling it.
+
+    Formats (with their stream URLs) are kept so the download can reuse
+    them. Automatic captions — often hundreds of language/format pairs —
+    are cut to ``caption_langs`` (all of them if None).
+    """
+    trimmed = {key: value for key, value in info.items() if key not in _DROPPED_KEYS}
+    captions = trimmed.get("automatic_captions")
+    if captions and caption_langs is not None:
+        wanted = set(caption_langs)
+        trimmed["automatic_captions"] = {
+            lang: tracks for lang, tracks in captions.items()
+            if lang in wanted or lang.split("-", 1)[0] in wanted
+        }
+    return trimmed
+
+
+def _init_worker(opts: Dict[str, Any]) -> None:
+    """Process initializer: build the YoutubeDL this process reuses."""
+    global _worker_ydl
+    import yt_dlp
+
+    _worker_ydl = yt_dlp.YoutubeDL(dict(opts))
+
+
+def _extract(url: str, caption_langs: Optional[Iterable[str]]) -> VideoInfo:
+    """Worker-side extraction (runs in the child process)."""
+    from yt_dlp.utils import DownloadError
+
+    try:
+        info = _worker_ydl.extract_info(url, download=False)
+    except Exception as e:
+        # yt-dlp errors hold a traceback in exc_info, which can't be pickled
+        # back to the parent; the message is all the retry logic classifies
+        raise DownloadError(str(e)) from None
+    info = _worker_ydl.sanitize_info(info)
+    return VideoInfo.from_yt_dlp(url, trim_info(info, caption_langs))
+
+
+class ProcessExtractor:
+    """Metadata extraction on a pool of worker processes.
+
+    The pool is started on first use with the "spawn" method, so child
+    processes don't inherit the parent's threads or Tk state. A crashed
+    worker breaks the pool; it is rebuilt and the request retried once.
+    """
+
+    def __init__(self, opts: Dict[str, Any], processes: int = 2):
+        """
+        Args:
+            opts: yt-dlp options for extraction (must be picklable — no hooks).
+            processes: Worker process count.
+        """
+        self._opts = dict(opts)
+        self._processes = max(1, processes)
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._closed = False
+
+    @property
+    def processes(self) -> int:
+        return self._processes
+
+    # ========================================================
+    # Extraction
+    # ========================================================
+
+    def submit(self, url: str, caption_langs: Optional[Iterable[str]] = None) -> "Future[VideoInfo]":
+        """Queue an extraction; the future resolves to a trimmed VideoInfo."""
+        langs = list(caption_langs) if caption_langs is not None else None
+        return self._ensure_pool().submit(_extract, url, langs)
+
+    def extract(self, url: str, caption_langs: Optional[Iterable[str]] = None) -> VideoInfo:
+        """Extract one URL, blocking the calling thread (not the GIL) meanwhile.
+
+        Raises:
+            Exception: yt-dlp errors, re-raised from the worker process.
+        """
+        pool = self._ensure_pool()
+        langs = list(caption_langs) if caption_langs is not None else None
+        try:
+            return pool.submit(_extract, url, langs).result()
+        except BrokenProcessPool:
+            logger.warning("Extraction process died; restarting the pool")
+            self._reset_pool(pool)
+            return self.submit(url, langs).result()
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (queued extractions are dropped)."""
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _ensure_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ProcessExtractor is shut down")
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(self._opts,),
+                )
+                logger.info(f"Extraction process pool started ({self._processes} process(es))")
+            return self._pool
+
+    def _reset_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Drop a broken pool (unless another thread already replaced it)."""
+        with self._lock:
+            if self._pool is broken:
+                self._pool = None
+        broken.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,135 @@
+"""
+YouTube Downloader Pro — Metadata Fetch Executor
+
+One bounded pool for every metadata lookup (single URLs, batches, prefetch).
+Concurrent requests for the same video are coalesced into one extraction,
+and batch results are delivered as they complete.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from models import VideoInfo
+from utils.validators import extract_video_id
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+# (url, info, error) — exactly one of info/error is set
+FetchResult = Tuple[str, Optional[VideoInfo], Optional[BaseException]]
+ResultCallback = Callable[[str, Optional[VideoInfo], Optional[BaseException]], None]
+
+
+class MetadataFetcher:
+    """Bounded, coalescing executor for metadata resolution.
+
+    Two kinds of request share the pool:
+        * cached — may be answered from the metadata caches (``lookup``).
+        * fresh — always extracts, for stream URLs (``refresh``).
+    A request joins an in-flight one for the same video ID; a fresh
+    extraction also satisfies cached requests.
+    """
+
+    def __init__(
+        self,
+        lookup: Callable[[str], VideoInfo],
+        refresh: Callable[[str], VideoInfo],
+        max_workers: int = 4,
+    ):
+        """
+        Args:
+            lookup: Cache-aware resolver (e.g. ``DownloadService.get_video_info``).
+            refresh: Resolver that always extracts.
+            max_workers: Maximum concurrent extractions.
+        """
+        self._lookup = lookup
+        self._refresh = refresh
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="MetadataFetch",
+        )
+        self._lock = threading.Lock()
+        self._inflight: Dict[Tuple[str, bool], Future] = {}  # (video key, fresh) -> future
+        self._submitted = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Requests submitted vs. joined to an in-flight request."""
+        with self._lock:
+            return {"submitted": self._submitted, "coalesced": self._coalesced,
+                    "inflight": len(self._inflight)}
+
+    # ========================================================
+    # Submission
+    # ========================================================
+
+    def submit(self, url: str, fresh: bool = False) -> "Future[VideoInfo]":
+        """Resolve one URL on the pool (or join the in-flight request for it).
+
+        Args:
+            url: Video URL.
+            fresh: Bypass the caches (stream URLs must be current).
+
+        Returns:
+            Future resolving to the VideoInfo (``info.url`` is the URL of
+            whichever request started the extraction).
+        """
+        video_key = extract_video_id(url) or url
+        with self._lock:
+            future = self._inflight.get((video_key, True))
+            if future is None and not fresh:
+                future = self._inflight.get((video_key, False))
+            if future is not None:
+                self._coalesced += 1
+                return future
+            resolver = self._refresh if fresh else self._lookup
+            future = self._executor.submit(resolver, url)
+            self._inflight[(video_key, fresh)] = future
+            self._submitted += 1
+        future.add_done_callback(lambda f, k=(video_key, fresh): self._done(k, f))
+        return future
+
+    def fetch_many(self, urls: Iterable[str]) -> Iterator[FetchResult]:
+        """Resolve many URLs, yielding each result as soon as it completes.
+
+        At most ``max_workers`` extractions run at once; the rest wait in
+        the pool's queue.
+        """
+        futures = {self.submit(url): url for url in dict.fromkeys(urls)}
+        for future in as_completed(futures):
+            url = futures[future]
+            error = future.exception()
+            yield url, (None if error else future.result()), error
+
+    def fetch_many_async(self, urls: Iterable[str], on_result: ResultCallback) -> None:
+        """Like ``fetch_many`` but non-blocking: ``on_result`` runs on a pool thread."""
+        for url in dict.fromkeys(urls):
+            self.submit(url).add_done_callback(
+                lambda f, u=url: self._deliver(on_result, u, f)
+            )
+
+    def shutdown(self) -> None:
+        """Drop queued requests; running extractions finish in the background."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _done(self, key: Tuple[str, bool], future: Future) -> None:
+        with self._lock:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+
+    @staticmethod
+    def _deliver(on_result: ResultCallback, url: str, future: Future) -> None:
+        if future.cancelled():
+            return
+        error = future.exception()
+        try:
+            on_result(url, None if error else future.result(), error)
+        except Exception as e:
+            logger.error(f"Metadata result handler error for {url}: {e}")
@@ -0,0 +1,173 @@
+"""
+YouTube Downloader Pro — Single-Pass FFmpeg Mux
+
+yt-dlp finishes a video with subtitles in three FFmpeg runs: the format
+merge, FFmpegEmbedSubtitle and FFmpegMetadata. Each one stream-copies the
+whole file into a new temp file, so a multi-GB download is written three
+times. SinglePassMuxPP does the merge, subtitle muxing and metadata
+tagging in one invocation, straight from the downloaded streams to the
+output file.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any, Dict, List, Tuple
+
+from yt_dlp.postprocessor.common import PostProcessor
+from yt_dlp.postprocessor.ffmpeg import (
+    FFmpegEmbedSubtitlePP, FFmpegMergerPP, FFmpegMetadataPP,
+)
+from yt_dlp.utils import ISO639Utils, prepend_extension, replace_extension
+
+
+class SinglePassMuxPP(FFmpegMetadataPP):
+    """Merge + embed subtitles + add metadata/chapters in one FFmpeg run.
+
+    Takes the place of FFmpegMergerPP in ``info["__postprocessors"]`` (see
+    ``use_single_pass``); FFmpegEmbedSubtitle and FFmpegMetadata must then
+    not be configured. Without formats to merge it remuxes the single
+    download, still only once. All streams are copied, never re-encoded
+    (subtitles are converted to mov_text for mp4, which is tiny).
+    """
+
+    def __init__(self, downloader=None, embed_subtitles: bool = True,
+                 add_metadata: bool = True, add_chapters: bool = True):
+        """
+        Args:
+            downloader: YoutubeDL the postprocessor reports through.
+            embed_subtitles: Mux the downloaded subtitle files (and delete them).
+            add_metadata: Write title/artist/date/... tags.
+            add_chapters: Write chapter markers.
+        """
+        super().__init__(downloader, add_metadata=add_metadata,
+                         add_chapters=add_chapters, add_infojson=False)
+        self._embed_subtitles = embed_subtitles
+
+    @classmethod
+    def pp_key(cls) -> str:
+        return "SinglePassMux"
+
+    @PostProcessor._restrict_to(images=False)
+    def run(self, info):
+        filename = info["filepath"]
+        merge_files: List[str] = list(info.get("__files_to_merge") or [])
+        merging = bool(merge_files)
+        inputs = list(merge_files) if merging else [filename]
+        self._close_last_chapter(info, inputs)
+
+        opts = self._stream_opts(info) if merging else ["-map", "0", "-dn", "-ignore_unknown"]
+        subtitle_files, subtitle_opts = self._subtitle_opts(info, first_input=len(inputs))
+        inputs += subtitle_files
+        opts += subtitle_opts
+
+        metadata_filename = None
+        if self._add_chapters and info.get("chapters"):
+            metadata_filename = replace_extension(filename, "meta")
+            list(self._get_chapter_opts(info["chapters"], metadata_filename))  # Writes the file
+            opts += ["-map_metadata", str(len(inputs))]
+            inputs.append(metadata_filename)
+        if self._add_metadata:
+            for option in self._get_metadata_opts(info):
+                opts += option
+
+        if not (merging or subtitle_files or metadata_filename or self._add_metadata):
+            self.to_screen("Nothing to merge, embed or tag")
+            return [], info
+
+        opts += ["-c", "copy"]
+        if info["ext"] in ("mp4", "mov", "m4a"):
+            opts += ["-c:s", "mov_text"]
+
+        temp_filename = prepend_extension(filename, "temp")
+        self.to_screen(f'Muxing {len(inputs)} input(s) into "{filename}" (single pass)')
+        try:
+            self.run_ffmpeg_multiple_files(inputs, temp_filename, opts)
+        finally:
+            if metadata_filename:
+                self._delete_downloaded_files(metadata_filename)
+        os.replace(temp_filename, filename)
+
+        return merge_files + subtitle_files, info
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _close_last_chapter(self, info: Dict[str, Any], inputs: List[str]) -> None:
+        """Close an open-ended last chapter at the end of the video.
+
+        FFmpegMetadataPP._fixup_chapters probes ``info["filepath"]``,
+        which doesn't exist yet before the merge: use the extracted
+        duration, or probe the longest of the downloaded streams.
+        """
+        chapters = info.get("chapters")
+        if not chapters or chapters[-1].get("end_time"):
+            return
+        duration = info.get("duration")
+        if not duration:
+            duration = max(self._get_real_video_duration(path) for path in inputs)
+        chapters[-1]["end_time"] = duration
+
+    def _stream_opts(self, info: Dict[str, Any]) -> List[str]:
+        """Map one video/audio stream per downloaded format (as FFmpegMergerPP does)."""
+        opts: List[str] = []
+        audio_streams = 0
+        for i, fmt in enumerate(info["requested_formats"]):
+            if fmt.get("acodec") != "none":
+                opts += ["-map", f"{i}:a:0"]
+                if (fmt.get("protocol") or "").startswith("m3u8") \
+                        and self.get_audio_codec(fmt["filepath"]) == "aac":
+                    opts += [f"-bsf:a:{audio_streams}", "aac_adtstoasc"]
+                audio_streams += 1
+            if fmt.get("vcodec") != "none":
+                opts += ["-map", f"{i}:v:0"]
+        return opts
+
+    def _subtitle_opts(self, info: Dict[str, Any], first_input: int) -> Tuple[List[str], List[str]]:
+        """Subtitle files to add as inputs and their map/language options."""
+        subtitles = info.get("requested_subtitles")
+        ext = info["ext"]
+        if not self._embed_subtitles or not subtitles:
+            return [], []
+        if ext not in FFmpegEmbedSubtitlePP.SUPPORTED_EXTS:
+            self.report_warning(f"Subtitles can't be embedded in {ext} files")
+            return [], []
+
+        files: List[str] = []
+        opts: List[str] = []
+        for lang, sub_info in subtitles.items():
+            path = sub_info.get("filepath") or ""
+            if not os.path.exists(path):
+                self.report_warning(f"Skipping embedding {lang} subtitle because the file is missing")
+                continue
+            sub_ext = sub_info.get("ext")
+            if sub_ext == "json" or (ext == "webm" and sub_ext != "vtt"):
+                self.report_warning(f"Can't embed {sub_ext} subtitles in {ext} files")
+                continue
+            n = len(files)
+            opts += ["-map", f"{first_input + n}:0",
+                     f"-metadata:s:s:{n}", f"language={ISO639Utils.short2long(lang) or lang}"]
+            if sub_info.get("name"):
+                opts += [f"-metadata:s:s:{n}", f"title={sub_info['name']}"]
+            files.append(path)
+        return files, opts
+
+
+def use_single_pass(info: Dict[str, Any], mux: SinglePassMuxPP) -> bool:
+    """Put ``mux`` in place of yt-dlp's merger for one download.
+
+    yt-dlp adds FFmpegMergerPP to ``info["__postprocessors"]`` when it
+    downloaded separate video and audio streams; the mux runs there
+    instead (before the configured postprocessors, like the merger).
+
+    Returns:
+        True if a merge was replaced (False: the mux remuxes one file).
+    """
+    pps = info.setdefault("__postprocessors", [])
+    for i, pp in enumerate(pps):
+        if isinstance(pp, FFmpegMergerPP):
+            pps[i] = mux
+            return True
+    pps.append(mux)
+    return False
@@ -0,0 +1,113 @@
+"""
+YouTube Downloader Pro — Format Selection
+
+Builds the yt-dlp format options for an item. The default mode keeps the
+fixed outputs (MP4 video, MP3 audio). The transcode-avoiding mode prefers
+paths FFmpeg only has to copy: a progressive MP4 at the requested
+height, MP4/M4A streams that merge into the MP4 container as they are,
+and the native M4A/Opus audio stream instead of an MP3 re-encode.
+Re-encoding remains the fallback when no such stream exists.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from yt_dlp.postprocessor.ffmpeg import ACODECS, FFmpegExtractAudioPP
+
+from models import DownloadFormat, DownloadItem, MediaPath
+
+# Upper bound for "best" video (as before: no 8K downloads)
+MAX_HEIGHT = 2160
+
+# Audio extensions FFmpegExtractAudio leaves alone for preferredcodec="best"
+NATIVE_AUDIO_EXTS = FFmpegExtractAudioPP.COMMON_AUDIO_EXTS
+
+
+def _height(quality: str) -> int:
+    return MAX_HEIGHT if quality == "best" else int(quality.replace("p", ""))
+
+
+def format_options(item: DownloadItem, avoid_transcode: bool = False) -> Dict[str, Any]:
+    """yt-dlp ``format`` (and related) options for an item.
+
+    Args:
+        item: Download item (format and quality).
+        avoid_transcode: Prefer stream-copy paths (see module docstring).
+
+    Returns:
+        Options to merge into the yt-dlp options.
+    """
+    if item.format == DownloadFormat.AUDIO:
+        if not avoid_transcode:
+            return {"format": "bestaudio/best"}
+        # The bitrate choice caps the native stream instead of setting an encoder
+        return {"format": f"bestaudio[abr<={item.audio_quality}]/bestaudio/best"}
+
+    height = _height(item.quality)
+    if not avoid_transcode:
+        return {
+            "format": f"bestvideo[height<={height}]+bestaudio/best",
+            "merge_output_format": "mp4",
+        }
+    return {
+        # A single MP4 file at exactly the requested height needs no merge
+        "format": (
+            f"best[height={height}][ext=mp4]"
+            f"/bestvideo[height<={height}]+bestaudio/best[height<={height}]/best"
+        ),
+        # Among equal resolutions, streams that fit MP4 as they are (H.264/AV1 + AAC)
+        "format_sort": ["res", "fps", "ext:mp4:m4a"],
+        "merge_output_format": "mp4",
+    }
+
+
+def audio_postprocessor(item: DownloadItem, avoid_transcode: bool = False) -> Dict[str, Any]:
+    """FFmpegExtractAudio settings for an audio item.
+
+    "best" keeps M4A as downloaded and copies other codecs into their own
+    container (Opus -> .opus); only an unknown codec is encoded to MP3.
+    """
+    return {
+        "key": "FFmpegExtractAudio",
+        "preferredcodec": "best" if avoid_transcode else "mp3",
+        "preferredquality": item.audio_quality,
+    }
+
+
+def _audio_codec(info: Dict[str, Any]) -> Optional[str]:
+    codec = (info.get("acodec") or "").split(".", 1)[0].lower()
+    if codec in ("", "none"):
+        return None
+    return "aac" if codec == "mp4a" else codec
+
+
+def media_path(info: Dict[str, Any], ydl_opts: Dict[str, Any]) -> MediaPath:
+    """How a downloaded item becomes its output file.
+
+    Mirrors the decisions FFmpegMergerPP and FFmpegExtractAudio make, from
+    the info dict yt-dlp hands to post-processing.
+
+    Args:
+        info: Info dict of the finished download (selected format fields).
+        ydl_opts: The options it was downloaded with.
+
+    Returns:
+        DIRECT, REMUX or TRANSCODE.
+    """
+    extract = next((pp for pp in ydl_opts.get("postprocessors") or []
+                    if pp.get("key") == "FFmpegExtractAudio"), None)
+    if extract is None:
+        return MediaPath.REMUX if info.get("requested_formats") else MediaPath.DIRECT
+
+    target = extract.get("preferredcodec") or "best"
+    ext = info.get("ext")
+    codec = _audio_codec(info)
+    if target == "best":
+        if ext in NATIVE_AUDIO_EXTS:
+            return MediaPath.DIRECT
+        return MediaPath.REMUX if codec in ACODECS else MediaPath.TRANSCODE
+    if ext == ACODECS.get(target, (target,))[0]:
+        return MediaPath.DIRECT
+    copied = codec == target or (codec == "aac" and target == "m4a")
+    return MediaPath.REMUX if copied else MediaPath.TRANSCODE
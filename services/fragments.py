@@ -0,0 +1,152 @@
+"""
+YouTube Downloader Pro — Fragment Tuning
+
+Chooses ``concurrent_fragment_downloads`` and ``http_chunk_size`` for each
+download. In adaptive mode the values are tuned from the throughput and
+errors observed on previous downloads (hill climbing on fragment
+concurrency, multiplicative chunk-size changes).
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from models import DownloadItem
+from services.retry import ErrorClass
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+MB = 1024 * 1024
+
+# Downloads smaller than this say nothing useful about throughput
+_MIN_SAMPLE_BYTES = 2 * MB
+# Relative change that counts as better/worse (filters noise between videos)
+_TOLERANCE = 0.05
+# Weight of a new sample in the per-setting throughput average
+_EWMA_ALPHA = 0.3
+
+
+def fragment_options(concurrent_fragments: int, http_chunk_size: Optional[int]) -> Dict[str, Any]:
+    """yt-dlp options for a fixed fragment/chunk configuration."""
+    opts: Dict[str, Any] = {"concurrent_fragment_downloads": max(1, int(concurrent_fragments))}
+    if http_chunk_size:
+        opts["http_chunk_size"] = int(http_chunk_size)
+    return opts
+
+
+class FragmentTuner:
+    """Per-item fragment concurrency and chunk size from observed results.
+
+    * Success: the throughput is folded into an average for the
+      concurrency that produced it; concurrency then moves towards the
+      better neighbour (probing one step up when it is unexplored), and
+      the chunk size grows.
+    * Failure: the failed item retries with half the concurrency (and
+      half the chunk size if throttled); the global values follow.
+
+    Thread-safe.
+    """
+
+    DEFAULT_CHUNK = 10 * MB  # Starting chunk size when the setting is off
+
+    def __init__(
+        self,
+        start_fragments: int = 4,
+        max_fragments: int = 16,
+        start_chunk: int = DEFAULT_CHUNK,
+        min_chunk: int = 1 * MB,
+        max_chunk: int = 50 * MB,
+    ):
+        """
+        Args:
+            start_fragments: Concurrency used before anything was observed.
+            max_fragments: Upper bound for concurrency.
+            start_chunk: Chunk size used before anything was observed.
+            min_chunk: Lower bound for the chunk size.
+            max_chunk: Upper bound for the chunk size.
+        """
+        self._max_fragments = max(1, max_fragments)
+        self._min_chunk = min_chunk
+        self._max_chunk = max_chunk
+        self._lock = threading.Lock()
+        self._fragments = max(1, min(start_fragments, self._max_fragments))
+        self._chunk = max(min_chunk, min(start_chunk, max_chunk))
+        self._rates: Dict[int, float] = {}  # concurrency -> average bytes/second
+        self._items: Dict[str, Tuple[int, int]] = {}  # url -> setting for its retry
+
+    # ========================================================
+    # Properties
+    # ========================================================
+
+    @property
+    def fragments(self) -> int:
+        return self._fragments
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk
+
+    # ========================================================
+    # Tuning
+    # ========================================================
+
+    def options_for(self, item: DownloadItem) -> Dict[str, Any]:
+        """yt-dlp options for the next attempt of ``item``."""
+        with self._lock:
+            fragments, chunk = self._items.get(item.url, (self._fragments, self._chunk))
+        return fragment_options(fragments, chunk)
+
+    def record(
+        self,
+        item: DownloadItem,
+        downloaded_bytes: int,
+        seconds: float,
+        error_class: Optional[ErrorClass] = None,
+    ) -> None:
+        """Feed back the outcome of an attempt made with ``options_for(item)``.
+
+        Args:
+            item: The downloaded item.
+            downloaded_bytes: Bytes transferred during the attempt.
+            seconds: Wall time of the attempt.
+            error_class: Classification of the failure (None on success).
+        """
+        with self._lock:
+            fragments, chunk = self._items.pop(item.url, (self._fragments, self._chunk))
+
+            if error_class is not None:
+                if error_class == ErrorClass.PERMANENT:
+                    return  # Not the network's fault
+                fragments = max(1, fragments // 2)
+                if error_class == ErrorClass.THROTTLED:
+                    chunk = max(self._min_chunk, chunk // 2)
+                self._items[item.url] = (fragments, chunk)
+                self._fragments = min(self._fragments, fragments)
+                self._chunk = min(self._chunk, chunk)
+                logger.debug(f"Fragments backed off to {fragments} x {chunk // MB} MB: {item.title}")
+                return
+
+            if seconds <= 0 or downloaded_bytes < _MIN_SAMPLE_BYTES:
+                return
+            rate = downloaded_bytes / seconds
+            previous = self._rates.get(fragments)
+            self._rates[fragments] = rate if previous is None else (
+                (1 - _EWMA_ALPHA) * previous + _EWMA_ALPHA * rate)
+
+            # Only move the global setting on samples taken at it
+            if fragments == self._fragments:
+                self._fragments = self._next_fragments(fragments)
+            self._chunk = min(self._max_chunk, max(self._chunk, chunk * 2))
+
+    def _next_fragments(self, current: int) -> int:
+        """Hill-climbing step from ``current`` (lock held)."""
+        here = self._rates[current]
+        lower = self._rates.get(current - 1)
+        upper = self._rates.get(current + 1)
+        if lower is not None and here < lower * (1 - _TOLERANCE):
+            return current - 1
+        if current < self._max_fragments and (upper is None or upper > here * (1 + _TOLERANCE)):
+            return current + 1
+        return current
@@ -0,0 +1,276 @@
+"""
+YouTube Downloader Pro — Queue Journal
+
+Crash-safe, append-only on-disk journal of the download queue.
+Replayed on startup to rebuild the queue without any network calls.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from config import QUEUE_JOURNAL_FILE
+from models import DownloadItem
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+
+class QueueJournal:
+    """Append-only JSON-lines journal of queue changes.
+
+    Each line is one record:
+        {"op": "add", "item": {...}}
+        {"op": "status", "url": ..., "status": ..., ...}
+        {"op": "remove", "urls": [...]}
+
+    The journal mirrors the live queue in memory and rewrites itself
+    as a compact snapshot once enough records have accumulated.
+
+    Recording only updates the mirror and buffers the line; disk I/O
+    happens in ``flush()`` outside the state lock, so callers holding
+    their own locks can record with ``flush=False`` and flush after
+    releasing them. Concurrent flushes are group-committed: one writer
+    appends everything buffered so far with a single fsync.
+    """
+
+    def __init__(
+        self,
+        journal_file: Optional[Path] = None,
+        compact_threshold: int = 500,
+        fsync: bool = True,
+    ):
+        """
+        Args:
+            journal_file: Path to the journal (default: config.QUEUE_JOURNAL_FILE).
+            compact_threshold: Minimum records before a compaction is considered.
+            fsync: Force every record to disk (survives power loss).
+        """
+        self._journal_file = Path(journal_file or QUEUE_JOURNAL_FILE)
+        self._compact_threshold = compact_threshold
+        self._fsync = fsync
+        self._lock = threading.Lock()  # Guards the mirror and the buffer
+        self._io_lock = threading.Lock()  # Serializes disk writes
+        self._pending: List[str] = []  # Serialized records not yet on disk
+        self._state: Dict[str, Dict[str, Any]] = {}  # url -> item dict (ordered)
+        self._record_count = 0
+        self._file = None
+        self._closed = False
+
+    # ========================================================
+    # Properties
+    # ========================================================
+
+    @property
+    def path(self) -> Path:
+        return self._journal_file
+
+    @property
+    def record_count(self) -> int:
+        """Records appended since the last compaction."""
+        return self._record_count
+
+    # ========================================================
+    # Recording
+    # ========================================================
+
+    def record_add(self, item: DownloadItem, flush: bool = True) -> None:
+        """Record a queue addition.
+
+        Args:
+            item: Item added to the queue.
+            flush: Write to disk now (pass False while holding a lock,
+                then call ``flush()`` after releasing it).
+        """
+        data = item.to_dict()
+        with self._lock:
+            self._state[item.url] = data
+            self._buffer({"op": "add", "item": data})
+        if flush:
+            self.flush()
+
+    def record_status(self, item: DownloadItem, flush: bool = True) -> None:
+        """Record a status transition (with the fields that go with it)."""
+        record = {
+            "op": "status",
+            "url": item.url,
+            "status": item.status.value,
+            "progress": item.progress,
+            "filepath": item.filepath,
+            "error_message": item.error_message,
+            "completed_at": item.completed_at,
+            "attempts": item.attempts,
+            "partial_files": list(item.partial_files),
+        }
+        with self._lock:
+            if item.url not in self._state:
+                return
+            self._apply(record)
+            self._buffer(record)
+        if flush:
+            self.flush()
+
+    def record_remove(self, urls: Iterable[str], flush: bool = True) -> None:
+        """Record removal of one or more queue items."""
+        with self._lock:
+            removed = [url for url in urls if url in self._state]
+            if not removed:
+                return
+            record = {"op": "remove", "urls": removed}
+            self._apply(record)
+            self._buffer(record)
+        if flush:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records to disk (group commit, one fsync).
+
+        Returns once every record buffered before the call is on disk.
+        Never called with ``_lock`` held.
+        """
+        with self._io_lock:
+            with self._lock:
+                if not self._pending or self._closed:
+                    return
+                lines, self._pending = self._pending, []
+                self._record_count += len(lines)
+                snapshot = None
+                if self._record_count >= max(self._compact_threshold, 2 * len(self._state)):
+                    # The snapshot already contains every buffered record
+                    snapshot = self._snapshot_lines()
+                    self._record_count = 0
+            if snapshot is not None:
+                self._write_snapshot(snapshot)
+            else:
+                self._write_lines(lines)
+
+    # ========================================================
+    # Replay / Compaction
+    # ========================================================
+
+    def replay(self) -> List[DownloadItem]:
+        """Rebuild the queue from disk.
+
+        Corrupt or truncated lines (e.g. a crash mid-write) are skipped.
+
+        Returns:
+            Queue items in their original order.
+        """
+        with self._lock:
+            self._state = {}
+            if self._journal_file.exists():
+                skipped = 0
+                with open(self._journal_file, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            self._apply(json.loads(line))
+                        except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                            skipped += 1
+                if skipped:
+                    logger.warning(f"Queue journal: skipped {skipped} corrupt record(s)")
+
+            items = []
+            for data in self._state.values():
+                try:
+                    items.append(DownloadItem.from_dict(data))
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning(f"Queue journal: bad item skipped: {e}")
+
+        logger.info(f"Queue journal replayed: {len(items)} item(s)")
+        return items
+
+    def compact(self) -> None:
+        """Rewrite the journal as a minimal snapshot of the live queue."""
+        with self._io_lock:
+            with self._lock:
+                if self._closed:
+                    return
+                snapshot = self._snapshot_lines()
+                self._pending = []
+                self._record_count = 0
+            self._write_snapshot(snapshot)
+
+    def close(self) -> None:
+        """Flush and close the journal; later records are ignored."""
+        self.flush()
+        with self._io_lock:
+            with self._lock:
+                self._closed = True
+                self._pending = []
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _apply(self, record: Dict[str, Any]) -> None:
+        """Apply one record to the in-memory mirror (lock held)."""
+        op = record["op"]
+        if op == "add":
+            data = record["item"]
+            self._state[data["video_info"]["url"]] = data
+        elif op == "status":
+            data = self._state.get(record["url"])
+            if data is not None:
+                for key in ("status", "progress", "filepath", "error_message",
+                            "completed_at", "attempts", "partial_files"):
+                    if key in record:
+                        data[key] = record[key]
+        elif op == "remove":
+            for url in record["urls"]:
+                self._state.pop(url, None)
+        else:
+            raise ValueError(f"Unknown journal op: {op}")
+
+    def _buffer(self, record: Dict[str, Any]) -> None:
+        """Queue one record for the next flush (lock held)."""
+        if not self._closed:
+            self._pending.append(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def _snapshot_lines(self) -> List[str]:
+        """Serialize the live queue as "add" records (lock held)."""
+        return [
+            json.dumps({"op": "add", "item": data}, ensure_ascii=False) + "\n"
+            for data in self._state.values()
+        ]
+
+    def _write_lines(self, lines: List[str]) -> None:
+        """Append records to disk (io lock held)."""
+        try:
+            if self._file is None:
+                self._journal_file.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self._journal_file, "a", encoding="utf-8")
+            self._file.write("".join(lines))
+            self._file.flush()
+            if self._fsync:
+                os.fsync(self._file.fileno())
+        except OSError as e:
+            logger.error(f"Queue journal write error: {e}")
+
+    def _write_snapshot(self, snapshot: List[str]) -> None:
+        """Write the snapshot to a temp file and atomically swap it in (io lock held)."""
+        tmp_file = self._journal_file.with_suffix(self._journal_file.suffix + ".tmp")
+        try:
+            self._journal_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                f.write("".join(snapshot))
+                f.flush()
+                if self._fsync:
+                    os.fsync(f.fileno())
+
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            os.replace(tmp_file, self._journal_file)
+            logger.debug(f"Queue journal compacted: {len(snapshot)} item(s)")
+        except OSError as e:
+            logger.error(f"Queue journal compaction error: {e}")
@@ -0,0 +1,188 @@
+"""
+YouTube Downloader Pro — Persistent Metadata Store
+
+On-disk VideoInfo cache keyed by YouTube video ID, one small JSON file per
+video. Holds the trimmed VideoInfo fields plus the format table (without
+stream URLs, which expire); re-adding a known video needs no network call.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlparse
+
+from config import METADATA_STORE_DIR
+from models import VideoInfo
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+# Format-table columns worth keeping (quality selection and size estimates)
+_FORMAT_KEYS = (
+    "format_id", "ext", "protocol", "width", "height", "fps", "vcodec", "acodec",
+    "abr", "tbr", "filesize", "filesize_approx", "format_note",
+)
+
+
+def stream_urls_expire_at(info: Dict[str, Any]) -> Optional[float]:
+    """Earliest ``expire`` timestamp among the format URLs of an info dict.
+
+    Returns:
+        Epoch seconds, ``0.0`` if the info has no stream URLs at all
+        (e.g. served from the store), or None if the URLs carry no expiry.
+    """
+    earliest: Optional[float] = None
+    has_url = False
+    for fmt in info.get("formats") or []:
+        for key in ("url", "manifest_url"):
+            url = fmt.get(key)
+            if not url:
+                continue
+            has_url = True
+            parsed = urlparse(url)
+            values = parse_qs(parsed.query).get("expire")
+            if not values and "/expire/" in parsed.path:  # HLS/DASH path-style params
+                values = [parsed.path.split("/expire/", 1)[1].split("/", 1)[0]]
+            try:
+                expire = float(values[0]) if values else None
+            except ValueError:
+                expire = None
+            if expire is not None and (earliest is None or expire < earliest):
+                earliest = expire
+    if not has_url:
+        return 0.0
+    return earliest
+
+
+def trim_formats(formats: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Drop stream URLs, headers and other bulky fields from a format table."""
+    return [
+        {key: fmt[key] for key in _FORMAT_KEYS if fmt.get(key) is not None}
+        for fmt in formats or []
+    ]
+
+
+class MetadataStore:
+    """Persistent per-video metadata (title, duration, uploader, formats...).
+
+    Entries older than ``max_age`` are treated as missing and deleted on
+    ``prune()``. Stream URLs are never stored: an entry served from disk
+    has a format table without URLs, so the download re-resolves them.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_age: float = 7 * 86400):
+        """
+        Args:
+            directory: Store directory (default: config.METADATA_STORE_DIR).
+            max_age: Seconds an entry stays fresh (titles and formats rarely change).
+        """
+        self._directory = Path(directory or METADATA_STORE_DIR)
+        self._max_age = max_age
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    # ========================================================
+    # Access
+    # ========================================================
+
+    def load(self, video_id: str, now: Optional[float] = None) -> Optional[VideoInfo]:
+        """Return the stored VideoInfo for a video ID, or None if missing/stale.
+
+        Args:
+            video_id: YouTube video ID (``utils.validators.extract_video_id``).
+            now: Current time (injectable for tests).
+        """
+        path = self._path(video_id)
+        if path is None:
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = json.load(f)
+            saved_at = float(record["saved_at"])
+            info = VideoInfo.from_dict(record["info"])
+            formats = record.get("formats", [])
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.debug(f"Unreadable metadata entry {video_id}: {e}")
+            return None
+
+        if (now if now is not None else time.time()) - saved_at > self._max_age:
+            return None
+        info.raw_info = {"id": video_id, "formats": formats, "_stored_at": saved_at}
+        return info
+
+    def save(self, video_id: str, info: VideoInfo, now: Optional[float] = None) -> None:
+        """Store a VideoInfo (atomic replace; errors are logged, not raised)."""
+        path = self._path(video_id)
+        if path is None:
+            return
+        record = {
+            "saved_at": now if now is not None else time.time(),
+            "info": info.to_dict(),
+            "formats": trim_formats(info.raw_info.get("formats", [])),
+        }
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(record, f, ensure_ascii=False)
+                os.replace(tmp, path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not store metadata for {video_id}: {e}")
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """Delete stale entries (and leftover temp files).
+
+        Returns:
+            Number of files deleted.
+        """
+        now = now if now is not None else time.time()
+        deleted = 0
+        try:
+            entries = list(os.scandir(self._directory))
+        except OSError:
+            return 0
+        for entry in entries:
+            try:
+                if now - entry.stat().st_mtime > self._max_age:
+                    os.remove(entry.path)
+                    deleted += 1
+            except OSError:
+                pass
+        if deleted:
+            logger.info(f"Pruned {deleted} stale metadata entries")
+        return deleted
+
+    def clear(self) -> None:
+        """Delete every stored entry."""
+        try:
+            entries = list(os.scandir(self._directory))
+        except OSError:
+            return
+        for entry in entries:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _path(self, video_id: str) -> Optional[Path]:
+        """File for a video ID (None for IDs that aren't safe file names)."""
+        if not video_id or not all(c.isalnum() or c in "-_" for c in video_id):
+            return None
+        return self._directory / f"{video_id}.json"
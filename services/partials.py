@@ -0,0 +1,226 @@
+"""
+YouTube Downloader Pro — Partial Download Files
+
+Tracks the ``.part`` / ``.ytdl`` files yt-dlp leaves behind, checks them
+before a resumed attempt (yt-dlp continues them with HTTP Range requests
+and the fragment index saved in ``.ytdl``), and removes stale ones. Only
+files recorded in the PartialRegistry are ever cleaned up — the output
+directory is shared with other programs (e.g. a browser's ``.part``
+downloads).
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from config import PARTIALS_FILE
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+PART_SUFFIX = ".part"
+STATE_SUFFIX = ".ytdl"  # yt-dlp's fragment-download resume state
+
+# name.part, name.ytdl, name.part-Frag12, name.part-Frag12.part
+_PARTIAL_RE = re.compile(r"(\.part(-Frag\d+(\.part)?)?|\.ytdl)$")
+
+
+def is_partial_file(name: str) -> bool:
+    """True for temporary files written by an unfinished yt-dlp download."""
+    return _PARTIAL_RE.search(name) is not None
+
+
+def state_file_for(partial: str) -> str:
+    """The ``.ytdl`` resume-state file that belongs to a ``.part`` file."""
+    base = partial[:-len(PART_SUFFIX)] if partial.endswith(PART_SUFFIX) else partial
+    return base + STATE_SUFFIX
+
+
+def fragment_index(partial: str) -> Optional[int]:
+    """Index of the next fragment to fetch, from the ``.ytdl`` state (None if absent)."""
+    try:
+        with open(state_file_for(partial), "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return int(state["downloader"]["current_fragment"]["index"])
+    except FileNotFoundError:
+        return None
+
+
+def verify_partials(paths: Iterable[str]) -> List[str]:
+    """Check partial files before resuming; delete the ones that can't be resumed.
+
+    A ``.part`` file is resumable when it is non-empty and its ``.ytdl``
+    state (if any) is readable. Anything else is removed so yt-dlp
+    starts that file from zero instead of appending to bad data.
+
+    Args:
+        paths: ``.part`` files recorded for the item.
+
+    Returns:
+        The paths that are kept for resuming.
+    """
+    kept = []
+    for path in paths:
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            discard_partials([state_file_for(path)])  # Orphaned state
+            continue
+        try:
+            index = fragment_index(path)
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Unreadable resume state, restarting {os.path.basename(path)}: {e}")
+            discard_partials([path])
+            continue
+        if size <= 0:
+            discard_partials([path])
+            continue
+        kept.append(path)
+        where = f"fragment {index}" if index is not None else f"byte {size}"
+        logger.info(f"Resuming {os.path.basename(path)} from {where}")
+    return kept
+
+
+def partial_sizes(paths: Iterable[str]) -> Dict[str, int]:
+    """Bytes already on disk per partial file (missing files are skipped)."""
+    sizes = {}
+    for path in paths:
+        try:
+            sizes[path] = os.path.getsize(path)
+        except OSError:
+            pass
+    return sizes
+
+
+def discard_partials(paths: Iterable[str]) -> int:
+    """Delete partial files and their resume state (missing files are ignored).
+
+    Returns:
+        Number of files deleted.
+    """
+    deleted = 0
+    for path in paths:
+        targets = [path]
+        if path.endswith(PART_SUFFIX):
+            targets.append(state_file_for(path))
+        for target in targets:
+            try:
+                os.remove(target)
+                deleted += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not delete partial file {target}: {e}")
+    return deleted
+
+
+class PartialRegistry:
+    """Persistent set of the partial files this app started.
+
+    yt-dlp's temporary names are recorded as downloads create them, so a
+    later cleanup can tell them apart from other programs' files.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: JSON file (default: config.PARTIALS_FILE).
+        """
+        self._path = Path(path or PARTIALS_FILE)
+        self._lock = threading.Lock()
+        self._paths: Set[str] = set()
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                self._paths = {str(p) for p in json.load(f)}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning(f"Partial file registry unreadable, starting empty: {e}")
+
+    @property
+    def paths(self) -> Set[str]:
+        with self._lock:
+            return set(self._paths)
+
+    def add(self, path: str) -> None:
+        """Record a partial file a download created."""
+        with self._lock:
+            if path in self._paths:
+                return
+            self._paths.add(path)
+            self._save()
+
+    def forget(self, paths: Iterable[str]) -> None:
+        """Drop paths that were deleted or finished."""
+        with self._lock:
+            before = len(self._paths)
+            self._paths.difference_update(paths)
+            if len(self._paths) != before:
+                self._save()
+
+    def _save(self) -> None:
+        """Atomically rewrite the file (lock held)."""
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(sorted(self._paths), f)
+            os.replace(tmp, self._path)
+        except OSError as e:
+            logger.warning(f"Could not save partial file registry: {e}")
+
+
+def _files_of(partial: str) -> List[str]:
+    """A recorded partial plus its resume state and fragment files."""
+    files = [partial, state_file_for(partial)]
+    files.extend(glob.glob(glob.escape(partial) + "-Frag*"))
+    return files
+
+
+def cleanup_stale_partials(
+    recorded: Iterable[str],
+    max_age: float,
+    keep: Set[str],
+    now: Optional[float] = None,
+) -> List[str]:
+    """Delete recorded partial files nobody will resume.
+
+    Only the given paths (with their ``.ytdl`` state and ``-Frag`` files)
+    are considered; nothing is matched by name in the directory.
+
+    Args:
+        recorded: Partial paths this app created (see PartialRegistry).
+        max_age: Files not modified for this many seconds are stale.
+        keep: Partial paths still referenced by queued items.
+        now: Current time (injectable for tests).
+
+    Returns:
+        The recorded paths that are gone now (deleted or already missing).
+    """
+    if now is None:
+        now = time.time()
+    gone: List[str] = []
+    deleted = 0
+    for partial in recorded:
+        if partial in keep:
+            continue
+        files = [f for f in _files_of(partial) if os.path.exists(f)]
+        try:
+            if any(now - os.path.getmtime(f) < max_age for f in files):
+                continue  # Recently written: maybe still in use
+        except OSError:
+            continue
+        deleted += discard_partials(files)
+        if not any(os.path.exists(f) for f in files):
+            gone.append(partial)
+    if deleted:
+        logger.info(f"Removed {deleted} stale partial file(s)")
+    return gone
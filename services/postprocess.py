@@ -0,0 +1,178 @@
+"""
+YouTube Downloader Pro — Post-Processing Stage
+
+Separates FFmpeg work (merge, audio extraction, subtitle embedding,
+metadata) from downloading. A download worker hands its finished file to
+a bounded queue and moves on to the next transfer; a small pool sized to
+the CPU runs the postprocessors at a lower priority.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import sys
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import yt_dlp
+
+from models import DownloadItem
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+# Added to the nice value of post-processing threads (and their FFmpeg children)
+POSTPROCESS_NICE = 10
+
+# Arguments yt-dlp passes to YoutubeDL.post_process
+DeferredPostProcess = Callable[[str, Dict[str, Any], Dict[str, Any]], None]
+
+
+def default_postprocess_workers() -> int:
+    """Post-processing threads for this machine (FFmpeg is CPU-bound)."""
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+def lower_thread_priority(increment: int = POSTPROCESS_NICE) -> bool:
+    """Raise the calling thread's nice value (best effort).
+
+    On Linux priorities are per thread and inherited by child processes,
+    so FFmpeg started from this thread runs at the lower priority too.
+    Elsewhere ``setpriority`` would affect the whole application; nothing
+    is changed there.
+
+    Returns:
+        True if the priority was lowered.
+    """
+    if not sys.platform.startswith("linux") or not hasattr(os, "setpriority"):
+        return False
+    try:
+        tid = threading.get_native_id()
+        current = os.getpriority(os.PRIO_PROCESS, tid)
+        os.setpriority(os.PRIO_PROCESS, tid, min(19, current + increment))
+        return True
+    except OSError as e:
+        logger.debug(f"Could not lower post-processing priority: {e}")
+        return False
+
+
+class DeferringYoutubeDL(yt_dlp.YoutubeDL):
+    """YoutubeDL that can hand its post-processing to another stage.
+
+    While ``defer_postprocess`` is set, ``post_process`` (merge, the
+    configured postprocessors, moving files) is not run; its arguments go
+    to the callable instead. A YoutubeDL with the same options later runs
+    the real ``post_process`` with them.
+    """
+
+    defer_postprocess: Optional[DeferredPostProcess] = None
+
+    def post_process(self, filename, info, files_to_move=None):
+        handler = self.defer_postprocess
+        if handler is None:
+            return super().post_process(filename, info, files_to_move)
+        info["filepath"] = filename
+        handler(filename, info, dict(files_to_move or {}))
+        return info
+
+
+@dataclass
+class PostProcessJob:
+    """A downloaded item waiting for its postprocessors."""
+    item: DownloadItem
+    filename: str
+    info: Dict[str, Any] = field(repr=False)
+    files_to_move: Dict[str, Any] = field(default_factory=dict, repr=False)
+    opts: Dict[str, Any] = field(default_factory=dict, repr=False)  # Download's yt-dlp options
+    mux: Optional[Dict[str, Any]] = None  # SinglePassMuxPP arguments (None = yt-dlp's chain)
+
+
+class PostProcessStage:
+    """Bounded hand-off queue drained by low-priority worker threads.
+
+    ``submit`` blocks while the queue is full, so downloads can't run
+    arbitrarily far ahead of conversion (unprocessed files use disk).
+    Threads start on the first job.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[PostProcessJob], None],
+        workers: int = 0,
+        capacity: int = 0,
+        nice: int = POSTPROCESS_NICE,
+    ):
+        """
+        Args:
+            handler: Runs one job (blocking); must handle its own errors.
+            workers: Worker threads (0 = ``default_postprocess_workers()``).
+            capacity: Jobs waiting before ``submit`` blocks (0 = 2 per worker).
+            nice: Priority decrease of the worker threads (0 = unchanged).
+        """
+        self._handler = handler
+        self._workers = workers or default_postprocess_workers()
+        self._queue: "queue.Queue[Optional[PostProcessJob]]" = queue.Queue(
+            maxsize=capacity or 2 * self._workers
+        )
+        self._nice = nice
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._running = 0  # Jobs being processed right now
+        self._completed = 0
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"queued": self._queue.qsize(), "running": self._running,
+                    "completed": self._completed, "workers": self._workers}
+
+    def submit(self, job: PostProcessJob) -> None:
+        """Queue a job, blocking while the hand-off queue is full."""
+        self._start()
+        self._queue.put(job)
+
+    def stop(self) -> None:
+        """Let the worker threads exit after the jobs already queued."""
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._queue.put(None)
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for n in range(self._workers):
+                thread = threading.Thread(
+                    target=self._run, daemon=True, name=f"PostProcess-{n + 1}",
+                )
+                self._threads.append(thread)
+                thread.start()
+
+    def _run(self) -> None:
+        if self._nice:
+            lower_thread_priority(self._nice)
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            with self._lock:
+                self._running += 1
+            try:
+                self._handler(job)
+            except Exception as e:
+                logger.error(f"Post-processing handler error for {job.item.title}: {e}")
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
@@ -0,0 +1,159 @@
+"""
+YouTube Downloader Pro — Look-ahead Prefetch
+
+Resolves metadata and stream URLs for the next PENDING items while the
+current ones download, so a freed worker starts transferring at once.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable, List, Optional, Set
+
+from models import DownloadItem
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+
+class Prefetcher:
+    """Background threads that keep the next ``depth`` items resolved.
+
+    The owner supplies three callables:
+        upcoming(n): the next n items the scheduler would hand out.
+        needs_refresh(item): True if the item has no usable stream URLs.
+        resolve(item): extract the item's info (blocking, may raise).
+
+    ``wake()`` and ``forget()`` only touch this object's state, so they
+    are safe to call while holding the owner's lock; the callables are never invoked under this
+    object's lock.
+    """
+
+    def __init__(
+        self,
+        upcoming: Callable[[int], List[DownloadItem]],
+        needs_refresh: Callable[[DownloadItem], bool],
+        resolve: Callable[[DownloadItem], None],
+        depth: int = 3,
+        workers: int = 2,
+        refresh_interval: float = 60.0,
+    ):
+        """
+        Args:
+            upcoming: Returns the next n schedulable items, in order.
+            needs_refresh: Whether an item still needs resolving.
+            resolve: Resolves one item (metadata + stream URLs).
+            depth: How many upcoming items to keep resolved (0 disables).
+            workers: Parallel resolutions.
+            refresh_interval: Seconds between re-checks without a wake-up
+                (catches prefetched URLs that are about to expire).
+        """
+        self._upcoming = upcoming
+        self._needs_refresh = needs_refresh
+        self._resolve = resolve
+        self._depth = max(0, depth)
+        self._workers = max(1, workers)
+        self._refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._inflight: Set[str] = set()  # urls being resolved
+        self._given_up: Set[str] = set()  # urls whose prefetch failed (left to the worker)
+        self._threads: List[threading.Thread] = []
+        self._resolved = 0
+        self._failed = 0
+
+    # ========================================================
+    # Properties
+    # ========================================================
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def stats(self) -> dict:
+        with self._lock:
+            return {"resolved": self._resolved, "failed": self._failed,
+                    "inflight": len(self._inflight)}
+
+    # ========================================================
+    # Lifecycle
+    # ========================================================
+
+    def start(self) -> None:
+        """Start the prefetch threads (idempotent)."""
+        if self._depth == 0:
+            return
+        with self._lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            if self._threads:
+                return
+            self._stop.clear()
+            for n in range(self._workers):
+                thread = threading.Thread(
+                    target=self._run, daemon=True, name=f"Prefetch-{n + 1}",
+                )
+                self._threads.append(thread)
+                thread.start()
+        self.wake()
+
+    def stop(self) -> None:
+        """Ask the threads to exit (an in-flight resolve finishes first)."""
+        self._stop.set()
+        self._wake.set()
+
+    def wake(self) -> None:
+        """Re-plan now (queue order or worker state changed)."""
+        self._wake.set()
+
+    def forget(self, url: str) -> None:
+        """Allow prefetching an item again (claimed, removed or retried)."""
+        with self._lock:
+            self._given_up.discard(url)
+
+    def set_depth(self, depth: int) -> None:
+        self._depth = max(0, depth)
+        self.wake()
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            item = self._next_item()
+            if item is None:
+                self._wake.wait(self._refresh_interval)
+                self._wake.clear()
+                continue
+            try:
+                if not self._needs_refresh(item):
+                    continue  # Another thread finished it after we planned
+                self._resolve(item)
+                with self._lock:
+                    self._resolved += 1
+                logger.debug(f"Prefetched: {item.title}")
+            except Exception as e:
+                # The worker will extract again and handle the error properly
+                with self._lock:
+                    self._failed += 1
+                    self._given_up.add(item.url)
+                logger.debug(f"Prefetch failed for {item.url}: {e}")
+            finally:
+                with self._lock:
+                    self._inflight.discard(item.url)
+
+    def _next_item(self) -> Optional[DownloadItem]:
+        """Claim the first upcoming item that still needs resolving."""
+        if self._depth == 0:
+            return None
+        candidates = [
+            item for item in self._upcoming(self._depth) if self._needs_refresh(item)
+        ]
+        with self._lock:
+            for item in candidates:
+                if item.url not in self._inflight and item.url not in self._given_up:
+                    self._inflight.add(item.url)
+                    return item
+        return None
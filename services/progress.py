@@ -0,0 +1,153 @@
+"""
+YouTube Downloader Pro — Progress Slots & Sampling
+
+Workers overwrite a per-item progress slot in place on every yt-dlp chunk;
+consumers (UI, API, metrics) sample the slots at their own rate. The
+download hot path does no allocation and no cross-thread dispatch.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from models import DownloadItem, DownloadProgress
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+
+class ProgressSlot:
+    """Latest progress of one active download.
+
+    Fields are plain attribute writes; a reader may see a torn update
+    across fields, which is harmless for display and corrected by the
+    next sample. With concurrent fragment downloads several yt-dlp
+    threads write the same slot; only the bandwidth accounting needs
+    to be exact and it goes through ``charge()``.
+    """
+
+    __slots__ = (
+        "status", "filename", "downloaded_bytes", "total_bytes",
+        "speed", "eta", "fragment_index", "fragment_count", "version",
+        "charged_bytes", "transferred_bytes", "charge_lock", "control", "should_abort",
+        "resume_sizes", "charging",
+    )
+
+    def __init__(self, control: Any = None):
+        """
+        Args:
+            control: The item's DownloadControl (read by the hook without locking).
+        """
+        self.status = "downloading"
+        self.filename = ""
+        self.downloaded_bytes = 0
+        self.total_bytes = 0
+        self.speed = 0.0
+        self.eta = 0
+        self.fragment_index = 0
+        self.fragment_count = 0
+        self.version = 0  # Bumped on every write
+        self.charged_bytes = 0  # Bytes already charged to the bandwidth limiter
+        self.transferred_bytes = 0  # Total charged over all files of this attempt
+        self.resume_sizes: Dict[str, int] = {}  # tmpfilename -> bytes on disk before the attempt
+        self.charging = False  # The current file has reported at least once
+        self.charge_lock = threading.Lock()
+        self.control = control
+        # Built once so the hot path doesn't allocate a closure per chunk
+        self.should_abort = (lambda: control.is_cancelled) if control is not None else None
+
+    def update(self, d: Dict[str, Any]) -> None:
+        """Overwrite the slot from a yt-dlp "downloading" progress dict."""
+        self.filename = d.get("filename") or self.filename
+        self.downloaded_bytes = d.get("downloaded_bytes") or 0
+        self.total_bytes = d.get("total_bytes") or d.get("total_bytes_estimate") or 0
+        self.speed = d.get("speed") or 0
+        self.eta = d.get("eta") or 0
+        self.fragment_index = d.get("fragment_index") or 0
+        self.fragment_count = d.get("fragment_count") or 0
+        self.version += 1
+
+    def charge(self, downloaded: int, tmpfilename: str = "") -> int:
+        """Bytes received since the previous charge (safe across fragment threads).
+
+        yt-dlp's ``downloaded_bytes`` includes what a resumed ``.part``
+        file already held; the first report of a file starts counting from
+        its size in ``resume_sizes``, so only new bytes are charged.
+        """
+        with self.charge_lock:
+            if not self.charging:
+                self.charging = True
+                self.charged_bytes = min(downloaded, self.resume_sizes.get(tmpfilename, 0))
+            charged = self.charged_bytes
+            if downloaded <= charged:
+                return 0  # Out-of-order report from another fragment thread
+            self.charged_bytes = downloaded
+            self.transferred_bytes += downloaded - charged
+            return downloaded - charged
+
+    def reset_charge(self) -> None:
+        """Next file starts counting from zero."""
+        with self.charge_lock:
+            self.charged_bytes = 0
+            self.charging = False
+
+    @property
+    def percent(self) -> float:
+        """Byte-based percent, or fragment-based when the size is unknown."""
+        if self.total_bytes > 0:
+            return min(100.0, self.downloaded_bytes / self.total_bytes * 100)
+        if self.fragment_count > 0:
+            return min(100.0, self.fragment_index / self.fragment_count * 100)
+        return 0.0
+
+    def snapshot(self) -> DownloadProgress:
+        """Copy the slot into a DownloadProgress (allocates — reader side only)."""
+        return DownloadProgress(
+            downloaded_bytes=self.downloaded_bytes,
+            total_bytes=self.total_bytes,
+            speed=self.speed,
+            eta=self.eta,
+            percent=self.percent,
+            status=self.status,
+            filename=self.filename,
+        )
+
+
+class ProgressSampler:
+    """Returns the slots that changed since this sampler's previous poll.
+
+    Each consumer owns its own sampler, so they can poll at different rates.
+    """
+
+    def __init__(self, source: Callable[[], Iterable[Tuple[DownloadItem, ProgressSlot]]]):
+        """
+        Args:
+            source: Returns the (item, slot) pairs of the active downloads.
+        """
+        self._source = source
+        self._seen: Dict[int, int] = {}  # id(slot) -> version last reported
+
+    def poll(self) -> List[Tuple[DownloadItem, DownloadProgress]]:
+        """Snapshot every slot written since the last poll.
+
+        Also refreshes ``progress``/``speed``/``eta`` on the items so
+        list views that read them directly stay current.
+
+        Returns:
+            (item, progress) pairs, in active-item order.
+        """
+        changed = []
+        seen: Dict[int, int] = {}
+        for item, slot in self._source():
+            version = slot.version
+            seen[id(slot)] = version
+            if version == 0 or self._seen.get(id(slot)) == version:
+                continue
+            progress = slot.snapshot()
+            item.progress = progress.percent
+            item.speed = progress.speed
+            item.eta = progress.eta
+            changed.append((item, progress))
+        self._seen = seen  # Forget finished downloads
+        return changed
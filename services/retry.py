@@ -0,0 +1,197 @@
+"""
+YouTube Downloader Pro — Retry Policy
+
+Classifies yt-dlp errors (permanent / throttled / transient), computes
+exponential backoff with jitter, and holds failed items in a time-ordered
+delay queue so workers never sleep on a retry.
+"""
+
+from __future__ import annotations
+
+import enum
+import heapq
+import itertools
+import random
+import logging
+from typing import Callable, Dict, List, Optional
+
+import yt_dlp
+
+from models import DownloadItem
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+
+class ErrorClass(enum.Enum):
+    """How a failed attempt should be retried."""
+    PERMANENT = "permanent"  # Never succeeds (private, removed, geo-blocked...)
+    THROTTLED = "throttled"  # Server asked us to slow down — back off harder
+    TRANSIENT = "transient"  # Network hiccup — retry soon
+
+
+# Lower-cased message fragments (yt-dlp wraps most errors in DownloadError text)
+_PERMANENT_MESSAGES = (
+    "private video",
+    "video unavailable",
+    "this video is not available",
+    "has been removed",
+    "no longer available",
+    "account associated with this video has been terminated",
+    "not available in your country",
+    "geo restrict",
+    "members-only",
+    "join this channel",
+    "sign in to confirm your age",
+    "age-restricted",
+    "copyright",
+    "unsupported url",
+    "is not a valid url",
+    "requested format is not available",
+    "premieres in",
+    "this live event will begin",
+    "http error 404",
+    "http error 410",
+)
+_THROTTLED_MESSAGES = (
+    "http error 429",
+    "too many requests",
+    "rate-limit",
+    "rate limit",
+    "confirm you're not a bot",
+    "confirm you’re not a bot",
+    "http error 403",  # YouTube: throttled or expired stream URL
+)
+_PERMANENT_HTTP = {400, 401, 404, 410, 451}
+_THROTTLED_HTTP = {403, 429}
+
+
+def _error_chain(error: BaseException) -> List[BaseException]:
+    """The error plus everything it wraps (yt-dlp keeps causes in exc_info)."""
+    chain: List[BaseException] = []
+    pending: List[Optional[BaseException]] = [error]
+    while pending:
+        current = pending.pop()
+        if current is None or any(current is seen for seen in chain):
+            continue
+        chain.append(current)
+        exc_info = getattr(current, "exc_info", None)
+        if isinstance(exc_info, tuple) and len(exc_info) > 1:
+            pending.append(exc_info[1])
+        cause = getattr(current, "cause", None)
+        if isinstance(cause, BaseException):
+            pending.append(cause)
+        pending.extend((current.__cause__, current.__context__))
+    return chain
+
+
+def classify_error(error: BaseException) -> ErrorClass:
+    """Decide whether a failed download is worth retrying, and how.
+
+    Exception types are checked first (HTTP status, geo restriction,
+    unsupported URL), then the error messages; unknown errors are
+    treated as transient.
+    """
+    from yt_dlp.networking.exceptions import HTTPError
+
+    chain = _error_chain(error)
+    for current in chain:
+        if isinstance(current, HTTPError):
+            if current.status in _THROTTLED_HTTP:
+                return ErrorClass.THROTTLED
+            if current.status in _PERMANENT_HTTP:
+                return ErrorClass.PERMANENT
+            return ErrorClass.TRANSIENT
+        if isinstance(current, (yt_dlp.utils.GeoRestrictedError, yt_dlp.utils.UnsupportedError)):
+            return ErrorClass.PERMANENT
+
+    message = " ".join(str(current) for current in chain).lower()
+    if any(fragment in message for fragment in _THROTTLED_MESSAGES):
+        return ErrorClass.THROTTLED
+    if any(fragment in message for fragment in _PERMANENT_MESSAGES):
+        return ErrorClass.PERMANENT
+    return ErrorClass.TRANSIENT
+
+
+def backoff_delay(
+    attempt: int,
+    error_class: ErrorClass,
+    base_delay: float,
+    max_delay: float,
+    throttle_factor: float = 4.0,
+    rand: Callable[[float, float], float] = random.uniform,
+) -> float:
+    """Exponential backoff with "equal" jitter.
+
+    The delay is drawn from ``[cap / 2, cap]`` where
+    ``cap = min(max_delay, base * 2 ** (attempt - 1))``; throttled
+    errors start from ``base * throttle_factor``.
+
+    Args:
+        attempt: 1 for the first retry, 2 for the second...
+        error_class: Classification of the last failure.
+        base_delay: Delay before the first transient retry (seconds).
+        max_delay: Upper bound for any single delay (seconds).
+        throttle_factor: Base multiplier for throttled errors.
+        rand: Uniform random source (injectable for tests).
+
+    Returns:
+        Seconds to wait before the next attempt.
+    """
+    base = base_delay * (throttle_factor if error_class == ErrorClass.THROTTLED else 1.0)
+    cap = min(max_delay, base * (2 ** max(0, attempt - 1)))
+    if cap <= 0:
+        return 0.0
+    return cap / 2 + rand(0.0, cap / 2)
+
+
+class DelayQueue:
+    """Items parked until a retry time, ordered by due time. O(log n).
+
+    Not thread-safe — the owning service guards it with its own lock.
+    """
+
+    def __init__(self):
+        self._heap: List[list] = []  # [due, seq, item, alive]
+        self._entries: Dict[str, list] = {}  # url -> live entry
+        self._seq = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item: DownloadItem) -> bool:
+        return item.url in self._entries
+
+    def push(self, item: DownloadItem, due: float) -> None:
+        """Park an item until ``due`` (replaces an earlier parking)."""
+        self.discard(item)
+        entry = [due, next(self._seq), item, True]
+        self._entries[item.url] = entry
+        heapq.heappush(self._heap, entry)
+
+    def discard(self, item: DownloadItem) -> bool:
+        """Forget a parked item (lazy delete)."""
+        entry = self._entries.pop(item.url, None)
+        if entry is None:
+            return False
+        entry[3] = False
+        return True
+
+    def pop_due(self, now: float) -> List[DownloadItem]:
+        """Remove and return every item whose retry time has come."""
+        due = []
+        while self._heap and (not self._heap[0][3] or self._heap[0][0] <= now):
+            entry = heapq.heappop(self._heap)
+            if entry[3]:
+                del self._entries[entry[2].url]
+                due.append(entry[2])
+        return due
+
+    def next_due(self) -> Optional[float]:
+        """Time of the earliest parked item (None if empty)."""
+        while self._heap and not self._heap[0][3]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def clear(self) -> None:
+        self._heap.clear()
+        self._entries.clear()
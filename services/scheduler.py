@@ -0,0 +1,242 @@
+"""
+YouTube Downloader Pro — Queue Scheduler
+
+Indexed O(log n) selection of the next item to download, with
+pluggable policies (FIFO, priority, shortest-job-first, round-robin).
+"""
+
+from __future__ import annotations
+
+import enum
+import heapq
+import itertools
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from models import DownloadItem, DownloadFormat
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+
+class SchedulingPolicy(enum.Enum):
+    """How the next PENDING item is chosen."""
+    FIFO = "fifo"
+    PRIORITY = "priority"
+    SHORTEST_FIRST = "shortest_first"
+    ROUND_ROBIN = "round_robin"
+
+
+# Rough bitrates used to turn a duration into a size estimate (bytes/second)
+_ESTIMATED_VIDEO_RATE = 512 * 1024
+_ESTIMATED_AUDIO_RATE = 24 * 1024
+
+
+def estimate_item_bytes(item: DownloadItem) -> float:
+    """Estimate the download size of an item for shortest-job-first.
+
+    Uses ``VideoInfo.filesize_approx`` when known, otherwise the duration
+    at a nominal bitrate. Unknown items sort last.
+    """
+    info = item.video_info
+    if info.filesize_approx > 0:
+        return float(info.filesize_approx)
+    if info.duration > 0:
+        rate = _ESTIMATED_AUDIO_RATE if item.format == DownloadFormat.AUDIO else _ESTIMATED_VIDEO_RATE
+        return float(info.duration * rate)
+    return float("inf")
+
+
+class QueueScheduler:
+    """Heap of schedulable items keyed by the active policy.
+
+    Every queue item is registered with an *order* key (its FIFO
+    position, changed by ``set_order``). Only PENDING items are pushed
+    onto the heap. Removal is lazy: stale heap entries are marked dead
+    and skipped on pop, so push/pop/re-key are all O(log n).
+
+    Not thread-safe — the owning service guards it with its own lock.
+    """
+
+    def __init__(self, policy: SchedulingPolicy = SchedulingPolicy.FIFO):
+        self._policy = policy
+        self._heap: List[list] = []  # [key, seq, item, alive]
+        self._entries: Dict[str, list] = {}  # url -> live heap entry
+        self._order: Dict[str, float] = {}  # url -> FIFO order key
+        self._counter = itertools.count()
+        self._seq = itertools.count()  # Unique heap tie-breaker
+        # Round-robin (start-time fair queuing) state
+        self._virtual_time = 0.0
+        self._group_next: Dict[str, float] = {}
+        self._entry_vtime: Dict[str, float] = {}
+
+    # ========================================================
+    # Properties
+    # ========================================================
+
+    @property
+    def policy(self) -> SchedulingPolicy:
+        return self._policy
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item: DownloadItem) -> bool:
+        return item.url in self._entries
+
+    # ========================================================
+    # Registration
+    # ========================================================
+
+    def register(self, item: DownloadItem) -> None:
+        """Give a queue item its FIFO order key (idempotent)."""
+        if item.url not in self._order:
+            self._order[item.url] = float(next(self._counter))
+
+    def forget(self, item: DownloadItem) -> None:
+        """Drop every trace of an item removed from the queue."""
+        self.discard(item)
+        self._order.pop(item.url, None)
+
+    def clear(self) -> None:
+        """Remove all items."""
+        self._heap.clear()
+        self._entries.clear()
+        self._order.clear()
+        self._group_next.clear()
+        self._entry_vtime.clear()
+
+    def order_of(self, item: DownloadItem) -> Optional[float]:
+        """Return the FIFO order key of a registered item."""
+        return self._order.get(item.url)
+
+    # ========================================================
+    # Heap Operations
+    # ========================================================
+
+    def push(self, item: DownloadItem) -> bool:
+        """Make an item schedulable. O(log n).
+
+        Returns:
+            False if it was already scheduled.
+        """
+        if item.url in self._entries:
+            return False
+        self.register(item)
+        if self._policy == SchedulingPolicy.ROUND_ROBIN:
+            group = item.group or item.url
+            vtime = max(self._virtual_time, self._group_next.get(group, 0.0))
+            self._group_next[group] = vtime + 1.0
+            self._entry_vtime[item.url] = vtime
+        entry = [self._key(item), next(self._seq), item, True]
+        self._entries[item.url] = entry
+        heapq.heappush(self._heap, entry)
+        return True
+
+    def pop(self) -> Optional[DownloadItem]:
+        """Remove and return the next item per the policy. O(log n) amortized."""
+        while self._heap:
+            entry = heapq.heappop(self._heap)
+            if not entry[3]:
+                continue
+            item = entry[2]
+            url = item.url
+            del self._entries[url]
+            vtime = self._entry_vtime.pop(url, None)
+            if vtime is not None:
+                self._virtual_time = max(self._virtual_time, vtime)
+            return item
+        return None
+
+    def peek(self, n: int) -> List[DownloadItem]:
+        """The next ``n`` items ``pop()`` would return, without removing them.
+
+        Walks the heap best-first from the root, so only the entries
+        above the n-th live one are visited: O(h log h) for h visited
+        entries (n plus the dead ones among them), independent of the
+        queue length.
+        """
+        heap = self._heap
+        if n <= 0 or not heap:
+            return []
+        found: List[DownloadItem] = []
+        frontier = [(heap[0][0], heap[0][1], 0)]
+        while frontier and len(found) < n:
+            _, _, index = heapq.heappop(frontier)
+            entry = heap[index]
+            if entry[3]:
+                found.append(entry[2])
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child][0], heap[child][1], child))
+        return found
+
+    def discard(self, item: DownloadItem) -> bool:
+        """Unschedule an item (lazy delete). O(1).
+
+        Returns:
+            True if it was scheduled.
+        """
+        entry = self._entries.pop(item.url, None)
+        if entry is None:
+            return False
+        entry[3] = False
+        self._entry_vtime.pop(item.url, None)
+        self._maybe_compact()
+        return True
+
+    def set_order(self, item: DownloadItem, order: float) -> None:
+        """Change an item's FIFO order key and re-key it. O(log n)."""
+        self._order[item.url] = order
+        self._rekey(item)
+
+    def set_priority(self, item: DownloadItem, priority: int) -> None:
+        """Change an item's explicit priority and re-key it. O(log n)."""
+        item.priority = priority
+        self._rekey(item)
+
+    def set_policy(self, policy: SchedulingPolicy) -> None:
+        """Switch policy and rebuild the heap. O(n log n)."""
+        if policy == self._policy:
+            return
+        items = [entry[2] for entry in self._heap if entry[3]]
+        items.sort(key=lambda i: self._order.get(i.url, 0.0))
+        self._policy = policy
+        self._heap.clear()
+        self._entries.clear()
+        self._entry_vtime.clear()
+        self._group_next.clear()
+        for item in items:
+            self.push(item)
+        logger.info(f"Scheduling policy: {policy.value}")
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _rekey(self, item: DownloadItem) -> None:
+        """Re-insert a scheduled item under its new key, keeping its vtime."""
+        entry = self._entries.get(item.url)
+        if entry is None:
+            return
+        entry[3] = False
+        new_entry = [self._key(item), next(self._seq), item, True]
+        self._entries[item.url] = new_entry
+        heapq.heappush(self._heap, new_entry)
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        """Drop dead entries once they outnumber live ones (amortized O(1))."""
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [entry for entry in self._heap if entry[3]]
+            heapq.heapify(self._heap)
+
+    def _key(self, item: DownloadItem) -> Tuple[float, ...]:
+        """Sort key for the current policy (ties broken by FIFO order)."""
+        order = self._order[item.url]
+        if self._policy == SchedulingPolicy.PRIORITY:
+            return (-item.priority, order)
+        if self._policy == SchedulingPolicy.SHORTEST_FIRST:
+            return (estimate_item_bytes(item), order)
+        if self._policy == SchedulingPolicy.ROUND_ROBIN:
+            return (self._entry_vtime.get(item.url, 0.0), order)
+        return (order,)
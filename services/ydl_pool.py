@@ -0,0 +1,216 @@
+"""
+YouTube Downloader Pro — YoutubeDL Instance Pool
+
+Reusable, pre-warmed ``yt_dlp.YoutubeDL`` instances keyed by option profile.
+Reusing an instance keeps its initialized extractors, cookie jar and
+keep-alive HTTP connections instead of paying for them on every URL.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import yt_dlp
+
+logger = logging.getLogger("YouTube Downloader Pro")
+
+# Per-call options: replaced by relays so they don't split the profile
+_HOOK_KEYS = ("progress_hooks", "postprocessor_hooks", "post_hooks")
+# Per-call options read by the downloaders at download time (tuned per item)
+_TUNED_KEYS = ("concurrent_fragment_downloads", "http_chunk_size")
+
+
+def profile_key(opts: Dict[str, Any]) -> str:
+    """Stable key for the static part of a yt-dlp option dict.
+
+    Hook lists and tuned download options are excluded — they are
+    rebound on every checkout.
+    """
+    static = {k: v for k, v in opts.items() if k not in _HOOK_KEYS and k not in _TUNED_KEYS}
+    return json.dumps(static, sort_keys=True, default=repr)
+
+
+class _PooledInstance:
+    """A YoutubeDL plus the hooks of whoever has it checked out."""
+
+    def __init__(self, opts: Dict[str, Any], factory: Callable[..., Any]):
+        self.hooks: Dict[str, List[Callable]] = {key: [] for key in _HOOK_KEYS}
+        params = dict(opts)
+        for key in _HOOK_KEYS:
+            params[key] = [self._relay(key)]
+        self.ydl = factory(params)
+
+    def _relay(self, key: str) -> Callable[[Dict[str, Any]], None]:
+        def relay(d: Dict[str, Any]) -> None:
+            for hook in self.hooks[key]:
+                hook(d)
+        return relay
+
+    def bind(self, opts: Dict[str, Any]) -> None:
+        """Point the relays at the caller's hooks and apply its tuned options."""
+        for key in _HOOK_KEYS:
+            self.hooks[key] = list(opts.get(key) or [])
+        params = getattr(self.ydl, "params", None)
+        if params is not None:
+            for key in _TUNED_KEYS:
+                if key in opts:
+                    params[key] = opts[key]
+                else:
+                    params.pop(key, None)
+
+    def reset(self) -> None:
+        """Drop the caller's hooks and per-run state before going idle."""
+        for key in _HOOK_KEYS:
+            self.hooks[key] = []
+        if hasattr(self.ydl, "_download_retcode"):
+            self.ydl._download_retcode = 0
+
+    def close(self) -> None:
+        try:
+            self.ydl.close()
+        except Exception as e:
+            logger.debug(f"YoutubeDL close error: {e}")
+
+
+class YoutubeDLPool:
+    """Bounded pool of idle YoutubeDL instances, one free-list per profile.
+
+    Each checkout is exclusive to the calling thread. Instances whose
+    checkout ended in an exception are closed rather than reused, since
+    their internal state is unknown.
+    """
+
+    def __init__(
+        self,
+        max_idle: int = 16,
+        factory: Callable[..., Any] = yt_dlp.YoutubeDL,
+    ):
+        """
+        Args:
+            max_idle: Total idle instances kept across all profiles.
+            factory: YoutubeDL constructor (injectable for tests).
+        """
+        self._max_idle = max_idle
+        self._factory = factory
+        self._lock = threading.Lock()
+        # profile key -> idle instances; ordered by last use (LRU first)
+        self._idle: "OrderedDict[str, List[_PooledInstance]]" = OrderedDict()
+        self._idle_count = 0
+        self._created = 0
+        self._reused = 0
+        self._closed = False
+
+    # ========================================================
+    # Properties
+    # ========================================================
+
+    @property
+    def idle_count(self) -> int:
+        return self._idle_count
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Instances created vs. checkouts served from the pool."""
+        with self._lock:
+            return {"created": self._created, "reused": self._reused, "idle": self._idle_count}
+
+    # ========================================================
+    # Checkout
+    # ========================================================
+
+    @contextmanager
+    def checkout(self, opts: Dict[str, Any]) -> Iterator[Any]:
+        """Borrow a YoutubeDL configured with ``opts``.
+
+        Usage:
+            with pool.checkout(opts) as ydl:
+                ydl.extract_info(url, download=False)
+
+        Args:
+            opts: yt-dlp options; hook lists are bound for this checkout only.
+        """
+        key = profile_key(opts)
+        instance = self._take(key)
+        if instance is None:
+            instance = self._create(opts)
+        instance.bind(opts)
+
+        try:
+            yield instance.ydl
+        except BaseException:
+            instance.close()
+            raise
+        instance.reset()
+        self._give_back(key, instance)
+
+    def warm(self, opts: Dict[str, Any], count: int = 1) -> None:
+        """Pre-create idle instances for a profile (e.g. at startup)."""
+        key = profile_key(opts)
+        for _ in range(count):
+            with self._lock:
+                if len(self._idle.get(key, ())) >= count:
+                    return
+            self._give_back(key, self._create(opts))
+
+    def close(self) -> None:
+        """Close every idle instance; later check-ins are closed immediately."""
+        with self._lock:
+            self._closed = True
+            instances = [i for idle in self._idle.values() for i in idle]
+            self._idle.clear()
+            self._idle_count = 0
+        for instance in instances:
+            instance.close()
+
+    # ========================================================
+    # Internal
+    # ========================================================
+
+    def _create(self, opts: Dict[str, Any]) -> _PooledInstance:
+        instance = _PooledInstance(opts, self._factory)
+        with self._lock:
+            self._created += 1
+        return instance
+
+    def _take(self, key: str) -> Optional[_PooledInstance]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if not idle:
+                return None
+            instance = idle.pop()
+            if idle:
+                self._idle.move_to_end(key)
+            else:
+                del self._idle[key]
+            self._idle_count -= 1
+            self._reused += 1
+            return instance
+
+    def _give_back(self, key: str, instance: _PooledInstance) -> None:
+        evicted: List[_PooledInstance] = []
+        with self._lock:
+            if self._closed or self._max_idle <= 0:
+                evicted.append(instance)
+            else:
+                self._idle.setdefault(key, []).append(instance)
+                self._idle.move_to_end(key)
+                self._idle_count += 1
+                evicted = self._evict()
+        for old in evicted:
+            old.close()
+
+    def _evict(self) -> List[_PooledInstance]:
+        """Drop idle instances of the least recently used profiles (lock held)."""
+        evicted = []
+        while self._idle_count > self._max_idle:
+            key, idle = next(iter(self._idle.items()))
+            evicted.append(idle.pop(0))
+            self._idle_count -= 1
+            if not idle:
+                del self._idle[key]
+        return evicted
@@ -0,0 +1,152 @@
+"""
+Tests for services/admission.py — Disk-space admission tests.
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+import yt_dlp
+
+from config import AppSettings
+from models import DownloadItem, DownloadStatus, VideoInfo
+from services.admission import (
+    Admission, DiskAdmission, expected_bytes, free_bytes, selected_size,
+)
+from services.downloader import DownloadService
+
+
+FORMATS = [
+    {"format_id": "140", "ext": "m4a", "vcodec": "none", "acodec": "mp4a.40.2", "abr": 128,
+     "filesize": 10, "url": "https://x/140", "protocol": "https"},
+    {"format_id": "136", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 720,
+     "filesize_approx": 50, "url": "https://x/136", "protocol": "https"},
+    {"format_id": "137", "ext": "mp4", "vcodec": "avc1", "acodec": "none", "height": 1080,
+     "filesize": 100, "url": "https://x/137", "protocol": "https"},
+]
+
+
+class TestDiskAdmission:
+    """Reservations against free space."""
+
+    def test_admits_until_full(self):
+        admission = DiskAdmission(margin=100, disk_free=lambda d: 1000)
+        assert admission.reserve("a", 500, "/d") == Admission.ADMITTED
+        assert admission.reserve("b", 450, "/d") == Admission.HELD  # 950 > 1000 - 100
+        assert admission.reserve("b", 450, "/d") == Admission.HELD
+        assert admission.reserved == 500
+
+        assert admission.release("a") is True
+        assert admission.release("a") is False
+        assert admission.reserve("b", 450, "/d") == Admission.ADMITTED
+
+    def test_rejected_when_alone(self):
+        admission = DiskAdmission(margin=100, disk_free=lambda d: 1000)
+        assert admission.reserve("a", 950, "/d") == Admission.REJECTED
+        assert admission.reservation("a") is None
+
+    def test_unknown_size_needs_margin(self):
+        assert DiskAdmission(margin=100, disk_free=lambda d: 150).reserve("a", 0, "/d") == Admission.ADMITTED
+        assert DiskAdmission(margin=100, disk_free=lambda d: 50).reserve("a", 0, "/d") == Admission.REJECTED
+
+    def test_probe_failure_admits(self):
+        def broken(directory):
+            raise OSError("no such device")
+        admission = DiskAdmission(disk_free=broken)
+        assert admission.reserve("a", 10 ** 15, "/d") == Admission.ADMITTED
+        assert admission.reservation("a") == 10 ** 15
+
+    def test_free_bytes_of_missing_dir(self, tmp_path):
+        assert free_bytes(str(tmp_path / "not" / "yet")) == free_bytes(str(tmp_path))
+
+
+class TestExpectedBytes:
+    """Size estimates."""
+
+    @pytest.mark.parametrize("spec, size", [
+        ("bestvideo[height<=720]+bestaudio/best", 60),
+        ("bestvideo[height<=1080]+bestaudio/best", 110),
+        ("bestaudio/best", 10),
+    ])
+    def test_selected_format_sizes(self, spec, size):
+        with yt_dlp.YoutubeDL({"quiet": True, "format": spec}) as ydl:
+            assert selected_size({"formats": FORMATS}, ydl) == size
+
+    def test_unknown_stream_size(self):
+        formats = [dict(FORMATS[0], filesize=None), FORMATS[1]]
+        with yt_dlp.YoutubeDL({"quiet": True, "format": "bestvideo+bestaudio"}) as ydl:
+            assert selected_size({"formats": formats}, ydl) == 0
+
+    def test_falls_back_to_filesize_approx(self):
+        info = VideoInfo(url="u", filesize_approx=300)
+        assert expected_bytes(info) == 600  # Download + post-processing copy
+
+    def test_partials_subtracted(self, tmp_path):
+        part = tmp_path / "v.f137.mp4.part"
+        part.write_bytes(b"x" * 100)
+        info = VideoInfo(url="u", filesize_approx=300)
+        assert expected_bytes(info, partial_files=[str(part), str(tmp_path / "gone")]) == 500
+
+
+class TestServiceAdmission:
+    """Items are held while the disk is full."""
+
+    def make_service(self, free):
+        service = DownloadService(AppSettings(max_concurrent=2, prefetch_depth=0, output_dir="/tmp"))
+        service._admission = DiskAdmission(margin=0, disk_free=lambda d: free)
+        return service
+
+    @staticmethod
+    def make_item(n, size):
+        return DownloadItem(video_info=VideoInfo(url=f"https://youtube.com/watch?v=adm{n:08d}",
+                                                 title=f"V{n}", filesize_approx=size))
+
+    def test_held_until_space_released(self):
+        service = self.make_service(free=1000)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        statuses = []
+        done = threading.Event()
+
+        def fake_download(item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        service._download_item = fake_download
+        service.set_callbacks(on_status_changed=lambda item: statuses.append((item.title, item.status)),
+                              on_all_complete=done.set)
+        items = [self.make_item(1, 400), self.make_item(2, 400)]  # 800 + 800 > 1000
+        service.add_many(items)
+        service.start()
+        assert done.wait(5)
+
+        assert state["peak"] == 1
+        assert service.completed_count == 2
+        assert ("V2", DownloadStatus.PENDING) in statuses  # Held, not failed
+        assert service._admission.reserved == 0
+        assert not service._held
+
+    def test_rejected_when_it_can_never_fit(self):
+        service = self.make_service(free=1000)
+        calls = []
+        done = threading.Event()
+        service._download_item = lambda item: calls.append(item) or True
+        service.set_callbacks(on_all_complete=done.set)
+        item = self.make_item(1, 600)
+        service.add_to_queue(item)
+        service.start()
+        assert done.wait(5)
+
+        assert calls == []
+        assert item.status == DownloadStatus.FAILED
+        assert "disk space" in item.error_message
+        assert service.failed_count == 1
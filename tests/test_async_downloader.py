@@ -0,0 +1,216 @@
+"""
+Tests for services/async_downloader.py — asyncio engine tests.
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from config import AppSettings
+from models import DownloadItem, DownloadStatus, VideoInfo
+from services.async_downloader import AsyncDownloadService, StatusEvent
+
+
+def make_item(n):
+    return DownloadItem(video_info=VideoInfo(url=f"https://youtube.com/watch?v=async{n:06d}", title=f"V{n}"))
+
+
+def engine_with(download, max_concurrent=2):
+    """Engine whose downloads run ``download(service, item) -> bool`` (blocking)."""
+    engine = AsyncDownloadService(AppSettings(max_concurrent=max_concurrent, prefetch_depth=0))
+    service = engine.service
+
+    def fake_download_item(item):
+        service._set_status(item, DownloadStatus.DOWNLOADING)
+        ok = download(service, item)
+        if service._is_cancelled(item):
+            return False
+        service._set_status(item, DownloadStatus.COMPLETED if ok else DownloadStatus.FAILED,
+                            notify=False)
+        if ok and service._on_complete:
+            service._on_complete(item)
+        return ok
+
+    service._download_item = fake_download_item
+    return engine
+
+
+def instant(service, item):
+    return True
+
+
+def run(coro):
+    return asyncio.run(asyncio.wait_for(coro, 10))
+
+
+class TestAsyncQueue:
+    """Queue operations and running."""
+
+    def test_download_returns_finished_item(self):
+        async def main():
+            async with engine_with(instant) as engine:
+                item = await engine.download(make_item(1))
+                return item.status
+        assert run(main()) == DownloadStatus.COMPLETED
+
+    def test_run_drains_queue_with_bounded_concurrency(self):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow(service, item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return True
+
+        async def main():
+            async with engine_with(slow, max_concurrent=3) as engine:
+                await engine.add_many([make_item(n) for n in range(12)])
+                await engine.run()
+                return engine.service.completed_count, engine.is_running
+
+        assert run(main()) == (12, False)
+        assert state["peak"] == 3
+
+    def test_queued_items_cost_no_threads(self):
+        async def main():
+            async with engine_with(instant) as engine:
+                before = threading.active_count()
+                await engine.add_many([make_item(n) for n in range(2000)])
+                queued = engine.service.queue_count
+                # Only the queue-ops thread exists; no download threads yet
+                return queued, engine._download_executor, threading.active_count() - before
+        queued, executor, extra_threads = run(main())
+        assert queued == 2000
+        assert executor is None
+        assert extra_threads <= 1
+
+    def test_duplicate_add(self):
+        async def main():
+            async with engine_with(instant) as engine:
+                return await engine.add(make_item(1)), await engine.add(make_item(1))
+        assert run(main()) == (True, False)
+
+
+class TestAsyncCancellation:
+    """Cancelling the awaiting task cancels the download."""
+
+    @staticmethod
+    def blocking(started):
+        def download(service, item):
+            started.set()
+            while not service._is_cancelled(item):
+                time.sleep(0.005)
+            return False
+        return download
+
+    def test_cancel_download_task(self):
+        started = threading.Event()
+
+        async def main():
+            async with engine_with(self.blocking(started)) as engine:
+                item = make_item(1)
+                task = asyncio.create_task(engine.download(item))
+                while not started.is_set():
+                    await asyncio.sleep(0.005)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                await engine.join()  # Worker returns once the thread unwinds
+                return item.status, engine.is_running
+
+        assert run(main()) == (DownloadStatus.CANCELLED, False)
+
+    def test_cancel_run_task_cancels_active(self):
+        started = threading.Event()
+
+        async def main():
+            async with engine_with(self.blocking(started)) as engine:
+                items = [make_item(n) for n in range(3)]
+                await engine.add_many(items)
+                task = asyncio.create_task(engine.run())
+                while not started.is_set():
+                    await asyncio.sleep(0.005)
+                task.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await task
+                return [i.status for i in items]
+
+        statuses = run(main())
+        assert DownloadStatus.COMPLETED not in statuses
+        assert DownloadStatus.DOWNLOADING not in statuses
+
+    def test_removed_item_releases_waiter(self):
+        started = threading.Event()
+
+        async def main():
+            async with engine_with(self.blocking(started), max_concurrent=1) as engine:
+                first, second = make_item(1), make_item(2)
+                await engine.add(first)
+                waiting = asyncio.create_task(engine.download(second))
+                while not started.is_set():
+                    await asyncio.sleep(0.005)
+                await engine.remove_many([second])
+                result = await waiting
+                await engine.cancel()
+                return result
+
+        assert run(main()).url == make_item(2).url
+
+
+class TestAsyncEvents:
+    """Status and progress streams."""
+
+    def test_status_events_in_order(self):
+        async def main():
+            async with engine_with(instant) as engine:
+                seen = []
+
+                async def collect():
+                    async for event in engine.events():
+                        seen.append(event.status)
+                        if event.status == DownloadStatus.COMPLETED:
+                            return
+
+                collector = asyncio.create_task(collect())
+                await asyncio.sleep(0)  # Subscribe first
+                await engine.download(make_item(1))
+                await collector
+                return seen
+
+        assert run(main()) == [DownloadStatus.DOWNLOADING, DownloadStatus.COMPLETED]
+
+    def test_progress_stream(self):
+        release = threading.Event()
+
+        def reporting(service, item):
+            service._progress_hook({"status": "downloading", "downloaded_bytes": 50,
+                                    "total_bytes": 100}, item)
+            release.wait(5)
+            return True
+
+        async def main():
+            async with engine_with(reporting) as engine:
+                task = asyncio.create_task(engine.download(make_item(1)))
+                async for item, progress in engine.progress(interval=0.01):
+                    release.set()
+                    break
+                await task
+                return progress.percent
+
+        assert run(main()) == pytest.approx(50.0)
+
+    def test_status_event_captures_status(self):
+        item = make_item(1)
+        item.status = DownloadStatus.FAILED
+        event = StatusEvent(item, item.status, "boom")
+        item.status = DownloadStatus.PENDING
+        assert event.status == DownloadStatus.FAILED
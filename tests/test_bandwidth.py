@@ -0,0 +1,137 @@
+"""
+Tests for services/bandwidth.py — Global bandwidth limiter tests.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from services.bandwidth import BandwidthLimiter, TokenBucket
+
+
+class FakeClock:
+    """Manual clock; sleeping advances time instantly."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.slept = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        self.slept += seconds
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_limiter(clock, rate, burst_seconds=0.0, **kwargs):
+    return BandwidthLimiter(rate, burst_seconds=burst_seconds, clock=clock,
+                            sleep=clock.sleep, **kwargs)
+
+
+class TestTokenBucket:
+    """TokenBucket tests."""
+
+    def test_refill_capped_at_capacity(self):
+        bucket = TokenBucket(rate=100, burst_seconds=1.0, now=0.0)
+        bucket.take(100)
+        bucket.refill(10.0)
+        assert bucket.tokens == 100
+
+    def test_wait_time_for_debt(self):
+        bucket = TokenBucket(rate=100, burst_seconds=0.0, now=0.0)
+        bucket.take(250)
+        assert bucket.wait_time() == pytest.approx(2.5)
+
+
+class TestBandwidthLimiter:
+    """BandwidthLimiter tests."""
+
+    def test_unlimited_never_sleeps(self, clock):
+        limiter = make_limiter(clock, None)
+        limiter.consume("a", 10_000_000)
+        assert clock.slept == 0
+        assert limiter.rate is None
+
+    def test_global_rate_enforced(self, clock):
+        limiter = make_limiter(clock, 1000)
+        for _ in range(10):
+            limiter.consume("a", 500)
+        assert clock.slept == pytest.approx(5.0, rel=0.01)
+
+    def test_rate_shared_by_concurrent_downloads(self, clock):
+        limiter = make_limiter(clock, 1000)
+        limiter.register("a")
+        limiter.register("b")
+        assert limiter.share_rate("a") == pytest.approx(500)
+        limiter.unregister("b")
+        assert limiter.share_rate("a") == pytest.approx(1000)
+
+    def test_weights_split_the_limit(self, clock):
+        limiter = make_limiter(clock, 900)
+        limiter.register("a", weight=2.0)
+        limiter.register("b", weight=1.0)
+        assert limiter.share_rate("a") == pytest.approx(600)
+        assert limiter.share_rate("b") == pytest.approx(300)
+
+        limiter.set_weight("b", 2.0)
+        assert limiter.share_rate("b") == pytest.approx(450)
+
+    def test_share_limits_single_download(self, clock):
+        limiter = make_limiter(clock, 1000, idle_after=10.0)
+        limiter.register("a")
+        limiter.register("b")
+        limiter.consume("a", 1000)  # a's share is 500 B/s
+        assert clock.slept == pytest.approx(2.0, rel=0.01)
+
+    def test_idle_peer_share_is_reclaimed(self, clock):
+        limiter = make_limiter(clock, 1000)
+        limiter.register("a")
+        limiter.register("b")
+        limiter.consume("b", 100)  # b transfers, then pauses
+        clock.sleep(1.5)
+        clock.slept = 0.0
+
+        limiter.consume("a", 1000)  # b is still registered but idle
+        assert limiter.share_rate("a") == pytest.approx(1000)
+        assert clock.slept == pytest.approx(1.0, rel=0.01)
+
+    def test_idle_peer_rejoins_the_split(self, clock):
+        limiter = make_limiter(clock, 1000)
+        limiter.register("a")
+        limiter.register("b")
+        clock.sleep(2.0)
+        limiter.consume("a", 1)
+        assert limiter.share_rate("a") == pytest.approx(1000)
+        limiter.consume("b", 1)
+        assert limiter.share_rate("a") == pytest.approx(500)
+
+    def test_float_debt_does_not_spin(self, clock):
+        limiter = make_limiter(clock, 3)
+        for _ in range(100):
+            limiter.consume("a", 1)
+        assert clock.slept == pytest.approx(100 / 3, rel=0.01)
+
+    def test_live_rate_change_applies_to_waiting_consumer(self, clock):
+        limiter = make_limiter(clock, 100)
+        limiter._max_sleep = 0.2
+
+        def sleep_then_unlimit(seconds):
+            clock.sleep(seconds)
+            limiter.set_rate(None)
+
+        limiter._sleep = sleep_then_unlimit
+        limiter.consume("a", 10_000)  # Would take 100 s at the old rate
+        assert clock.slept <= 0.2 + 1e-9
+
+    def test_abort_stops_waiting(self, clock):
+        limiter = make_limiter(clock, 100)
+        limiter.consume("a", 10_000, should_abort=lambda: True)
+        assert clock.slept <= 0.2 + 1e-9
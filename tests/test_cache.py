@@ -0,0 +1,124 @@
+"""
+Tests for services/cache.py — Metadata cache tests.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from unittest.mock import patch
+
+from config import AppSettings
+from models import VideoInfo
+from services.cache import MetadataCache, estimate_size
+from services.downloader import DownloadService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def make_cache(clock, max_bytes=100, ttl=60.0):
+    """Cache where every value's size is its length."""
+    return MetadataCache(max_bytes, ttl, size_of=len, clock=clock)
+
+
+class TestMetadataCache:
+    """MetadataCache tests."""
+
+    def test_hit_and_miss(self, clock):
+        cache = make_cache(clock)
+        cache.put("a", "x" * 10)
+        assert cache.get("a") == "x" * 10
+        assert cache.get("b") is None
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_evicts_least_recently_used(self, clock):
+        cache = make_cache(clock)
+        cache.put("a", "x" * 40)
+        cache.put("b", "x" * 40)
+        cache.get("a")  # b becomes LRU
+        cache.put("c", "x" * 40)
+        assert "a" in cache and "c" in cache
+        assert "b" not in cache
+        assert cache.stats["evictions"] == 1
+        assert cache.size_bytes == 80
+
+    def test_replace_updates_size(self, clock):
+        cache = make_cache(clock)
+        cache.put("a", "x" * 40)
+        cache.put("a", "x" * 10)
+        assert cache.size_bytes == 10
+        assert len(cache) == 1
+
+    def test_oversized_entry_not_cached(self, clock):
+        cache = make_cache(clock)
+        cache.put("big", "x" * 101)
+        assert "big" not in cache
+        assert cache.size_bytes == 0
+
+    def test_entries_expire(self, clock):
+        cache = make_cache(clock, ttl=10.0)
+        cache.put("a", "x")
+        cache.put("b", "x", ttl=100.0)
+        clock.now = 11.0
+        assert "a" not in cache
+        assert cache.get("a") is None
+        assert cache.get("b") == "x"
+        assert cache.stats["expirations"] == 1
+        assert cache.size_bytes == 1
+
+    def test_dict_interface(self, clock):
+        cache = make_cache(clock)
+        cache["a"] = "x"
+        assert cache["a"] == "x"
+        with pytest.raises(KeyError):
+            cache["missing"]
+        assert cache.pop("a") == "x"
+        cache["b"] = "y"
+        cache.clear()
+        assert len(cache) == 0 and cache.size_bytes == 0
+
+    def test_estimate_size_counts_nested_data(self):
+        small = VideoInfo(url="u", raw_info={})
+        large = VideoInfo(url="u", raw_info={"formats": [{"url": "x" * 1000}] * 50})
+        assert estimate_size(large) > estimate_size(small) + 1000
+
+
+class TestServiceCache:
+    """DownloadService video info cache tests."""
+
+    def test_info_fetched_once(self):
+        service = DownloadService(AppSettings())
+        info = {"title": "T", "duration": 10}
+
+        class FakeYDL:
+            calls = 0
+
+            def extract_info(self, url, download=False):
+                FakeYDL.calls += 1
+                return info
+
+        from contextlib import contextmanager
+
+        @contextmanager
+        def checkout(opts):
+            yield FakeYDL()
+
+        with patch.object(service._ydl_pool, "checkout", side_effect=checkout):
+            first = service.get_video_info("https://youtube.com/watch?v=abc")
+            second = service.get_video_info("https://youtube.com/watch?v=abc")
+        assert first is second
+        assert FakeYDL.calls == 1
+        assert service.cache_stats["hits"] == 1
@@ -0,0 +1,258 @@
+"""
+Tests for services/concurrency.py — Adaptive concurrency and circuit breaker tests.
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from config import AppSettings, MAX_CONCURRENT_DOWNLOADS
+from models import DownloadItem, DownloadStatus, VideoInfo
+from services.concurrency import MB, BreakerState, CircuitBreaker, ConcurrencyController
+from services.downloader import DownloadService
+from services.retry import ErrorClass
+
+
+def run_epochs(controller, rates, active=None, start=0.0, total=0, epoch=5.0):
+    """Feed one saturated epoch per rate (MB/s); returns (time, total bytes)."""
+    now = start
+    controller.observe(now, total, active or controller.limit)
+    for rate in rates:
+        now += epoch
+        total += int(rate * MB * epoch)
+        controller.observe(now, total, active or controller.limit)
+    return now, total
+
+
+class TestCircuitBreaker:
+    """CircuitBreaker tests."""
+
+    def test_opens_on_failure_rate(self):
+        breaker = CircuitBreaker(window=10, min_samples=5, threshold=0.6, cooldown=60)
+        for ok in (True, False, False, True):
+            assert breaker.record(ok, 0.0) is False  # Too few samples
+        assert breaker.record(False, 1.0) is True  # 3 of 5 failed
+        assert breaker.state_at(30.0) == BreakerState.OPEN
+        assert breaker.open_until == 61.0
+
+    def test_isolated_failures_keep_it_closed(self):
+        breaker = CircuitBreaker(window=10, min_samples=5, threshold=0.6)
+        for n in range(20):
+            assert breaker.record(n % 3 != 0, float(n)) is False
+        assert breaker.state == BreakerState.CLOSED
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker(min_samples=1, threshold=1.0, cooldown=10, max_cooldown=25)
+        breaker.record(False, 0.0)
+        assert breaker.state_at(10.0) == BreakerState.HALF_OPEN
+        assert breaker.record(False, 10.0) is True  # Probe failed: doubled cool-down
+        assert breaker.open_until == 30.0
+        assert breaker.state_at(30.0) == BreakerState.HALF_OPEN
+        breaker.record(False, 30.0)
+        assert breaker.open_until == 55.0  # Capped at max_cooldown
+        breaker.state_at(55.0)
+        breaker.record(True, 55.0)
+        assert breaker.state == BreakerState.CLOSED
+        breaker.record(False, 60.0)
+        assert breaker.open_until == 70.0  # Back to the base cool-down
+
+
+class TestConcurrencyController:
+    """ConcurrencyController tests."""
+
+    def test_grows_while_throughput_improves(self):
+        controller = ConcurrencyController(initial=1, maximum=4)
+        run_epochs(controller, [2.0])
+        assert controller.limit == 2
+        run_epochs(controller, [4.0], start=100.0)
+        assert controller.limit == 3
+
+    def test_steps_back_without_gain(self):
+        controller = ConcurrencyController(initial=1, maximum=4)
+        now, total = run_epochs(controller, [2.0, 4.0, 4.1])  # +1 gained, +1 more didn't
+        assert controller.limit == 2
+        run_epochs(controller, [4.0] * 5, start=now, total=total)
+        assert controller.limit == 2  # Settled until the re-probe period
+
+    def test_unsaturated_epochs_ignored(self):
+        controller = ConcurrencyController(initial=2, maximum=4)
+        run_epochs(controller, [5.0, 5.0], active=1)
+        assert controller.limit == 2
+
+    def test_collapse_cuts(self):
+        controller = ConcurrencyController(initial=4, maximum=4)
+        now, total = run_epochs(controller, [8.0, 8.0])
+        run_epochs(controller, [2.0], start=now, total=total)
+        assert controller.limit == 2
+
+    def test_throttling_cuts_once_per_epoch(self):
+        controller = ConcurrencyController(initial=8, maximum=8, epoch=5.0)
+        controller.record(0.0, ErrorClass.THROTTLED)
+        controller.record(1.0, ErrorClass.THROTTLED)  # Same wave of 429s
+        assert controller.limit == 4
+        controller.record(6.0, ErrorClass.THROTTLED)
+        controller.record(12.0, ErrorClass.THROTTLED)
+        assert controller.limit == 1
+
+    def test_gate_follows_limit_and_breaker(self):
+        controller = ConcurrencyController(
+            initial=3, maximum=3, breaker=CircuitBreaker(min_samples=2, threshold=1.0, cooldown=30),
+        )
+        assert controller.allowed(0.0, 2) and not controller.allowed(0.0, 3)
+        controller.record(0.0, ErrorClass.PERMANENT)  # The video's fault
+        controller.record(0.0, ErrorClass.TRANSIENT)
+        assert controller.record(1.0, ErrorClass.TRANSIENT) is True
+        assert not controller.allowed(2.0, 0)
+        assert controller.next_check(2.0) == 31.0
+        assert controller.allowed(31.0, 0) and not controller.allowed(31.0, 1)  # Half-open
+        controller.record(40.0)
+        assert controller.breaker_state == BreakerState.CLOSED
+        assert controller.allowed(40.0, 2)
+
+    def test_fixed_limit(self):
+        controller = ConcurrencyController(initial=2, maximum=2, adaptive=False)
+        for n in range(10):
+            controller.record(float(n), ErrorClass.THROTTLED)
+        run_epochs(controller, [1.0, 10.0])
+        assert controller.limit == 2
+        assert controller.allowed(0.0, 1) and not controller.allowed(0.0, 2)
+        assert controller.next_check(0.0) is None
+
+    def test_reset_only_on_changed_settings(self):
+        controller = ConcurrencyController(initial=4, maximum=8)
+        controller.record(0.0, ErrorClass.THROTTLED)
+        controller.reset(4, adaptive=True)
+        assert controller.limit == 2  # Same settings: keeps the cut
+        controller.reset(6, adaptive=True)
+        assert controller.limit == 6
+        controller.reset(6, adaptive=False)
+        assert not controller.adaptive and controller.next_check(0.0) is None
+
+    def test_set_maximum(self):
+        controller = ConcurrencyController(initial=4, maximum=4)
+        controller.record(0.0, ErrorClass.THROTTLED)
+        controller.set_maximum(8)
+        assert controller.limit == 2  # More room to grow, not a higher limit
+        controller.set_maximum(1)
+        assert controller.limit == 1
+        fixed = ConcurrencyController(initial=2, maximum=2, adaptive=False)
+        fixed.set_maximum(5)
+        assert fixed.limit == 5
+
+
+class TestServiceConcurrency:
+    """DownloadService gating tests."""
+
+    @staticmethod
+    def make_items(count):
+        return [DownloadItem(video_info=VideoInfo(url=f"https://youtube.com/watch?v=cc{n:09d}",
+                                                  title=f"V{n}"))
+                for n in range(count)]
+
+    def test_limit_caps_running_downloads(self):
+        service = DownloadService(AppSettings(max_concurrent=4, prefetch_depth=0))
+        service._concurrency.record(0.0, ErrorClass.THROTTLED)  # 4 -> 2
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        done = threading.Event()
+
+        def fake_download(item):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        service._download_item = fake_download
+        service.set_callbacks(on_all_complete=done.set)
+        service.add_many(self.make_items(6))
+        service.start()
+        assert done.wait(5)
+
+        assert state["peak"] == 2
+        assert service.completed_count == 6
+
+    def test_pool_sized_for_growth(self):
+        service = DownloadService(AppSettings(max_concurrent=2, prefetch_depth=0))
+        assert service._max_workers() == MAX_CONCURRENT_DOWNLOADS
+        assert service._concurrency.limit == 2  # Starts at the setting
+        fixed = DownloadService(AppSettings(max_concurrent=2, adaptive_concurrency=False))
+        assert fixed._max_workers() == 2
+
+    def test_limit_grows_with_throughput(self):
+        service = DownloadService(AppSettings(max_concurrent=1, prefetch_depth=0))
+        service._concurrency = ConcurrencyController(initial=1, maximum=4, epoch=0.05)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        done = threading.Event()
+
+        def fake_download(item):
+            slot = service._progress[item.url]
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            for _ in range(20):  # Every download adds bandwidth: ~100 MB/s each
+                slot.transferred_bytes += MB
+                time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        service._download_item = fake_download
+        service.set_callbacks(on_all_complete=done.set)
+        service.add_many(self.make_items(24))
+        service.start()
+        assert done.wait(10)
+
+        assert service.completed_count == 24
+        assert state["peak"] > 1
+        assert service._concurrency.limit > 1
+
+    def test_open_breaker_holds_the_queue(self):
+        service = DownloadService(AppSettings(max_concurrent=1, prefetch_depth=0))
+        service._concurrency = ConcurrencyController(
+            initial=1, maximum=1,
+            breaker=CircuitBreaker(min_samples=2, threshold=1.0, cooldown=0.3),
+        )
+        calls = []
+        done = threading.Event()
+
+        def fake_download(item):
+            calls.append((time.monotonic(), item.title))
+            if len(calls) <= 2:
+                service._last_errors[item.url] = ErrorClass.TRANSIENT
+                item.status = DownloadStatus.FAILED
+                return False
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        service._download_item = fake_download
+        service.RETRY_DELAY = 0
+        service.set_callbacks(on_all_complete=done.set)
+        service.add_many(self.make_items(2))
+        service.start()
+        assert done.wait(5)
+
+        assert service.completed_count == 2
+        assert calls[2][0] - calls[1][0] >= 0.25  # Waited out the cool-down
+        assert service._concurrency.breaker_state == BreakerState.CLOSED
+
+    def test_finished_downloads_keep_their_bytes(self):
+        service = DownloadService(AppSettings(prefetch_depth=0))
+        service.add_to_queue(self.make_items(1)[0])
+        with service._lock:
+            item, _, _ = service._poll_work(0, service._generation)
+
+        def fake_attempt(item):
+            service._progress[item.url].transferred_bytes = 3 * MB
+
+        service._download_item_with_retry = fake_attempt
+        service._run_claimed(0, item)
+        assert service._finished_bytes == 3 * MB
+        assert not service._progress
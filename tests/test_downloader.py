@@ -6,6 +6,9 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 
+import threading
+import time
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -189,12 +192,31 @@ class TestBuildYdlOpts:
         pp_keys = [p["key"] for p in opts["postprocessors"]]
         assert "FFmpegExtractAudio" in pp_keys
 
-    def test_metadata_postprocessor_always_added(self, service, sample_item):
-        """FFmpegMetadata should always be included."""
+    def test_metadata_postprocessor_always_added(self, settings, sample_item):
+        """FFmpegMetadata should always be included (yt-dlp postprocessor chain)."""
+        settings.single_pass_mux = False
+        service = DownloadService(settings)
         opts = service._build_ydl_opts(sample_item, "/tmp/test")
         pp_keys = [p["key"] for p in opts["postprocessors"]]
         assert "FFmpegMetadata" in pp_keys
 
+    def test_single_pass_replaces_chain(self, settings, sample_item):
+        """With the single-pass mux, video gets no separate embed/metadata runs."""
+        settings.subtitle_enabled = True
+        service = DownloadService(settings)
+        opts = service._build_ydl_opts(sample_item, "/tmp/test")
+        pp_keys = [p["key"] for p in opts["postprocessors"]]
+        assert "FFmpegMetadata" not in pp_keys
+        assert "FFmpegEmbedSubtitle" not in pp_keys
+        assert opts["writesubtitles"] is True  # Still downloaded, muxed in the same pass
+        assert service._mux_options(sample_item) == {"embed_subtitles": True}
+
+    def test_single_pass_video_only(self, service):
+        item = DownloadItem(video_info=VideoInfo(url="test", title="A"), format=DownloadFormat.AUDIO)
+        pp_keys = [p["key"] for p in service._build_ydl_opts(item, "/tmp/test")["postprocessors"]]
+        assert "FFmpegMetadata" in pp_keys
+        assert service._mux_options(item) is None
+
     def test_video_best_quality(self, service):
         info = VideoInfo(url="test", title="Best Quality")
         item = DownloadItem(video_info=info, format=DownloadFormat.VIDEO, quality="best")
@@ -205,6 +227,7 @@ class TestBuildYdlOpts:
         settings.subtitle_enabled = True
         settings.subtitle_language = "en"
         settings.embed_subtitles = True
+        settings.single_pass_mux = False
         service = DownloadService(settings)
 
         info = VideoInfo(url="test", title="Sub Test")
@@ -231,6 +254,7 @@ class TestBuildYdlOpts:
         assert "FFmpegEmbedSubtitle" not in pp_keys
 
     def test_speed_limit(self, settings):
+        """Speed limit is global (shared bucket), not a per-download ratelimit."""
         settings.speed_limit = 5 * 1024 * 1024
         service = DownloadService(settings)
 
@@ -238,7 +262,15 @@ class TestBuildYdlOpts:
         item = DownloadItem(video_info=info)
         opts = service._build_ydl_opts(item, "/tmp/test")
 
-        assert opts["ratelimit"] == 5 * 1024 * 1024
+        assert "ratelimit" not in opts
+        assert service.speed_limit == 5 * 1024 * 1024
+
+    def test_set_speed_limit_live(self, service):
+        service.set_speed_limit(1024 * 1024)
+        assert service.speed_limit == 1024 * 1024
+        assert service._settings.speed_limit == 1024 * 1024
+        service.set_speed_limit(None)
+        assert service.speed_limit is None
 
     def test_no_speed_limit(self, service, sample_item):
         opts = service._build_ydl_opts(sample_item, "/tmp/test")
@@ -267,6 +299,156 @@ class TestPauseResume:
         assert service.is_running is False
 
 
+def _fill_queue(service, count, prefix="item"):
+    """Add ``count`` distinct items to the service queue."""
+    for i in range(count):
+        info = VideoInfo(url=f"https://youtube.com/watch?v={prefix}{i}", title=f"Video {i}")
+        service.add_to_queue(DownloadItem(video_info=info))
+
+
+def _wait_until(predicate, timeout=5.0):
+    """Poll ``predicate`` until it is true or the timeout expires."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return predicate()
+
+
+class TestConcurrentWorkers:
+    """N-worker engine tests."""
+
+    def test_workers_run_in_parallel(self, settings):
+        settings.max_concurrent = 3
+        service = DownloadService(settings)
+        _fill_queue(service, 6)
+
+        lock = threading.Lock()
+        running = {"now": 0, "peak": 0}
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_download(item):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            try:
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                pass
+            with lock:
+                running["now"] -= 1
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        done = threading.Event()
+        service.set_callbacks(on_all_complete=done.set)
+        with patch.object(service, "_download_item", side_effect=fake_download):
+            service.start()
+            assert done.wait(5)
+
+        assert running["peak"] == 3
+        assert service.completed_count == 6
+        assert service.is_running is False
+
+    def test_each_item_claimed_once(self, settings):
+        settings.max_concurrent = 4
+        service = DownloadService(settings)
+        _fill_queue(service, 40)
+
+        seen = []
+        seen_lock = threading.Lock()
+
+        def fake_download(item):
+            with seen_lock:
+                seen.append(item.url)
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        done = threading.Event()
+        service.set_callbacks(on_all_complete=done.set)
+        with patch.object(service, "_download_item", side_effect=fake_download):
+            service.start()
+            assert done.wait(5)
+
+        assert len(seen) == 40
+        assert len(set(seen)) == 40
+
+    def test_all_complete_fires_once(self, settings):
+        settings.max_concurrent = 4
+        settings.adaptive_concurrency = False  # Six failures in a row would open the breaker
+        service = DownloadService(settings)
+        _fill_queue(service, 2)
+
+        on_all_complete = MagicMock()
+        service.set_callbacks(on_all_complete=on_all_complete)
+
+        def fake_download(item):
+            item.status = DownloadStatus.FAILED
+            return False
+
+        with patch.object(service, "_download_item", side_effect=fake_download), \
+                patch.object(DownloadService, "RETRY_DELAY", 0):
+            service.start()
+            assert _wait_until(lambda: service.worker_count == 0)
+
+        on_all_complete.assert_called_once()
+        assert service.failed_count == 2
+        assert service.current_item is None
+
+    def test_pool_survives_briefly_empty_queue(self, settings):
+        settings.max_concurrent = 3
+        settings.adaptive_concurrency = False  # Fixed pool of max_concurrent workers
+        service = DownloadService(settings)
+        _fill_queue(service, 1)
+        release = threading.Event()
+
+        def fake_download(item):
+            release.wait(5)
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        done = threading.Event()
+        service.set_callbacks(on_all_complete=done.set)
+        with patch.object(service, "_download_item", side_effect=fake_download):
+            service.start()
+            assert _wait_until(lambda: len(service.active_items) == 1)
+            _fill_queue(service, 6, prefix="late")
+            service.start()
+            assert _wait_until(lambda: len(service.active_items) == 3)
+            assert service.worker_count == 3
+            release.set()
+            assert done.wait(5)
+
+        assert service.completed_count == 7
+
+    def test_restart_does_not_leak_workers(self, settings):
+        settings.max_concurrent = 2
+        settings.adaptive_concurrency = False  # Fixed pool of max_concurrent workers
+        service = DownloadService(settings)
+        _fill_queue(service, 4)
+        release = threading.Event()
+
+        def fake_download(item):
+            while not release.is_set() and not service._is_cancelled(item):
+                time.sleep(0.01)
+            return False
+
+        with patch.object(service, "_download_item", side_effect=fake_download), \
+                patch.object(DownloadService, "RETRY_DELAY", 0):
+            service.start()
+            service.cancel()
+            service.start()
+            assert service.worker_count == 2
+            assert _wait_until(lambda: sum(
+                t.is_alive() for t in threading.enumerate()
+                if t.name.startswith("DownloadWorker-")
+            ) == 2)
+            release.set()
+            service.cancel()
+            assert _wait_until(lambda: service.worker_count == 0)
+
+
 class TestCallbacks:
     """Callback registration tests."""
 
@@ -305,3 +487,359 @@ class TestCache:
 
         service.clear_cache()
         assert len(service._video_info_cache) == 0
+
+
+class TestItemControls:
+    """Per-item pause/resume/cancel handle tests."""
+
+    def test_control_checkpoint_raises_when_cancelled(self):
+        from services.downloader import DownloadControl, DownloadCancelled
+        control = DownloadControl()
+        control.checkpoint()  # Not paused, not cancelled: no-op
+        control.cancel()
+        with pytest.raises(DownloadCancelled):
+            control.checkpoint()
+
+    def test_cancel_unblocks_paused_control(self):
+        from services.downloader import DownloadControl, DownloadCancelled
+        control = DownloadControl()
+        control.pause()
+        assert control.is_paused is True
+
+        errors = []
+
+        def waiter():
+            try:
+                control.checkpoint()
+            except DownloadCancelled as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        control.cancel()
+        thread.join(timeout=2)
+        assert not thread.is_alive()
+        assert len(errors) == 1
+
+    def test_pause_pending_item_holds_it(self, service, sample_item):
+        service.add_to_queue(sample_item)
+        assert service.pause_item(sample_item) is True
+        assert sample_item.status == DownloadStatus.PAUSED
+        assert service._claim_next_item() is None
+
+        assert service.resume_item(sample_item) is True
+        assert sample_item.status == DownloadStatus.PENDING
+        assert service._claim_next_item() is sample_item
+
+    def test_pause_one_item_does_not_block_others(self, settings):
+        settings.max_concurrent = 2
+        service = DownloadService(settings)
+        _fill_queue(service, 2, prefix="ctl")
+        slow, fast = service.queue
+
+        fast_done = threading.Event()
+        slow_started = threading.Event()
+
+        def fake_download(item):
+            if item is slow:
+                from services.downloader import DownloadCancelled
+                slow_started.set()
+                # Simulate yt-dlp chunks calling the progress hook
+                try:
+                    for _ in range(200):
+                        service._progress_hook({"status": "downloading"}, item)
+                        time.sleep(0.01)
+                except DownloadCancelled:
+                    return False
+            else:
+                assert slow_started.wait(2)
+                service.pause_item(slow)
+                fast_done.set()
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        done = threading.Event()
+        service.set_callbacks(on_all_complete=done.set)
+        with patch.object(service, "_download_item", side_effect=fake_download):
+            service.start()
+            assert fast_done.wait(3)
+            assert _wait_until(lambda: service.get_control(slow) is not None
+                               and service.get_control(slow).is_paused)
+            service.cancel_item(slow)
+            assert done.wait(5)
+
+        assert slow.status == DownloadStatus.CANCELLED
+        assert fast.status == DownloadStatus.COMPLETED
+        assert service.completed_count == 1
+        assert service.failed_count == 0
+
+
+class TestInfoReuse:
+    """Reusing the extracted info dict for the download."""
+
+    class FakeYDL:
+        def __init__(self, fail_reuse=False):
+            self.calls = []
+            self.fail_reuse = fail_reuse
+
+        @staticmethod
+        def sanitize_info(info, remove_private_keys=False):
+            return dict(info)
+
+        def process_ie_result(self, info, download=True):
+            self.calls.append(("process", info["id"]))
+            if self.fail_reuse:
+                import yt_dlp
+                raise yt_dlp.utils.DownloadError("HTTP Error 403: Forbidden")
+
+        def download(self, urls):
+            self.calls.append(("download", urls[0]))
+
+    def _item(self, expire):
+        raw = {"id": "test123456", "formats": [
+            {"format_id": "18", "url": f"https://rr1.googlevideo.com/videoplayback?expire={expire}"}]}
+        info = VideoInfo(url="https://youtube.com/watch?v=test123456", title="T", raw_info=raw)
+        return DownloadItem(video_info=info)
+
+    def test_fresh_info_not_re_extracted(self, service):
+        ydl = self.FakeYDL()
+        service._run_download(ydl, self._item(time.time() + 6 * 3600))
+        assert ydl.calls == [("process", "test123456")]
+
+    def test_expired_urls_re_extracted(self, service):
+        ydl = self.FakeYDL()
+        item = self._item(time.time() + 60)  # Inside the safety margin
+        service._run_download(ydl, item)
+        assert ydl.calls == [("download", item.url)]
+
+    def test_stored_info_without_urls_re_extracted(self, service):
+        info = VideoInfo(url="https://youtube.com/watch?v=test123456",
+                         raw_info={"id": "test123456", "formats": [{"format_id": "18"}]})
+        ydl = self.FakeYDL()
+        service._run_download(ydl, DownloadItem(video_info=info))
+        assert ydl.calls[0][0] == "download"
+
+    def test_failed_reuse_falls_back(self, service):
+        ydl = self.FakeYDL(fail_reuse=True)
+        item = self._item(time.time() + 6 * 3600)
+        service._run_download(ydl, item)
+        assert [c[0] for c in ydl.calls] == ["process", "download"]
+
+    def test_quality_change_on_queued_item(self, service, sample_item):
+        service.add_to_queue(sample_item)
+        assert service.set_item_quality(sample_item, quality="720p") is True
+        assert sample_item.quality == "720p"
+        opts = service._build_ydl_opts(sample_item, "/tmp")
+        assert "height<=720" in opts["format"]
+
+    def test_quality_change_rejected_when_done(self, service, sample_item):
+        service.add_to_queue(sample_item)
+        sample_item.status = DownloadStatus.COMPLETED
+        assert service.set_item_quality(sample_item, quality="720p") is False
+
+
+class TestPlaylistStreaming:
+    """Streaming playlist ingestion tests."""
+
+    class LazyPlaylistYDL:
+        """extract_info(process=False) with a lazy entries generator."""
+
+        def __init__(self, count, produced):
+            self.count = count
+            self.produced = produced
+
+        def extract_info(self, url, download=False, process=True):
+            assert process is False
+
+            def entries():
+                for n in range(self.count):
+                    self.produced.append(n)
+                    yield {"_type": "url", "id": f"pl{n:09d}", "title": f"Entry {n}", "duration": 60}
+
+            return {"_type": "playlist", "entries": entries()}
+
+    def _patch_pool(self, service, count, produced):
+        from contextlib import contextmanager
+
+        @contextmanager
+        def checkout(opts):
+            yield self.LazyPlaylistYDL(count, produced)
+
+        return patch.object(service._ydl_pool, "checkout", side_effect=checkout)
+
+    def test_entries_yielded_lazily(self, service):
+        produced = []
+        with self._patch_pool(service, 1000, produced):
+            entries = service.iter_playlist_entries("https://youtube.com/playlist?list=PL1")
+            first = next(entries)
+            assert first.url == "https://www.youtube.com/watch?v=pl000000000"
+            assert len(produced) == 1
+            entries.close()
+
+    def test_ingest_in_growing_chunks(self, service):
+        changes = []
+        service.set_callbacks(on_queue_changed=lambda: changes.append(service.queue_count))
+        make = lambda info: DownloadItem(video_info=info, group="PL1")
+        with self._patch_pool(service, 100, []):
+            added, skipped = service.ingest_playlist("https://youtube.com/playlist?list=PL1", make)
+        assert (added, skipped) == (100, 0)
+        assert changes == [10, 30, 70, 100]  # One notification per chunk, not per item
+
+    def test_first_chunk_queued_before_enumeration_ends(self, service):
+        produced = []
+        queued_at_first_chunk = []
+        make = lambda info: DownloadItem(video_info=info)
+        on_chunk = lambda added, skipped: queued_at_first_chunk.append((service.queue_count, len(produced)))
+        with self._patch_pool(service, 500, produced):
+            service.ingest_playlist("https://youtube.com/playlist?list=PL1", make, on_chunk)
+        assert queued_at_first_chunk[0] == (10, 10)
+
+    def test_add_many_skips_duplicates(self, service, sample_item):
+        service.add_to_queue(sample_item)
+        other = DownloadItem(video_info=VideoInfo(url="https://youtube.com/watch?v=other000000"))
+        again = DownloadItem(video_info=VideoInfo(url=other.url))
+        added = service.add_many([sample_item, other, again])
+        assert added == [other]
+        assert service.queue_count == 2
+
+
+class TestBulkQueueOperations:
+    """add_many / remove_many / update_many tests."""
+
+    def _items(self, count, prefix="bulk"):
+        return [
+            DownloadItem(video_info=VideoInfo(url=f"https://youtube.com/watch?v={prefix}{n:07d}"))
+            for n in range(count)
+        ]
+
+    def _record(self, service):
+        changes = []
+        service.set_callbacks(on_queue_delta=changes.append)
+        return changes
+
+    def test_add_many_emits_one_delta(self, service):
+        changes = self._record(service)
+        items = self._items(50)
+        assert service.add_many(items + items[:5]) == items
+        assert len(changes) == 1
+        assert changes[0].added == items
+        assert not changes[0].removed
+
+    def test_add_to_queue_emits_delta(self, service, sample_item):
+        changes = self._record(service)
+        service.add_to_queue(sample_item)
+        assert changes[0].added == [sample_item]
+
+    def test_remove_many(self, service):
+        items = self._items(5)
+        service.add_many(items)
+        changes = self._record(service)
+        removed = service.remove_many([items[1], items[3], self._items(1, "gone")[0]])
+        assert removed == [items[1], items[3]]
+        assert [i.url for i in service.queue] == [items[n].url for n in (0, 2, 4)]
+        assert not service.is_duplicate(items[1].url)
+        assert len(changes) == 1 and changes[0].removed == removed
+        assert service._pop_pending() is items[0]  # Scheduler forgot removed items
+        assert service._pop_pending() is items[2]
+
+    def test_remove_many_nothing_queued_is_silent(self, service):
+        changes = self._record(service)
+        assert service.remove_many(self._items(2)) == []
+        assert changes == []
+
+    def test_update_many_quality_skips_active(self, service):
+        items = self._items(3)
+        service.add_many(items)
+        items[0].status = DownloadStatus.DOWNLOADING
+        changes = self._record(service)
+        updated = service.update_many(items, quality="720p")
+        assert updated == items[1:]
+        assert items[0].quality == "best"
+        assert len(changes) == 1 and changes[0].updated == updated
+
+    def test_update_many_priority_reorders_scheduler(self, service):
+        service.set_scheduling_policy("priority")
+        items = self._items(3)
+        service.add_many(items)
+        service.update_many([items[2]], priority=5)
+        assert service._pop_pending() is items[2]
+
+    def test_retry_failed_emits_updates(self, service):
+        items = self._items(2)
+        service.add_many(items)
+        for item in items:
+            item.status = DownloadStatus.FAILED
+        changes = self._record(service)
+        assert service.retry_failed() == 2
+        assert len(changes) == 1 and changes[0].updated == items
+
+
+class TestOutputPath:
+    """The final file path comes from yt-dlp's hooks, not a directory scan."""
+
+    class HookYDL:
+        """Fires the hooks yt-dlp would for a merged download with subtitles."""
+
+        def __init__(self, opts, events):
+            self.opts = opts
+            self.events = events
+
+        def download(self, urls):
+            for kind, payload in self.events:
+                for hook in self.opts.get(kind, []):
+                    hook(payload)
+
+    def _run(self, service, item, events, tmp_path):
+        from contextlib import contextmanager
+
+        @contextmanager
+        def checkout(opts):
+            yield self.HookYDL(opts, events)
+
+        service._settings.output_dir = str(tmp_path)
+        service.add_to_queue(item)
+        service._claim_next_item()
+        with patch.object(service._ydl_pool, "checkout", side_effect=checkout):
+            return service._download_item(item)
+
+    def test_merged_video_path(self, service, sample_item, tmp_path):
+        merged = str(tmp_path / "Test Video.mp4")
+        events = [
+            ("progress_hooks", {"status": "finished", "filename": str(tmp_path / "Test Video.f137.mp4")}),
+            ("progress_hooks", {"status": "finished", "filename": str(tmp_path / "Test Video.f140.m4a")}),
+            ("postprocessor_hooks", {"status": "started", "postprocessor": "Merger",
+                                     "info_dict": {"filepath": merged}}),
+            ("postprocessor_hooks", {"status": "started", "postprocessor": "FFmpegMetadata",
+                                     "info_dict": {"filepath": merged}}),
+            ("post_hooks", merged),
+        ]
+        assert self._run(service, sample_item, events, tmp_path) is True
+        assert sample_item.filepath == merged
+
+    def test_extract_audio_rename(self, service, sample_item, tmp_path):
+        sample_item.format = DownloadFormat.AUDIO
+        source = str(tmp_path / "Test Video.webm")
+        mp3 = str(tmp_path / "Test Video.mp3")
+        events = [
+            ("progress_hooks", {"status": "finished", "filename": source}),
+            ("postprocessor_hooks", {"status": "started", "postprocessor": "ExtractAudio",
+                                     "info_dict": {"filepath": source}}),
+            # "finished" carries the pre-run copy; it must not undo the rename
+            ("postprocessor_hooks", {"status": "finished", "postprocessor": "ExtractAudio",
+                                     "info_dict": {"filepath": source}}),
+            ("postprocessor_hooks", {"status": "started", "postprocessor": "FFmpegMetadata",
+                                     "info_dict": {"filepath": mp3}}),
+        ]
+        assert self._run(service, sample_item, events, tmp_path) is True
+        assert sample_item.filepath == mp3
+
+    def test_no_directory_scan(self, service, sample_item, tmp_path):
+        (tmp_path / "Someone else.mp4").write_bytes(b"x")
+        final = str(tmp_path / "Test Video.mp4")
+        with patch("os.listdir", side_effect=AssertionError("directory scanned")):
+            assert self._run(service, sample_item, [("post_hooks", final)], tmp_path) is True
+        assert sample_item.filepath == final
+
+    def test_hooks_in_ydl_opts(self, service, sample_item):
+        opts = service._build_ydl_opts(sample_item, "/tmp")
+        assert opts["postprocessor_hooks"] and opts["post_hooks"]
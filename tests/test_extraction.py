@@ -0,0 +1,99 @@
+"""
+Tests for services/extraction.py — Process-pool extraction tests.
+"""
+
+import sys
+import os
+import pickle
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+import yt_dlp
+
+from config import AppSettings
+from models import VideoInfo
+from services.downloader import DownloadService
+from services.extraction import ProcessExtractor, trim_info
+
+
+SAMPLE_INFO = {
+    "id": "abc123DEF45",
+    "title": "Sample",
+    "duration": 61,
+    "formats": [{"format_id": "18", "url": "https://rr1.googlevideo.com/videoplayback?expire=1"}],
+    "thumbnails": [{"url": f"https://i.ytimg.com/{n}.jpg"} for n in range(40)],
+    "heatmap": [{"start_time": n, "value": 0.5} for n in range(100)],
+    "automatic_captions": {
+        "en": [{"ext": "vtt"}], "en-US": [{"ext": "vtt"}], "de": [{"ext": "vtt"}], "fr": [{"ext": "vtt"}],
+    },
+    "subtitles": {"en": [{"ext": "vtt"}]},
+}
+
+
+class TestTrimInfo:
+    """Payload trimming tests."""
+
+    def test_drops_bulky_fields_keeps_formats(self):
+        trimmed = trim_info(SAMPLE_INFO)
+        assert "thumbnails" not in trimmed and "heatmap" not in trimmed
+        assert trimmed["formats"] == SAMPLE_INFO["formats"]
+        assert trimmed["subtitles"] == SAMPLE_INFO["subtitles"]
+        assert "thumbnails" in SAMPLE_INFO  # Input untouched
+
+    def test_captions_cut_to_wanted_languages(self):
+        trimmed = trim_info(SAMPLE_INFO, ["en"])
+        assert sorted(trimmed["automatic_captions"]) == ["en", "en-US"]
+        assert len(trim_info(SAMPLE_INFO)["automatic_captions"]) == 4
+
+    def test_payload_is_picklable_and_smaller(self):
+        info = VideoInfo.from_yt_dlp("https://youtube.com/watch?v=abc123DEF45", trim_info(SAMPLE_INFO, ["en"]))
+        full = VideoInfo.from_yt_dlp("https://youtube.com/watch?v=abc123DEF45", SAMPLE_INFO)
+        restored = pickle.loads(pickle.dumps(info))
+        assert restored == info
+        assert len(pickle.dumps(info)) < len(pickle.dumps(full)) / 2
+
+
+class TestProcessExtractor:
+    """Worker-process round trips (no network)."""
+
+    def test_errors_cross_the_process_boundary(self):
+        extractor = ProcessExtractor(DownloadService._INFO_OPTS, processes=1)
+        try:
+            with pytest.raises(yt_dlp.utils.DownloadError, match="not a valid URL"):
+                extractor.extract("notaurl")
+        finally:
+            extractor.shutdown()
+
+    def test_shut_down_rejects_work(self):
+        extractor = ProcessExtractor(DownloadService._INFO_OPTS)
+        extractor.shutdown()
+        with pytest.raises(RuntimeError):
+            extractor.submit("https://youtube.com/watch?v=abc123DEF45")
+
+
+class TestServiceBackend:
+    """DownloadService uses the process backend when configured."""
+
+    def test_threads_by_default(self):
+        assert DownloadService(AppSettings())._extractor is None
+
+    def test_extraction_goes_to_processes(self):
+        service = DownloadService(AppSettings(metadata_processes=2, subtitle_language="de"))
+        calls = []
+
+        class FakeExtractor:
+            def extract(self, url, caption_langs=None):
+                calls.append((url, caption_langs))
+                return VideoInfo.from_yt_dlp(url, trim_info(SAMPLE_INFO, caption_langs))
+
+            def shutdown(self):
+                calls.append("shutdown")
+
+        service._extractor = FakeExtractor()
+        url = "https://youtube.com/watch?v=abc123DEF45"
+        info = service.get_video_info(url)
+        assert info.title == "Sample"
+        assert calls == [(url, ["de"])]
+        assert service.get_video_info(url) is info  # Cached like thread results
+        service.shutdown()
+        assert calls[-1] == "shutdown"
@@ -0,0 +1,125 @@
+"""
+Tests for services/fetcher.py — Bounded, coalescing metadata fetch tests.
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from unittest.mock import patch
+
+from config import AppSettings
+from models import VideoInfo
+from services.fetcher import MetadataFetcher
+from services.downloader import DownloadService
+
+
+def url_for(n):
+    return f"https://youtube.com/watch?v=vid{n:08d}"
+
+
+class SlowResolver:
+    """Counts calls and tracks the peak number of concurrent calls."""
+
+    def __init__(self, delay=0.05, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = []
+        self.running = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, url):
+        with self.lock:
+            self.calls.append(url)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(self.delay)
+        with self.lock:
+            self.running -= 1
+        if url in self.fail:
+            raise RuntimeError("Video unavailable")
+        return VideoInfo(url=url, title=url[-4:])
+
+
+class TestMetadataFetcher:
+    """MetadataFetcher tests."""
+
+    def test_concurrency_is_bounded(self):
+        resolver = SlowResolver(delay=0.02)
+        fetcher = MetadataFetcher(resolver, resolver, max_workers=3)
+        results = list(fetcher.fetch_many(url_for(n) for n in range(20)))
+        assert len(results) == 20
+        assert resolver.peak <= 3
+
+    def test_same_video_coalesced(self):
+        resolver = SlowResolver(delay=0.1)
+        fetcher = MetadataFetcher(resolver, resolver, max_workers=4)
+        first = fetcher.submit("https://youtube.com/watch?v=abcdefghijk")
+        second = fetcher.submit("https://youtu.be/abcdefghijk")
+        assert first is second
+        first.result()
+        assert len(resolver.calls) == 1
+        assert fetcher.stats["coalesced"] == 1
+
+    def test_fresh_request_satisfies_cached_one(self):
+        lookup, refresh = SlowResolver(), SlowResolver(delay=0.1)
+        fetcher = MetadataFetcher(lookup, refresh)
+        fresh = fetcher.submit(url_for(1), fresh=True)
+        assert fetcher.submit(url_for(1)) is fresh
+        fresh.result()
+        assert lookup.calls == []
+
+    def test_cached_request_does_not_satisfy_fresh(self):
+        lookup, refresh = SlowResolver(delay=0.1), SlowResolver()
+        fetcher = MetadataFetcher(lookup, refresh)
+        cached = fetcher.submit(url_for(1))
+        assert fetcher.submit(url_for(1), fresh=True) is not cached
+
+    def test_results_streamed_in_completion_order(self):
+        def resolver(url):
+            time.sleep(0.2 if url == url_for(0) else 0.01)
+            return VideoInfo(url=url)
+
+        fetcher = MetadataFetcher(resolver, resolver, max_workers=2)
+        urls = [url for url, _, _ in fetcher.fetch_many([url_for(0), url_for(1)])]
+        assert urls == [url_for(1), url_for(0)]
+
+    def test_errors_delivered_per_url(self):
+        resolver = SlowResolver(delay=0, fail={url_for(1)})
+        fetcher = MetadataFetcher(resolver, resolver)
+        results = {url: (info, error) for url, info, error in
+                   fetcher.fetch_many([url_for(0), url_for(1)])}
+        assert results[url_for(0)][0].url == url_for(0)
+        assert isinstance(results[url_for(1)][1], RuntimeError)
+
+    def test_async_callback(self):
+        resolver = SlowResolver(delay=0)
+        fetcher = MetadataFetcher(resolver, resolver)
+        got = []
+        done = threading.Event()
+
+        def on_result(url, info, error):
+            got.append(url)
+            if len(got) == 3:
+                done.set()
+
+        fetcher.fetch_many_async([url_for(n) for n in range(3)], on_result)
+        assert done.wait(3)
+        assert sorted(got) == [url_for(n) for n in range(3)]
+
+
+class TestServiceFetcher:
+    """DownloadService metadata pool tests."""
+
+    def test_batch_uses_bounded_pool(self):
+        service = DownloadService(AppSettings(metadata_workers=2))
+        resolver = SlowResolver(delay=0.02)
+        with patch.object(service, "get_video_info", side_effect=resolver):
+            results = list(service.fetch_video_infos([url_for(n) for n in range(10)]))
+        assert len(results) == 10
+        assert resolver.peak <= 2
+        service.shutdown()
@@ -0,0 +1,163 @@
+"""
+Tests for services/ffmpeg_mux.py — Single-pass FFmpeg mux tests.
+"""
+
+import sys
+import os
+from unittest.mock import patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+import yt_dlp
+from yt_dlp.postprocessor.ffmpeg import FFmpegMergerPP
+
+from services.ffmpeg_mux import SinglePassMuxPP, use_single_pass
+
+
+@pytest.fixture
+def ydl():
+    with yt_dlp.YoutubeDL({"quiet": True, "no_warnings": True}) as ydl:
+        yield ydl
+
+
+@pytest.fixture
+def calls():
+    """Recorded FFmpeg invocations; each one writes its output file."""
+    recorded = []
+
+    def fake_run(self, inputs, out_path, opts, **kwargs):
+        inputs = list(inputs)
+        recorded.append((inputs, out_path, list(opts)))
+        with open(out_path, "wb") as f:
+            f.write(b"muxed")
+
+    with patch.object(SinglePassMuxPP, "run_ffmpeg_multiple_files", fake_run):
+        yield recorded
+
+
+def touch(path, data=b"x"):
+    with open(path, "wb") as f:
+        f.write(data)
+    return str(path)
+
+
+def merge_info(tmp_path, subtitles=True):
+    video = touch(tmp_path / "v.f137.mp4")
+    audio = touch(tmp_path / "v.f140.m4a")
+    info = {
+        "id": "abc", "title": "A Title", "ext": "mp4", "filepath": str(tmp_path / "v.mp4"),
+        "requested_formats": [
+            {"format_id": "137", "vcodec": "avc1", "acodec": "none", "protocol": "https", "filepath": video},
+            {"format_id": "140", "vcodec": "none", "acodec": "mp4a", "protocol": "https", "filepath": audio},
+        ],
+        "__files_to_merge": [video, audio],
+        "__files_to_move": {},
+    }
+    if subtitles:
+        info["requested_subtitles"] = {
+            "en": {"ext": "vtt", "filepath": touch(tmp_path / "v.en.vtt"), "name": "English"},
+        }
+    return info
+
+
+class TestSinglePassMux:
+    """One FFmpeg run for merge + subtitles + metadata."""
+
+    def test_merge_subtitles_metadata_in_one_run(self, ydl, calls, tmp_path):
+        info = merge_info(tmp_path)
+        to_delete, info = SinglePassMuxPP(ydl).run(info)
+
+        assert len(calls) == 1
+        inputs, out_path, opts = calls[0]
+        assert inputs == [str(tmp_path / n) for n in ("v.f137.mp4", "v.f140.m4a", "v.en.vtt")]
+        assert out_path == str(tmp_path / "v.temp.mp4")
+        joined = " ".join(opts)
+        assert "-map 0:v:0 -map 1:a:0 -map 2:0" in joined
+        assert "-metadata:s:s:0 language=eng" in joined
+        assert "-metadata title=A Title" in joined
+        assert "-c copy -c:s mov_text" in joined
+
+        assert (tmp_path / "v.mp4").read_bytes() == b"muxed"
+        assert not (tmp_path / "v.temp.mp4").exists()
+        assert to_delete == inputs  # Streams and subtitle file are no longer needed
+
+    def test_subtitles_not_embedded_when_disabled(self, ydl, calls, tmp_path):
+        to_delete, _ = SinglePassMuxPP(ydl, embed_subtitles=False).run(merge_info(tmp_path))
+        inputs, _, opts = calls[0]
+        assert len(inputs) == 2
+        assert "mov_text" in opts  # Codec option only; no subtitle stream mapped
+        assert not any(o.startswith("2:") for o in opts)
+        assert str(tmp_path / "v.en.vtt") not in to_delete
+
+    def test_missing_subtitle_skipped(self, ydl, calls, tmp_path):
+        info = merge_info(tmp_path)
+        os.remove(info["requested_subtitles"]["en"]["filepath"])
+        SinglePassMuxPP(ydl).run(info)
+        assert len(calls[0][0]) == 2
+
+    def test_chapters_from_metadata_file(self, ydl, calls, tmp_path):
+        info = merge_info(tmp_path, subtitles=False)
+        info["chapters"] = [{"start_time": 0, "end_time": 10, "title": "Intro"}]
+        SinglePassMuxPP(ydl).run(info)
+
+        inputs, _, opts = calls[0]
+        assert inputs[2] == str(tmp_path / "v.meta")
+        assert opts[opts.index("-map_metadata") + 1] == "2"
+        assert not (tmp_path / "v.meta").exists()  # Removed after the run
+
+    def test_open_ended_chapter_uses_duration(self, ydl, calls, tmp_path):
+        info = merge_info(tmp_path, subtitles=False)
+        info["duration"] = 95
+        info["chapters"] = [{"start_time": 0, "end_time": 10, "title": "Intro"},
+                            {"start_time": 10, "title": "Rest"}]
+        with patch.object(SinglePassMuxPP, "_get_real_video_duration") as probe:
+            SinglePassMuxPP(ydl).run(info)
+        probe.assert_not_called()
+        assert info["chapters"][-1]["end_time"] == 95
+
+    def test_open_ended_chapter_probes_merge_inputs(self, ydl, calls, tmp_path):
+        info = merge_info(tmp_path, subtitles=False)
+        info["chapters"] = [{"start_time": 0, "title": "All"}]
+        lengths = {info["__files_to_merge"][0]: 60.0, info["__files_to_merge"][1]: 60.5}
+        probed = []
+
+        def fake_probe(self, path, fatal=True):
+            probed.append(path)
+            return lengths[path]
+
+        with patch.object(SinglePassMuxPP, "_get_real_video_duration", fake_probe):
+            SinglePassMuxPP(ydl).run(info)
+        assert probed == info["__files_to_merge"]  # Never the not-yet-merged output
+        assert info["chapters"][-1]["end_time"] == 60.5
+
+    def test_single_file_remuxed_once(self, ydl, calls, tmp_path):
+        path = touch(tmp_path / "v.mp4", b"progressive")
+        info = {"id": "abc", "title": "T", "ext": "mp4", "filepath": path, "__files_to_move": {}}
+        to_delete, _ = SinglePassMuxPP(ydl).run(info)
+
+        assert len(calls) == 1
+        assert calls[0][0] == [path]
+        assert to_delete == []
+        assert (tmp_path / "v.mp4").read_bytes() == b"muxed"
+
+    def test_nothing_to_do(self, ydl, calls, tmp_path):
+        info = {"id": "abc", "ext": "mp4", "filepath": touch(tmp_path / "v.mp4")}
+        assert SinglePassMuxPP(ydl, add_metadata=False).run(info) == ([], info)
+        assert calls == []
+
+
+class TestUseSinglePass:
+    """Replacing yt-dlp's merger."""
+
+    def test_replaces_merger(self, ydl):
+        mux = SinglePassMuxPP(ydl)
+        other = object()
+        info = {"__postprocessors": [FFmpegMergerPP(ydl), other]}
+        assert use_single_pass(info, mux) is True
+        assert info["__postprocessors"] == [mux, other]
+
+    def test_without_merge(self, ydl):
+        mux = SinglePassMuxPP(ydl)
+        info = {}
+        assert use_single_pass(info, mux) is False
+        assert info["__postprocessors"] == [mux]
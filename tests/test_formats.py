@@ -0,0 +1,86 @@
+"""
+Tests for services/formats.py — Format selection tests.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from config import AppSettings
+from models import DownloadFormat, DownloadItem, MediaPath, VideoInfo
+from services.downloader import DownloadService
+from services.formats import audio_postprocessor, format_options, media_path
+
+
+def video(quality="1080p"):
+    return DownloadItem(video_info=VideoInfo(url="test"), format=DownloadFormat.VIDEO, quality=quality)
+
+
+def audio(audio_quality="192"):
+    return DownloadItem(video_info=VideoInfo(url="test"), format=DownloadFormat.AUDIO,
+                        audio_quality=audio_quality)
+
+
+class TestFormatOptions:
+    """Format strings per mode."""
+
+    def test_default_mode_unchanged(self):
+        assert format_options(video("720p")) == {
+            "format": "bestvideo[height<=720]+bestaudio/best", "merge_output_format": "mp4",
+        }
+        assert format_options(video("best"))["format"].startswith("bestvideo[height<=2160]")
+        assert format_options(audio()) == {"format": "bestaudio/best"}
+        assert audio_postprocessor(audio("320"))["preferredcodec"] == "mp3"
+
+    def test_progressive_first_then_remux(self):
+        opts = format_options(video("360p"), avoid_transcode=True)
+        choices = opts["format"].split("/")
+        assert choices[0] == "best[height=360][ext=mp4]"
+        assert choices[1] == "bestvideo[height<=360]+bestaudio"
+        assert opts["format_sort"][-1] == "ext:mp4:m4a"
+        assert opts["merge_output_format"] == "mp4"
+
+    def test_native_audio(self):
+        assert format_options(audio("128"), avoid_transcode=True)["format"] == \
+            "bestaudio[abr<=128]/bestaudio/best"
+        pp = audio_postprocessor(audio("128"), avoid_transcode=True)
+        assert pp == {"key": "FFmpegExtractAudio", "preferredcodec": "best", "preferredquality": "128"}
+
+    def test_service_uses_mode(self):
+        service = DownloadService(AppSettings(avoid_transcode=True))
+        opts = service._build_ydl_opts(audio(), "/tmp")
+        assert opts["format"].startswith("bestaudio[abr<=192]")
+        assert {"key": "FFmpegExtractAudio", "preferredcodec": "best",
+                "preferredquality": "192"} in opts["postprocessors"]
+
+
+class TestMediaPath:
+    """Which path an item took."""
+
+    MP3 = {"postprocessors": [audio_postprocessor(audio())]}
+    NATIVE = {"postprocessors": [audio_postprocessor(audio(), avoid_transcode=True)]}
+
+    def test_video(self):
+        merged = {"ext": "mp4", "requested_formats": [{"format_id": "137"}, {"format_id": "140"}]}
+        assert media_path(merged, {}) == MediaPath.REMUX
+        assert media_path({"ext": "mp4", "acodec": "mp4a.40.2"}, {}) == MediaPath.DIRECT
+
+    @pytest.mark.parametrize("info, expected", [
+        ({"ext": "m4a", "acodec": "mp4a.40.2"}, MediaPath.DIRECT),
+        ({"ext": "webm", "acodec": "opus"}, MediaPath.REMUX),
+        ({"ext": "mp4", "acodec": "mp4a.40.2"}, MediaPath.REMUX),
+        ({"ext": "mp4", "acodec": "ec-3"}, MediaPath.TRANSCODE),
+    ])
+    def test_native_audio(self, info, expected):
+        assert media_path(info, self.NATIVE) == expected
+
+    @pytest.mark.parametrize("info, expected", [
+        ({"ext": "m4a", "acodec": "mp4a.40.2"}, MediaPath.TRANSCODE),
+        ({"ext": "webm", "acodec": "opus"}, MediaPath.TRANSCODE),
+        ({"ext": "mp3", "acodec": "mp3"}, MediaPath.DIRECT),
+        ({"ext": "mka", "acodec": "mp3"}, MediaPath.REMUX),
+    ])
+    def test_mp3_audio(self, info, expected):
+        assert media_path(info, self.MP3) == expected
@@ -0,0 +1,195 @@
+"""
+Tests for services/fragments.py — Fragment concurrency and chunk size tests.
+"""
+
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from config import AppSettings
+from models import DownloadItem, VideoInfo
+from services.fragments import MB, FragmentTuner, fragment_options
+from services.progress import ProgressSlot
+from services.retry import ErrorClass
+from services.downloader import DownloadService
+
+
+def make_item(name="a"):
+    info = VideoInfo(url=f"https://youtube.com/watch?v={name}", title=name)
+    return DownloadItem(video_info=info)
+
+
+class TestFragmentOptions:
+    """fragment_options tests."""
+
+    def test_fixed_options(self):
+        assert fragment_options(8, 5 * MB) == {
+            "concurrent_fragment_downloads": 8, "http_chunk_size": 5 * MB}
+
+    def test_chunking_off(self):
+        assert fragment_options(0, None) == {"concurrent_fragment_downloads": 1}
+
+
+class TestFragmentTuner:
+    """FragmentTuner tests."""
+
+    def test_probes_upwards_while_faster(self):
+        tuner = FragmentTuner(start_fragments=2, max_fragments=8)
+        for fragments, rate in ((2, 1.0), (3, 1.5), (4, 2.0)):
+            assert tuner.fragments == fragments
+            tuner.record(make_item(str(fragments)), int(rate * 10 * MB), 10.0)
+        assert tuner.fragments == 5
+
+    def test_steps_back_when_slower(self):
+        tuner = FragmentTuner(start_fragments=2, max_fragments=8)
+        tuner.record(make_item("a"), 20 * MB, 10.0)  # 2 fragments: 2 MB/s
+        tuner.record(make_item("b"), 10 * MB, 10.0)  # 3 fragments: 1 MB/s
+        assert tuner.fragments == 2
+        tuner.record(make_item("c"), 20 * MB, 10.0)
+        assert tuner.fragments == 2  # Both neighbours known and not better
+
+    def test_never_exceeds_max(self):
+        tuner = FragmentTuner(start_fragments=4, max_fragments=4)
+        tuner.record(make_item(), 100 * MB, 1.0)
+        assert tuner.fragments == 4
+
+    def test_small_downloads_ignored(self):
+        tuner = FragmentTuner(start_fragments=4)
+        tuner.record(make_item(), 100 * 1024, 0.1)
+        assert tuner.fragments == 4
+
+    def test_failure_halves_retry_and_global(self):
+        tuner = FragmentTuner(start_fragments=8, start_chunk=8 * MB)
+        item = make_item()
+        tuner.record(item, 0, 1.0, ErrorClass.THROTTLED)
+        assert tuner.options_for(item) == {
+            "concurrent_fragment_downloads": 4, "http_chunk_size": 4 * MB}
+        assert tuner.fragments == 4
+
+    def test_transient_failure_keeps_chunk(self):
+        tuner = FragmentTuner(start_fragments=8, start_chunk=8 * MB)
+        item = make_item()
+        tuner.record(item, 0, 1.0, ErrorClass.TRANSIENT)
+        assert tuner.options_for(item)["http_chunk_size"] == 8 * MB
+
+    def test_permanent_failure_ignored(self):
+        tuner = FragmentTuner(start_fragments=8)
+        tuner.record(make_item(), 0, 1.0, ErrorClass.PERMANENT)
+        assert tuner.fragments == 8
+
+    def test_success_grows_chunk(self):
+        tuner = FragmentTuner(start_chunk=4 * MB, max_chunk=6 * MB)
+        tuner.record(make_item(), 10 * MB, 1.0)
+        assert tuner.chunk_size == 6 * MB
+
+
+class TestConcurrentFragmentProgress:
+    """Progress accounting with several fragment threads."""
+
+    def test_charge_counts_each_byte_once(self):
+        slot = ProgressSlot()
+        assert slot.charge(100) == 100
+        assert slot.charge(80) == 0  # Stale report from a slower thread
+        assert slot.charge(150) == 50
+        slot.reset_charge()
+        assert slot.charge(30) == 30  # Next file
+        assert slot.transferred_bytes == 180
+
+    def test_resumed_bytes_not_charged(self):
+        slot = ProgressSlot()
+        slot.resume_sizes = {"/d/a.mp4.part": 2000 * MB}
+        assert slot.charge(2000 * MB + 100, "/d/a.mp4.part") == 100
+        assert slot.charge(2000 * MB + 300, "/d/a.mp4.part") == 200
+        slot.reset_charge()
+        assert slot.charge(50, "/d/a.m4a.part") == 50  # Next file was not resumed
+        assert slot.transferred_bytes == 350
+
+    def test_resume_through_the_hook(self, tmp_path):
+        part = tmp_path / "a.mp4.part"
+        part.write_bytes(b"x" * 1000)
+        service = DownloadService(AppSettings(output_dir=str(tmp_path), speed_limit=1024))
+        item = make_item()
+        item.partial_files = [str(part)]
+        service.add_to_queue(item)
+        service._claim_next_item()
+        consumed = []
+        service._bandwidth.consume = lambda key, n, **kwargs: consumed.append(n)
+
+        def fake_run(ydl, item):
+            service._progress_hook({"status": "downloading", "downloaded_bytes": 1100,
+                                    "tmpfilename": str(part)}, item)
+            raise RuntimeError("stop here")
+
+        service._run_download = fake_run
+        service._download_item(item)
+        assert consumed == [100]  # Not the 1000 bytes already on disk
+        assert service._progress[item.url].transferred_bytes == 100
+
+    def test_charge_thread_safe(self):
+        slot = ProgressSlot()
+        counter_lock = threading.Lock()
+        counter = [0]
+        total = []
+
+        def report():
+            for _ in range(5000):
+                with counter_lock:  # yt-dlp's shared fragment byte counter
+                    counter[0] += 10
+                    downloaded = counter[0]
+                total.append(slot.charge(downloaded))  # Reported out of order
+
+        threads = [threading.Thread(target=report) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert sum(total) == slot.transferred_bytes == 4 * 5000 * 10
+
+    def test_fragment_percent_fallback(self):
+        slot = ProgressSlot()
+        slot.update({"downloaded_bytes": 500, "fragment_index": 3, "fragment_count": 12})
+        assert slot.percent == pytest.approx(25.0)
+
+
+class TestServiceFragments:
+    """DownloadService fragment option tests."""
+
+    def test_fixed_settings(self):
+        settings = AppSettings(concurrent_fragments=6, http_chunk_size=None,
+                               adaptive_fragments=False)
+        opts = DownloadService(settings)._build_ydl_opts(make_item(), "/tmp")
+        assert opts["concurrent_fragment_downloads"] == 6
+        assert "http_chunk_size" not in opts
+
+    def test_adaptive_uses_tuner(self):
+        service = DownloadService(AppSettings(concurrent_fragments=3))
+        item = make_item()
+        service._fragment_tuner.record(item, 0, 1.0, ErrorClass.TRANSIENT)
+        opts = service._build_ydl_opts(item, "/tmp")
+        assert opts["concurrent_fragment_downloads"] == 1
+
+    def test_cancel_is_not_a_failure(self):
+        service = DownloadService(AppSettings(concurrent_fragments=4, prefetch_depth=0))
+        item = make_item()
+        service.add_to_queue(item)
+        service._claim_next_item()
+
+        def cancelled_download(item):
+            service.get_control(item).cancel()
+            return False
+
+        service._download_item = cancelled_download
+        service._download_item_with_retry(item)
+        assert service._fragment_tuner.fragments == 4
+
+    def test_unclassified_failure_not_recorded(self):
+        service = DownloadService(AppSettings(concurrent_fragments=4, prefetch_depth=0))
+        item = make_item()
+        service.add_to_queue(item)
+        service._claim_next_item()
+        service._download_item = lambda item: False  # No error in _last_errors
+        service._download_item_with_retry(item)
+        assert service._fragment_tuner.fragments == 4
@@ -0,0 +1,172 @@
+"""
+Tests for services/journal.py — Queue journal tests.
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from config import AppSettings
+from models import DownloadItem, DownloadFormat, DownloadStatus, VideoInfo
+from services.journal import QueueJournal
+from services.downloader import DownloadService
+
+
+@pytest.fixture
+def journal_file(tmp_path):
+    """Path to a temporary journal file."""
+    return tmp_path / "queue_journal.jsonl"
+
+
+@pytest.fixture
+def journal(journal_file):
+    """Create a QueueJournal without fsync (faster tests)."""
+    j = QueueJournal(journal_file=journal_file, fsync=False)
+    yield j
+    j.close()
+
+
+def make_item(n, **kwargs):
+    """Create a distinct DownloadItem."""
+    info = VideoInfo(url=f"https://youtube.com/watch?v=journal{n:04d}", title=f"Video {n}")
+    return DownloadItem(video_info=info, **kwargs)
+
+
+class TestQueueJournal:
+    """QueueJournal tests."""
+
+    def test_replay_empty(self, journal):
+        assert journal.replay() == []
+
+    def test_add_and_replay(self, journal, journal_file):
+        journal.record_add(make_item(1, format=DownloadFormat.AUDIO, audio_quality="320"))
+        journal.record_add(make_item(2, quality="720p"))
+
+        items = QueueJournal(journal_file=journal_file).replay()
+        assert [i.title for i in items] == ["Video 1", "Video 2"]
+        assert items[0].format == DownloadFormat.AUDIO
+        assert items[0].audio_quality == "320"
+        assert items[1].quality == "720p"
+
+    def test_status_transition_replayed(self, journal, journal_file):
+        item = make_item(1)
+        journal.record_add(item)
+        item.status = DownloadStatus.FAILED
+        item.error_message = "HTTP Error 403"
+        journal.record_status(item)
+
+        restored = QueueJournal(journal_file=journal_file).replay()[0]
+        assert restored.status == DownloadStatus.FAILED
+        assert restored.error_message == "HTTP Error 403"
+
+    def test_retry_count_replayed(self, journal, journal_file):
+        item = make_item(1)
+        journal.record_add(item)
+        item.attempts = 2  # Parked for a third attempt
+        journal.record_status(item)
+
+        assert QueueJournal(journal_file=journal_file).replay()[0].attempts == 2
+        journal.compact()
+        assert QueueJournal(journal_file=journal_file).replay()[0].attempts == 2
+
+    def test_remove_replayed(self, journal, journal_file):
+        for n in range(3):
+            journal.record_add(make_item(n))
+        journal.record_remove([make_item(1).url])
+
+        items = QueueJournal(journal_file=journal_file).replay()
+        assert [i.title for i in items] == ["Video 0", "Video 2"]
+
+    def test_truncated_last_line_is_skipped(self, journal, journal_file):
+        journal.record_add(make_item(1))
+        journal.close()
+        with open(journal_file, "a", encoding="utf-8") as f:
+            f.write('{"op": "add", "item": {"video_')  # crash mid-write
+
+        items = QueueJournal(journal_file=journal_file).replay()
+        assert len(items) == 1
+
+    def test_compaction_shrinks_file(self, journal_file):
+        journal = QueueJournal(journal_file=journal_file, compact_threshold=20, fsync=False)
+        item = make_item(1)
+        journal.record_add(item)
+        for _ in range(50):
+            item.status = DownloadStatus.DOWNLOADING
+            journal.record_status(item)
+
+        with open(journal_file, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        assert len(lines) < 20
+        assert json.loads(lines[0])["op"] == "add"
+        assert QueueJournal(journal_file=journal_file).replay()[0].status == DownloadStatus.DOWNLOADING
+        journal.close()
+
+    def test_unflushed_record_is_buffered(self, journal, journal_file):
+        journal.record_add(make_item(1), flush=False)
+        assert QueueJournal(journal_file=journal_file).replay() == []
+        journal.flush()
+        assert len(QueueJournal(journal_file=journal_file).replay()) == 1
+
+    def test_close_flushes_buffer(self, journal, journal_file):
+        journal.record_add(make_item(1), flush=False)
+        journal.close()
+        assert len(QueueJournal(journal_file=journal_file).replay()) == 1
+
+    def test_records_ignored_after_close(self, journal, journal_file):
+        journal.record_add(make_item(1))
+        journal.close()
+        journal.record_add(make_item(2))
+        assert len(QueueJournal(journal_file=journal_file).replay()) == 1
+
+
+class TestServiceRestore:
+    """DownloadService + journal integration tests."""
+
+    def test_restore_queue_rebuilds_url_set(self, journal_file):
+        service = DownloadService(AppSettings(), journal=QueueJournal(journal_file, fsync=False))
+        for n in range(3):
+            service.add_to_queue(make_item(n))
+        service.remove_from_queue(0)
+
+        restored = DownloadService(AppSettings(), journal=QueueJournal(journal_file, fsync=False))
+        assert restored.restore_queue() == 2
+        assert restored.queue_count == 2
+        assert restored.is_duplicate(make_item(1).url) is True
+        assert restored.is_duplicate(make_item(0).url) is False
+
+    def test_interrupted_items_resume_as_pending(self, journal_file):
+        service = DownloadService(AppSettings(), journal=QueueJournal(journal_file, fsync=False))
+        item = make_item(1)
+        service.add_to_queue(item)
+        service._set_status(item, DownloadStatus.DOWNLOADING, notify=False)
+
+        restored = DownloadService(AppSettings(), journal=QueueJournal(journal_file, fsync=False))
+        restored.restore_queue()
+        assert restored.queue[0].status == DownloadStatus.PENDING
+
+    def test_disk_writes_happen_outside_service_lock(self, journal_file):
+        journal = QueueJournal(journal_file, fsync=False)
+        service = DownloadService(AppSettings(), journal=journal)
+        lock_held = []
+        write_lines = journal._write_lines
+
+        def checked_write(lines):
+            lock_held.append(service._lock.locked())
+            write_lines(lines)
+
+        journal._write_lines = checked_write
+        item = make_item(1)
+        service.add_to_queue(item)
+        service.pause_item(item)
+        service.resume_item(item)
+        service.cancel_item(item)
+        service.remove_from_queue(0)
+
+        assert lock_held and not any(lock_held)
+        assert QueueJournal(journal_file).replay() == []
+
+    def test_restore_without_journal(self):
+        assert DownloadService(AppSettings()).restore_queue() == 0
@@ -0,0 +1,138 @@
+"""
+Tests for services/metadata_store.py — Persistent metadata store tests.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from contextlib import contextmanager
+from unittest.mock import patch
+
+from config import AppSettings
+from models import VideoInfo
+from services.metadata_store import MetadataStore, stream_urls_expire_at, trim_formats
+from services.downloader import DownloadService
+
+
+RAW_INFO = {
+    "id": "dQw4w9WgXcQ",
+    "title": "Stored Video",
+    "uploader": "Someone",
+    "duration": 212,
+    "formats": [
+        {"format_id": "137", "ext": "mp4", "height": 1080, "vcodec": "avc1",
+         "url": "https://rr1.googlevideo.com/expiring", "http_headers": {"User-Agent": "x"}},
+        {"format_id": "140", "ext": "m4a", "acodec": "mp4a", "filesize": 3000000,
+         "url": "https://rr1.googlevideo.com/expiring2"},
+    ],
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    return MetadataStore(directory=tmp_path / "metadata", max_age=100.0)
+
+
+def make_info(url="https://youtube.com/watch?v=dQw4w9WgXcQ"):
+    return VideoInfo.from_yt_dlp(url, RAW_INFO)
+
+
+class TestMetadataStore:
+    """MetadataStore tests."""
+
+    def test_round_trip(self, store):
+        store.save("dQw4w9WgXcQ", make_info(), now=1000.0)
+        loaded = store.load("dQw4w9WgXcQ", now=1050.0)
+        assert loaded.title == "Stored Video"
+        assert loaded.duration == 212
+        assert [f["format_id"] for f in loaded.raw_info["formats"]] == ["137", "140"]
+
+    def test_stream_urls_not_stored(self, store):
+        store.save("dQw4w9WgXcQ", make_info(), now=1000.0)
+        formats = store.load("dQw4w9WgXcQ", now=1000.0).raw_info["formats"]
+        assert all("url" not in f and "http_headers" not in f for f in formats)
+
+    def test_stale_entry_is_missing(self, store):
+        store.save("dQw4w9WgXcQ", make_info(), now=1000.0)
+        assert store.load("dQw4w9WgXcQ", now=1101.0) is None
+
+    def test_missing_and_corrupt(self, store):
+        assert store.load("nope") is None
+        store.directory.mkdir(parents=True)
+        (store.directory / "bad.json").write_text("{oops")
+        assert store.load("bad") is None
+
+    def test_unsafe_id_rejected(self, store):
+        store.save("../evil", make_info())
+        assert store.load("../evil") is None
+        assert not store.directory.exists()
+
+    def test_prune_and_clear(self, store):
+        store.save("aaaaaaaaaaa", make_info())
+        store.save("bbbbbbbbbbb", make_info())
+        old = store.directory / "aaaaaaaaaaa.json"
+        os.utime(old, (0, 0))
+        assert store.prune() == 1
+        assert not old.exists()
+        store.clear()
+        assert os.listdir(store.directory) == []
+
+    def test_trim_formats(self):
+        assert trim_formats([{"format_id": "18", "url": "u", "height": None}]) == [{"format_id": "18"}]
+
+
+class TestServiceMetadataStore:
+    """DownloadService + MetadataStore integration tests."""
+
+    def _counting_pool(self, service, calls):
+        @contextmanager
+        def checkout(opts):
+            class FakeYDL:
+                def extract_info(self, url, download=False):
+                    calls.append(url)
+                    return RAW_INFO
+            yield FakeYDL()
+        return patch.object(service._ydl_pool, "checkout", side_effect=checkout)
+
+    def test_served_from_disk_after_restart(self, store):
+        calls = []
+        first = DownloadService(AppSettings(), metadata_store=store)
+        with self._counting_pool(first, calls):
+            first.get_video_info("https://youtube.com/watch?v=dQw4w9WgXcQ")
+
+        second = DownloadService(AppSettings(), metadata_store=store)
+        with self._counting_pool(second, calls):
+            info = second.get_video_info("https://youtu.be/dQw4w9WgXcQ")
+        assert len(calls) == 1
+        assert info.title == "Stored Video"
+        assert info.url == "https://youtu.be/dQw4w9WgXcQ"
+
+    def test_clear_cache_clears_store(self, store):
+        service = DownloadService(AppSettings(), metadata_store=store)
+        with self._counting_pool(service, []):
+            service.get_video_info("https://youtube.com/watch?v=dQw4w9WgXcQ")
+        service.clear_cache()
+        assert store.load("dQw4w9WgXcQ") is None
+
+
+class TestStreamUrlExpiry:
+    """stream_urls_expire_at tests."""
+
+    def test_earliest_query_expiry(self):
+        info = {"formats": [
+            {"url": "https://x.googlevideo.com/videoplayback?expire=2000&id=1"},
+            {"url": "https://x.googlevideo.com/videoplayback?expire=1500&id=2"},
+        ]}
+        assert stream_urls_expire_at(info) == 1500.0
+
+    def test_path_style_expiry(self):
+        info = {"formats": [{"manifest_url": "https://m.youtube.com/api/manifest/hls/expire/1700/id/x"}]}
+        assert stream_urls_expire_at(info) == 1700.0
+
+    def test_no_urls(self):
+        assert stream_urls_expire_at({"formats": [{"format_id": "18"}]}) == 0.0
+
+    def test_urls_without_expiry(self):
+        assert stream_urls_expire_at({"formats": [{"url": "https://cdn/x.mp4"}]}) is None
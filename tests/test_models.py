@@ -9,7 +9,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
 import pytest
 from models import (
     DownloadStatus, DownloadFormat, VideoInfo, DownloadItem,
-    DownloadProgress, format_bytes,
+    DownloadProgress, MediaPath, QueueChange, format_bytes,
 )
 
 
@@ -141,6 +141,53 @@ class TestDownloadItem:
         assert d["format"] == "video"
         assert d["quality"] == "1080p"
 
+    def test_to_dict_round_trip(self):
+        info = VideoInfo(url="https://youtube.com/watch?v=test", title="My Video",
+                         duration=90, raw_info={"formats": []})
+        item = DownloadItem(video_info=info, format=DownloadFormat.AUDIO, audio_quality="320")
+        item.status = DownloadStatus.FAILED
+        item.error_message = "oops"
+        item.attempts = 2
+
+        data = item.to_dict()
+        assert "raw_info" not in data["video_info"]
+
+        restored = DownloadItem.from_dict(data)
+        assert restored.title == "My Video"
+        assert restored.video_info.duration == 90
+        assert restored.format == DownloadFormat.AUDIO
+        assert restored.audio_quality == "320"
+        assert restored.attempts == 2
+        assert restored.status == DownloadStatus.FAILED
+        assert restored.error_message == "oops"
+        assert restored.added_at == item.added_at
+
+    def test_media_path_round_trip(self):
+        item = DownloadItem(video_info=VideoInfo(url="https://youtube.com/watch?v=test"))
+        assert DownloadItem.from_dict(item.to_dict()).media_path is None
+        item.media_path = MediaPath.REMUX
+        assert DownloadItem.from_dict(item.to_dict()).media_path == MediaPath.REMUX
+        assert item.to_history_dict()["media_path"] == "remux"
+
+
+class TestQueueChange:
+    """QueueChange delta tests."""
+
+    def _item(self, name):
+        return DownloadItem(video_info=VideoInfo(url=f"https://youtube.com/watch?v={name}"))
+
+    def test_empty_is_falsy(self):
+        assert not QueueChange()
+        assert QueueChange(reordered=True)
+
+    def test_merge_drops_items_removed_later(self):
+        a, b = self._item("a"), self._item("b")
+        merged = QueueChange(added=[a, b], updated=[a]).merge(QueueChange(removed=[a]))
+        assert merged.added == [b]
+        assert merged.updated == []
+        assert merged.removed == [a]
+        assert not merged.reordered
+
 
 class TestFormatBytes:
     """format_bytes function tests."""
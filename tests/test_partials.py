@@ -0,0 +1,228 @@
+"""
+Tests for services/partials.py — Partial download tracking and cleanup tests.
+"""
+
+import sys
+import os
+import json
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from config import AppSettings
+from models import DownloadItem, VideoInfo
+from services.journal import QueueJournal
+from services.partials import (
+    PartialRegistry, cleanup_stale_partials, discard_partials, fragment_index,
+    is_partial_file, state_file_for, verify_partials,
+)
+from services.downloader import DownloadCancelled, DownloadService
+
+
+def make_item(name="a"):
+    info = VideoInfo(url=f"https://youtube.com/watch?v={name}", title=name)
+    return DownloadItem(video_info=info)
+
+
+def write(path, data=b"x" * 100, mtime=None):
+    path.write_bytes(data)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+    return str(path)
+
+
+class TestPartialHelpers:
+    """Module-level helper tests."""
+
+    @pytest.mark.parametrize("name, expected", [
+        ("Video.f137.mp4.part", True),
+        ("Video.f137.mp4.ytdl", True),
+        ("Video.f137.mp4.part-Frag12", True),
+        ("Video.f137.mp4.part-Frag12.part", True),
+        ("Video.mp4", False),
+        ("party.mp3", False),
+    ])
+    def test_is_partial_file(self, name, expected):
+        assert is_partial_file(name) is expected
+
+    def test_state_file_for(self):
+        assert state_file_for("/d/Video.mp4.part") == "/d/Video.mp4.ytdl"
+
+    def test_fragment_index(self, tmp_path):
+        part = write(tmp_path / "v.mp4.part")
+        assert fragment_index(part) is None
+        (tmp_path / "v.mp4.ytdl").write_text(
+            json.dumps({"downloader": {"current_fragment": {"index": 7}}}))
+        assert fragment_index(part) == 7
+
+    def test_verify_keeps_resumable(self, tmp_path):
+        part = write(tmp_path / "v.mp4.part")
+        assert verify_partials([part]) == [part]
+
+    def test_verify_drops_empty_and_missing(self, tmp_path):
+        empty = write(tmp_path / "e.mp4.part", b"")
+        missing = str(tmp_path / "m.mp4.part")
+        orphan_state = tmp_path / "m.mp4.ytdl"
+        orphan_state.write_text("{}")
+        assert verify_partials([empty, missing]) == []
+        assert not os.path.exists(empty)
+        assert not orphan_state.exists()
+
+    def test_verify_drops_corrupt_state(self, tmp_path):
+        part = write(tmp_path / "v.mp4.part")
+        (tmp_path / "v.mp4.ytdl").write_text("{not json")
+        assert verify_partials([part]) == []
+        assert not os.path.exists(part)
+
+    def test_discard_removes_state_too(self, tmp_path):
+        part = write(tmp_path / "v.mp4.part")
+        (tmp_path / "v.mp4.ytdl").write_text("{}")
+        assert discard_partials([part]) == 2
+        assert os.listdir(tmp_path) == []
+
+    def test_cleanup_stale(self, tmp_path):
+        now = 1_000_000.0
+        old = write(tmp_path / "old.mp4.part", mtime=now - 100)
+        old_state = write(tmp_path / "old.mp4.ytdl", mtime=now - 100)
+        old_frag = write(tmp_path / "old.mp4.part-Frag3", mtime=now - 100)
+        fresh = write(tmp_path / "fresh.mp4.part", mtime=now - 1)
+        kept = write(tmp_path / "kept.mp4.part", mtime=now - 100)
+        kept_frag = write(tmp_path / "kept.mp4.part-Frag3", mtime=now - 100)
+        missing = str(tmp_path / "missing.mp4.part")
+
+        recorded = [old, fresh, kept, missing]
+        gone = cleanup_stale_partials(recorded, 50, {kept}, now=now)
+        assert sorted(gone) == sorted([old, missing])
+        assert not any(os.path.exists(p) for p in (old, old_state, old_frag))
+        assert all(os.path.exists(p) for p in (fresh, kept, kept_frag))
+
+    def test_cleanup_ignores_unrecorded_files(self, tmp_path):
+        now = 1_000_000.0
+        foreign = write(tmp_path / "file.zip.part", mtime=now - 10 ** 6)  # e.g. a browser download
+        ours = write(tmp_path / "a.mp4.part", mtime=now - 10 ** 6)
+        assert cleanup_stale_partials([ours], 50, set(), now=now) == [ours]
+        assert os.path.exists(foreign)
+        assert not os.path.exists(ours)
+
+    def test_registry_persists(self, tmp_path):
+        registry = PartialRegistry(tmp_path / "partials.json")
+        registry.add("/d/a.mp4.part")
+        registry.add("/d/b.mp4.part")
+        registry.forget(["/d/a.mp4.part"])
+        assert PartialRegistry(tmp_path / "partials.json").paths == {"/d/b.mp4.part"}
+
+
+class TestServicePartials:
+    """DownloadService partial tracking tests."""
+
+    def _claim(self, service, item):
+        service.add_to_queue(item)
+        service._claim_next_item()
+
+    def test_hook_tracks_tmpfilename(self):
+        service = DownloadService(AppSettings())
+        item = make_item()
+        self._claim(service, item)
+        d = {"status": "downloading", "downloaded_bytes": 10, "total_bytes": 100,
+             "filename": "/d/a.mp4", "tmpfilename": "/d/a.mp4.part"}
+        service._progress_hook(d, item)
+        service._progress_hook(d, item)
+        assert item.partial_files == ["/d/a.mp4.part"]
+
+        service._progress_hook({"status": "finished", "filename": "/d/a.mp4"}, item)
+        assert item.partial_files == []
+
+    def test_partials_survive_restart(self, tmp_path):
+        journal_file = tmp_path / "queue_journal.jsonl"
+        service = DownloadService(AppSettings(), journal=QueueJournal(journal_file, fsync=False))
+        item = make_item()
+        self._claim(service, item)
+        service._progress_hook({"status": "downloading", "downloaded_bytes": 10,
+                                "tmpfilename": "/d/a.mp4.part"}, item)
+
+        restored = DownloadService(AppSettings(), journal=QueueJournal(journal_file, fsync=False))
+        restored.restore_queue()
+        assert restored.queue[0].partial_files == ["/d/a.mp4.part"]
+
+    def test_remove_deletes_partials(self, tmp_path):
+        service = DownloadService(AppSettings(output_dir=str(tmp_path)))
+        item = make_item()
+        item.partial_files = [write(tmp_path / "a.mp4.part")]
+        service.add_to_queue(item)
+        service.remove_from_queue(0)
+        assert os.listdir(tmp_path) == []
+
+    def test_cancel_pending_deletes_partials(self, tmp_path):
+        service = DownloadService(AppSettings(output_dir=str(tmp_path)))
+        item = make_item()
+        item.partial_files = [write(tmp_path / "a.mp4.part")]
+        service.add_to_queue(item)
+        assert service.cancel_item(item) is True
+        assert os.listdir(tmp_path) == []
+
+    def test_shutdown_keeps_partials(self, tmp_path):
+        journal_file = tmp_path / "queue_journal.jsonl"
+        settings = AppSettings(output_dir=str(tmp_path), prefetch_depth=0, min_free_space_mb=0)
+        service = DownloadService(settings, journal=QueueJournal(journal_file, fsync=False))
+        item = make_item()
+        service.add_to_queue(item)
+        part = str(tmp_path / "a.mp4.part")
+        started = threading.Event()
+
+        def fake_run(ydl, item):
+            write(tmp_path / "a.mp4.part")
+            service._progress_hook({"status": "downloading", "downloaded_bytes": 100,
+                                    "tmpfilename": part}, item)
+            started.set()
+            while not service._is_cancelled(item):
+                time.sleep(0.01)
+            raise DownloadCancelled("Download cancelled by user")
+
+        service._run_download = fake_run
+        service.start()
+        assert started.wait(5)
+        service.shutdown()
+        deadline = time.time() + 5
+        while service.worker_count and time.time() < deadline:
+            time.sleep(0.01)
+
+        assert service.worker_count == 0
+        assert os.path.exists(part)
+        restored = DownloadService(AppSettings(), journal=QueueJournal(journal_file, fsync=False))
+        assert restored.restore_queue() == 1
+        assert restored.queue[0].partial_files == [part]
+
+    def test_cleanup_keeps_queued_partials(self, tmp_path):
+        registry = PartialRegistry(tmp_path / "partials.json")
+        service = DownloadService(AppSettings(output_dir=str(tmp_path), partial_max_age_days=0),
+                                  partials=registry)
+        item = make_item()
+        service.add_to_queue(item)
+        service._claim_next_item()
+        queued = write(tmp_path / "a.mp4.part")
+        service._progress_hook({"status": "downloading", "downloaded_bytes": 10,
+                                "tmpfilename": queued}, item)
+        stale = write(tmp_path / "b.mp4.part")
+        registry.add(stale)
+        foreign = write(tmp_path / "c.zip.part")
+
+        assert service.cleanup_partials() == 1
+        assert not os.path.exists(stale)
+        assert os.path.exists(queued) and os.path.exists(foreign)
+        assert registry.paths == {queued}
+
+    def test_remove_forgets_partials(self, tmp_path):
+        registry = PartialRegistry(tmp_path / "partials.json")
+        service = DownloadService(AppSettings(output_dir=str(tmp_path)), partials=registry)
+        item = make_item()
+        item.partial_files = [write(tmp_path / "a.mp4.part")]
+        registry.add(item.partial_files[0])
+        service.add_to_queue(item)
+        service.remove_from_queue(0)
+        assert registry.paths == set()
+
+    def test_resume_enabled(self):
+        opts = DownloadService(AppSettings())._build_ydl_opts(make_item(), "/tmp")
+        assert opts["continuedl"] is True
@@ -0,0 +1,186 @@
+"""
+Tests for services/postprocess.py — Post-processing stage tests.
+"""
+
+import sys
+import os
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import patch
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+import yt_dlp
+
+from config import AppSettings
+from models import DownloadItem, DownloadStatus, MediaPath, VideoInfo
+from services.downloader import DownloadService
+from services.postprocess import (
+    DeferringYoutubeDL, PostProcessJob, PostProcessStage, default_postprocess_workers,
+    lower_thread_priority,
+)
+
+
+def make_item(n):
+    return DownloadItem(video_info=VideoInfo(url=f"https://youtube.com/watch?v=pp{n:09d}", title=f"V{n}"))
+
+
+class TestDeferringYoutubeDL:
+    """post_process hand-off."""
+
+    def test_defers_when_handler_set(self):
+        ydl = DeferringYoutubeDL({"quiet": True})
+        calls = []
+        ydl.defer_postprocess = lambda *args: calls.append(args)
+        with patch.object(yt_dlp.YoutubeDL, "post_process") as real:
+            info = ydl.post_process("/d/v.f137.mp4", {"id": "x"}, {"/d/v.en.vtt": None})
+        real.assert_not_called()
+        assert calls == [("/d/v.f137.mp4", {"id": "x", "filepath": "/d/v.f137.mp4"},
+                          {"/d/v.en.vtt": None})]
+        assert info["filepath"] == "/d/v.f137.mp4"
+
+    def test_runs_normally_without_handler(self):
+        ydl = DeferringYoutubeDL({"quiet": True})
+        with patch.object(yt_dlp.YoutubeDL, "post_process", return_value={"filepath": "/d/v.mp4"}) as real:
+            assert ydl.post_process("/d/v.mp4", {})["filepath"] == "/d/v.mp4"
+        real.assert_called_once()
+
+
+class TestPostProcessStage:
+    """Bounded hand-off queue and worker threads."""
+
+    def test_default_workers_bounded(self):
+        assert 1 <= default_postprocess_workers() <= 4
+
+    def test_runs_jobs_on_workers(self):
+        done = []
+        finished = threading.Event()
+
+        def handler(job):
+            done.append((job.item.url, threading.current_thread().name))
+            if len(done) == 3:
+                finished.set()
+
+        stage = PostProcessStage(handler, workers=2, nice=0)
+        for n in range(3):
+            stage.submit(PostProcessJob(make_item(n), "/d/f", {}))
+        assert finished.wait(5)
+        assert all(name.startswith("PostProcess-") for _, name in done)
+        stage.stop()
+
+    def test_submit_blocks_when_full(self):
+        release = threading.Event()
+        stage = PostProcessStage(lambda job: release.wait(5), workers=1, capacity=1, nice=0)
+        stage.submit(PostProcessJob(make_item(0), "/d/f", {}))  # Running
+        stage.submit(PostProcessJob(make_item(1), "/d/f", {}))  # Queued (queue full now)
+        time.sleep(0.05)
+
+        blocked = threading.Thread(target=stage.submit, args=(PostProcessJob(make_item(2), "/d/f", {}),))
+        blocked.start()
+        blocked.join(0.1)
+        assert blocked.is_alive()
+        release.set()
+        blocked.join(5)
+        assert not blocked.is_alive()
+        stage.stop()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="per-thread nice is Linux-only")
+    def test_workers_run_at_lower_priority(self):
+        seen = []
+        done = threading.Event()
+
+        def handler(job):
+            seen.append(os.getpriority(os.PRIO_PROCESS, threading.get_native_id()))
+            done.set()
+
+        base = os.getpriority(os.PRIO_PROCESS, threading.get_native_id())
+        stage = PostProcessStage(handler, workers=1, nice=5)
+        stage.submit(PostProcessJob(make_item(0), "/d/f", {}))
+        assert done.wait(5)
+        assert seen[0] == min(19, base + 5)
+        assert os.getpriority(os.PRIO_PROCESS, threading.get_native_id()) == base
+        stage.stop()
+
+    def test_lower_priority_is_best_effort(self):
+        with patch("os.setpriority", side_effect=OSError("denied")):
+            assert lower_thread_priority() is False
+
+
+class TestServicePipeline:
+    """Download workers hand off to the post-processing stage."""
+
+    class StagedYDL:
+        """Download defers post-processing; post_process blocks until released."""
+
+        def __init__(self, log, release):
+            self.log = log
+            self.release = release
+            self.defer_postprocess = None
+            self.fail = False
+
+        def download(self, urls):
+            self.log.append(("download", urls[0]))
+            name = f"/d/{urls[0][-11:]}"
+            self.defer_postprocess(f"{name}.f137.mp4", {"id": urls[0][-11:]}, {})
+
+        def post_process(self, filename, info, files_to_move=None):
+            self.log.append(("convert", info["id"]))
+            self.release.wait(5)
+            if self.fail:
+                raise yt_dlp.utils.PostProcessingError("Conversion failed!")
+            return dict(info, filepath=filename.replace(".f137", ""))
+
+    def _service(self, log, release, fail=False):
+        service = DownloadService(AppSettings(max_concurrent=1, prefetch_depth=0,
+                                              postprocess_workers=1, single_pass_mux=False,
+                                              output_dir="/tmp"))
+
+        @contextmanager
+        def checkout(opts):
+            ydl = self.StagedYDL(log, release)
+            ydl.fail = fail
+            yield ydl
+
+        return service, patch.object(service._ydl_pool, "checkout", side_effect=checkout)
+
+    def test_worker_downloads_next_while_converting(self):
+        log, release, all_done = [], threading.Event(), threading.Event()
+        service, pool_patch = self._service(log, release)
+        service.set_callbacks(on_all_complete=all_done.set)
+        items = [make_item(1), make_item(2)]
+        with pool_patch:
+            service.add_many(items)
+            service.start()
+            deadline = time.time() + 5
+            while len([e for e in log if e[0] == "download"]) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+            # One worker, first item still converting: the second download already ran
+            assert [e[0] for e in log].count("download") == 2
+            assert items[0].status == DownloadStatus.CONVERTING
+            assert not all_done.is_set()
+            release.set()
+            assert all_done.wait(5)
+
+        assert [i.status for i in items] == [DownloadStatus.COMPLETED] * 2
+        assert items[0].filepath == "/d/pp000000001.mp4"
+        assert items[0].media_path == MediaPath.DIRECT  # Single file, nothing merged
+        assert service.completed_count == 2
+
+    def test_postprocessing_failure_is_final(self):
+        log, release, all_done = [], threading.Event(), threading.Event()
+        release.set()
+        service, pool_patch = self._service(log, release, fail=True)
+        errors = []
+        service.set_callbacks(on_error=lambda item, error: errors.append(error),
+                              on_all_complete=all_done.set)
+        item = make_item(1)
+        with pool_patch:
+            service.add_to_queue(item)
+            service.start()
+            assert all_done.wait(5)
+
+        assert item.status == DownloadStatus.FAILED
+        assert [e[0] for e in log] == ["download", "convert"]  # Not re-downloaded
+        assert service.failed_count == 1 and service.completed_count == 0
+        assert "Conversion failed" in errors[0]
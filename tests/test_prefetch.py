@@ -0,0 +1,151 @@
+"""
+Tests for services/prefetch.py — Look-ahead prefetch tests.
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from unittest.mock import patch
+
+from config import AppSettings
+from models import DownloadItem, DownloadStatus, VideoInfo
+from services.prefetch import Prefetcher
+from services.downloader import DownloadService
+
+
+def make_item(name):
+    info = VideoInfo(url=f"https://youtube.com/watch?v={name}", title=name)
+    return DownloadItem(video_info=info)
+
+
+def wait_until(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestPrefetcher:
+    """Prefetcher tests."""
+
+    def test_resolves_only_the_window(self):
+        items = [make_item(n) for n in "abcde"]
+        resolved = []
+        prefetcher = Prefetcher(
+            upcoming=lambda n: items[:n],
+            needs_refresh=lambda item: item.url not in resolved,
+            resolve=lambda item: resolved.append(item.url),
+            depth=2,
+        )
+        prefetcher.start()
+        try:
+            assert wait_until(lambda: len(resolved) == 2)
+            time.sleep(0.05)
+            assert sorted(resolved) == [items[0].url, items[1].url]
+
+            items.pop(0)  # Window moves on
+            prefetcher.wake()
+            assert wait_until(lambda: items[1].url in resolved)
+        finally:
+            prefetcher.stop()
+
+    def test_failed_item_not_retried_in_loop(self):
+        item = make_item("a")
+        calls = []
+
+        def resolve(i):
+            calls.append(i)
+            raise RuntimeError("network down")
+
+        prefetcher = Prefetcher(lambda n: [item], lambda i: True, resolve, depth=1)
+        prefetcher.start()
+        try:
+            assert wait_until(lambda: prefetcher.stats["failed"] == 1)
+            time.sleep(0.05)
+            assert len(calls) == 1
+        finally:
+            prefetcher.stop()
+
+    def test_forget_allows_another_attempt(self):
+        item = make_item("a")
+        calls = []
+
+        def resolve(i):
+            calls.append(i)
+            raise RuntimeError("network down")
+
+        prefetcher = Prefetcher(lambda n: [item], lambda i: True, resolve, depth=1)
+        prefetcher.start()
+        try:
+            assert wait_until(lambda: prefetcher.stats["failed"] == 1)
+            prefetcher.forget(item.url)
+            prefetcher.wake()
+            assert wait_until(lambda: len(calls) == 2)
+        finally:
+            prefetcher.stop()
+
+    def test_service_forgets_on_remove(self):
+        service = DownloadService(AppSettings(prefetch_depth=0))
+        item = make_item("a")
+        service.add_to_queue(item)
+        service._prefetcher._given_up.add(item.url)
+        service.remove_many([item])
+        assert item.url not in service._prefetcher._given_up
+
+    def test_depth_zero_disabled(self):
+        prefetcher = Prefetcher(lambda n: [], lambda i: True, lambda i: None, depth=0)
+        prefetcher.start()
+        assert prefetcher.stats["resolved"] == 0
+
+
+class TestServicePrefetch:
+    """DownloadService prefetch integration tests."""
+
+    def test_upcoming_items_resolved_before_claim(self):
+        service = DownloadService(AppSettings(max_concurrent=1, prefetch_depth=2))
+        first, second, third = make_item("first"), make_item("second"), make_item("third")
+        for item in (first, second, third):
+            service.add_to_queue(item)
+
+        resolved = set()
+        first_running = threading.Event()
+        release = threading.Event()
+        resolved_at_claim = {}
+
+        def fake_extract(url):
+            resolved.add(url)
+            expire = int(time.time()) + 6 * 3600
+            return VideoInfo(url=url, title=url.split("=")[-1], raw_info={"id": url, "formats": [
+                {"url": f"https://x.googlevideo.com/videoplayback?expire={expire}"}]})
+
+        def fake_download(item):
+            resolved_at_claim[item.title] = item.url in resolved
+            if item is first:
+                first_running.set()
+                assert release.wait(5)
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        done = threading.Event()
+        service.set_callbacks(on_all_complete=done.set)
+        with patch.object(service, "_extract_video_info", side_effect=fake_extract), \
+                patch.object(service, "_download_item", side_effect=fake_download):
+            service.start()
+            assert first_running.wait(5)
+            assert wait_until(lambda: {second.url, third.url} <= resolved)
+            release.set()
+            assert done.wait(5)
+        service.shutdown()
+
+        assert resolved_at_claim["second"] and resolved_at_claim["third"]
+
+    def test_not_running_has_no_upcoming(self):
+        service = DownloadService(AppSettings())
+        service.add_to_queue(make_item("a"))
+        assert service._upcoming_items(3) == []
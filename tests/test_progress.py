@@ -0,0 +1,125 @@
+"""
+Tests for services/progress.py — Progress slot and sampler tests.
+"""
+
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from config import AppSettings
+from models import DownloadItem, DownloadStatus, VideoInfo
+from services.progress import ProgressSampler, ProgressSlot
+from services.downloader import DownloadService
+
+
+def make_item(name="a"):
+    info = VideoInfo(url=f"https://youtube.com/watch?v={name}", title=name)
+    return DownloadItem(video_info=info)
+
+
+def chunk(downloaded, total=1000, speed=100.0, eta=5):
+    return {"status": "downloading", "downloaded_bytes": downloaded,
+            "total_bytes": total, "speed": speed, "eta": eta, "filename": "x.mp4"}
+
+
+class TestProgressSlot:
+    """ProgressSlot tests."""
+
+    def test_update_and_snapshot(self):
+        slot = ProgressSlot()
+        slot.update(chunk(250))
+        progress = slot.snapshot()
+        assert progress.percent == pytest.approx(25.0)
+        assert progress.speed == 100.0
+        assert progress.eta == 5
+        assert progress.filename == "x.mp4"
+        assert slot.version == 1
+
+    def test_estimate_used_when_total_unknown(self):
+        slot = ProgressSlot()
+        slot.update({"downloaded_bytes": 50, "total_bytes_estimate": 200})
+        assert slot.percent == pytest.approx(25.0)
+
+    def test_unknown_total_is_zero_percent(self):
+        slot = ProgressSlot()
+        slot.update({"downloaded_bytes": 50})
+        assert slot.percent == 0.0
+
+
+class TestProgressSampler:
+    """ProgressSampler tests."""
+
+    def test_reports_only_changes(self):
+        item, slot = make_item(), ProgressSlot()
+        sampler = ProgressSampler(lambda: [(item, slot)])
+        assert sampler.poll() == []  # Never written
+
+        slot.update(chunk(100))
+        slot.update(chunk(200))  # Coalesced into one sample
+        changed = sampler.poll()
+        assert len(changed) == 1
+        assert changed[0][1].downloaded_bytes == 200
+        assert item.progress == pytest.approx(20.0)
+        assert sampler.poll() == []
+
+    def test_samplers_are_independent(self):
+        item, slot = make_item(), ProgressSlot()
+        ui = ProgressSampler(lambda: [(item, slot)])
+        metrics = ProgressSampler(lambda: [(item, slot)])
+        slot.update(chunk(100))
+        assert len(ui.poll()) == 1
+        assert len(metrics.poll()) == 1
+
+
+class TestServiceProgress:
+    """DownloadService progress integration tests."""
+
+    def test_hook_does_not_call_on_progress(self):
+        service = DownloadService(AppSettings())
+        on_progress = MagicMock()
+        service.set_callbacks(on_progress=on_progress)
+        item = make_item()
+        service.add_to_queue(item)
+        service._claim_next_item()
+        with service._lock:
+            service._active_items[0] = item
+
+        service._progress_hook(chunk(500), item)
+        on_progress.assert_not_called()
+
+        changed = service.create_progress_sampler().poll()
+        assert [(i, p.percent) for i, p in changed] == [(item, pytest.approx(50.0))]
+
+    def test_hook_ignores_unclaimed_item(self):
+        service = DownloadService(AppSettings())
+        service._progress_hook(chunk(500), make_item())  # No slot, no error
+
+    def test_on_progress_fed_by_sampler_thread(self):
+        settings = AppSettings(progress_interval_ms=10)
+        service = DownloadService(settings)
+        service.add_to_queue(make_item())
+        sampled = threading.Event()
+        calls = []
+
+        def on_progress(item, progress):
+            calls.append(threading.current_thread().name)
+            sampled.set()
+
+        def fake_download(item):
+            for n in range(1, 6):
+                service._progress_hook(chunk(n * 100), item)
+            assert sampled.wait(5)
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        done = threading.Event()
+        service.set_callbacks(on_progress=on_progress, on_all_complete=done.set)
+        with patch.object(service, "_download_item", side_effect=fake_download):
+            service.start()
+            assert done.wait(5)
+
+        assert calls and set(calls) == {"ProgressDispatch"}
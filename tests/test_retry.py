@@ -0,0 +1,184 @@
+"""
+Tests for services/retry.py — Error classification and backoff tests.
+"""
+
+import sys
+import os
+import io
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+import yt_dlp
+from unittest.mock import patch
+from yt_dlp.networking import Response
+from yt_dlp.networking.exceptions import HTTPError, TransportError
+
+from config import AppSettings
+from models import DownloadItem, DownloadStatus, VideoInfo
+from services.retry import DelayQueue, ErrorClass, backoff_delay, classify_error
+from services.downloader import DownloadService
+
+
+def http_error(status):
+    return HTTPError(Response(io.BytesIO(b""), "https://example.com", {}, status=status))
+
+
+def make_item(name):
+    info = VideoInfo(url=f"https://youtube.com/watch?v={name}", title=name)
+    return DownloadItem(video_info=info)
+
+
+class TestClassifyError:
+    """classify_error tests."""
+
+    @pytest.mark.parametrize("status, expected", [
+        (429, ErrorClass.THROTTLED),
+        (403, ErrorClass.THROTTLED),
+        (404, ErrorClass.PERMANENT),
+        (410, ErrorClass.PERMANENT),
+        (500, ErrorClass.TRANSIENT),
+        (503, ErrorClass.TRANSIENT),
+    ])
+    def test_http_status(self, status, expected):
+        assert classify_error(http_error(status)) == expected
+
+    def test_wrapped_http_error(self):
+        cause = http_error(429)
+        try:
+            raise cause
+        except HTTPError:
+            wrapped = yt_dlp.utils.DownloadError("ERROR: unable to download", sys.exc_info())
+        assert classify_error(wrapped) == ErrorClass.THROTTLED
+
+    def test_geo_restricted(self):
+        assert classify_error(yt_dlp.utils.GeoRestrictedError("blocked")) == ErrorClass.PERMANENT
+
+    @pytest.mark.parametrize("message", [
+        "ERROR: [youtube] abc: Private video. Sign in if you've been granted access",
+        "ERROR: [youtube] abc: Video unavailable. This video has been removed by the uploader",
+        "ERROR: [youtube] abc: Sign in to confirm your age",
+        "ERROR: Requested format is not available",
+    ])
+    def test_permanent_messages(self, message):
+        assert classify_error(yt_dlp.utils.DownloadError(message)) == ErrorClass.PERMANENT
+
+    def test_bot_check_is_throttled(self):
+        error = yt_dlp.utils.DownloadError("ERROR: Sign in to confirm you're not a bot")
+        assert classify_error(error) == ErrorClass.THROTTLED
+
+    def test_network_errors_are_transient(self):
+        assert classify_error(TransportError("connection reset")) == ErrorClass.TRANSIENT
+        assert classify_error(OSError("timed out")) == ErrorClass.TRANSIENT
+
+
+class TestBackoff:
+    """backoff_delay tests."""
+
+    def test_exponential_growth(self):
+        top = lambda a, b: b  # Always the upper bound
+        delays = [backoff_delay(n, ErrorClass.TRANSIENT, 2.0, 300.0, rand=top) for n in (1, 2, 3)]
+        assert delays == [2.0, 4.0, 8.0]
+
+    def test_jitter_range(self):
+        low = backoff_delay(3, ErrorClass.TRANSIENT, 2.0, 300.0, rand=lambda a, b: a)
+        assert low == pytest.approx(4.0)  # Never below half the cap
+
+    def test_capped(self):
+        assert backoff_delay(20, ErrorClass.TRANSIENT, 2.0, 60.0, rand=lambda a, b: b) == 60.0
+
+    def test_throttled_backs_off_harder(self):
+        top = lambda a, b: b
+        assert backoff_delay(1, ErrorClass.THROTTLED, 2.0, 300.0, rand=top) > \
+            backoff_delay(1, ErrorClass.TRANSIENT, 2.0, 300.0, rand=top)
+
+
+class TestDelayQueue:
+    """DelayQueue tests."""
+
+    def test_pop_due_in_time_order(self):
+        queue = DelayQueue()
+        a, b, c = make_item("a"), make_item("b"), make_item("c")
+        queue.push(a, 30.0)
+        queue.push(b, 10.0)
+        queue.push(c, 20.0)
+        assert queue.next_due() == 10.0
+        assert [i.title for i in queue.pop_due(25.0)] == ["b", "c"]
+        assert len(queue) == 1
+
+    def test_discard(self):
+        queue = DelayQueue()
+        a = make_item("a")
+        queue.push(a, 1.0)
+        assert queue.discard(a) is True
+        assert queue.pop_due(5.0) == []
+        assert queue.next_due() is None
+
+    def test_repush_replaces(self):
+        queue = DelayQueue()
+        a = make_item("a")
+        queue.push(a, 1.0)
+        queue.push(a, 9.0)
+        assert queue.pop_due(5.0) == []
+        assert queue.pop_due(10.0) == [a]
+
+
+class TestServiceRetry:
+    """DownloadService retry integration tests."""
+
+    def _fail_with(self, service, error):
+        def fake_download(item):
+            service._last_errors[item.url] = classify_error(error)
+            item.status = DownloadStatus.FAILED
+            return False
+        return fake_download
+
+    def test_permanent_error_not_retried(self):
+        service = DownloadService(AppSettings())
+        service.add_to_queue(make_item("private"))
+        calls = []
+        fail = self._fail_with(service, yt_dlp.utils.DownloadError("Private video"))
+
+        done = threading.Event()
+        service.set_callbacks(on_all_complete=done.set)
+        with patch.object(service, "_download_item", side_effect=lambda i: calls.append(i) or fail(i)):
+            service.start()
+            assert done.wait(5)
+
+        assert len(calls) == 1
+        assert service.failed_count == 1
+        assert service.queue[0].status == DownloadStatus.FAILED
+
+    def test_worker_not_blocked_by_backoff(self):
+        service = DownloadService(AppSettings(max_concurrent=1))
+        flaky, other = make_item("flaky"), make_item("other")
+        service.add_to_queue(flaky)
+        service.add_to_queue(other)
+        order = []
+        fail = self._fail_with(service, TransportError("reset"))
+
+        def fake_download(item):
+            order.append(item.title)
+            if item is flaky and order.count("flaky") == 1:
+                return fail(item)
+            item.status = DownloadStatus.COMPLETED
+            return True
+
+        done = threading.Event()
+        service.set_callbacks(on_all_complete=done.set)
+        with patch.object(service, "_download_item", side_effect=fake_download), \
+                patch.object(DownloadService, "RETRY_DELAY", 0.2):
+            service.start()
+            assert done.wait(5)
+
+        assert order == ["flaky", "other", "flaky"]
+        assert service.completed_count == 2
+        assert flaky.attempts == 0
+
+    def test_cancel_drops_parked_item(self):
+        service = DownloadService(AppSettings())
+        item = make_item("a")
+        service.add_to_queue(item)
+        service._delayed.push(item, 1e18)
+        assert service.cancel_item(item) is True
+        assert item not in service._delayed
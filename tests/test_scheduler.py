@@ -0,0 +1,191 @@
+"""
+Tests for services/scheduler.py — Queue scheduling policy tests.
+"""
+
+import sys
+import os
+import random
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from config import AppSettings
+from models import DownloadItem, DownloadFormat, VideoInfo
+from services.scheduler import QueueScheduler, SchedulingPolicy, estimate_item_bytes
+from services.downloader import DownloadService
+
+
+def make_item(name, size=0, duration=0, group="", priority=0):
+    """Create a DownloadItem with the given scheduling attributes."""
+    info = VideoInfo(url=f"https://youtube.com/watch?v={name}", title=name,
+                     filesize_approx=size, duration=duration)
+    return DownloadItem(video_info=info, group=group, priority=priority)
+
+
+def drain(scheduler):
+    """Pop everything and return the titles in order."""
+    titles = []
+    while True:
+        item = scheduler.pop()
+        if item is None:
+            return titles
+        titles.append(item.title)
+
+
+class TestQueueScheduler:
+    """QueueScheduler tests."""
+
+    def test_fifo_order(self):
+        scheduler = QueueScheduler()
+        for name in ("a", "b", "c"):
+            scheduler.push(make_item(name))
+        assert drain(scheduler) == ["a", "b", "c"]
+
+    def test_push_is_idempotent(self):
+        scheduler = QueueScheduler()
+        item = make_item("a")
+        assert scheduler.push(item) is True
+        assert scheduler.push(item) is False
+        assert len(scheduler) == 1
+
+    def test_discard(self):
+        scheduler = QueueScheduler()
+        a, b = make_item("a"), make_item("b")
+        scheduler.push(a)
+        scheduler.push(b)
+        assert scheduler.discard(a) is True
+        assert a not in scheduler
+        assert drain(scheduler) == ["b"]
+
+    def test_priority_policy(self):
+        scheduler = QueueScheduler(SchedulingPolicy.PRIORITY)
+        scheduler.push(make_item("low", priority=0))
+        scheduler.push(make_item("high", priority=5))
+        scheduler.push(make_item("mid", priority=2))
+        assert drain(scheduler) == ["high", "mid", "low"]
+
+    def test_set_priority_rekeys(self):
+        scheduler = QueueScheduler(SchedulingPolicy.PRIORITY)
+        a, b = make_item("a"), make_item("b")
+        scheduler.push(a)
+        scheduler.push(b)
+        scheduler.set_priority(b, 10)
+        assert drain(scheduler) == ["b", "a"]
+
+    def test_shortest_first_policy(self):
+        scheduler = QueueScheduler(SchedulingPolicy.SHORTEST_FIRST)
+        scheduler.push(make_item("unknown"))
+        scheduler.push(make_item("big", size=500_000_000))
+        scheduler.push(make_item("small", size=1_000_000))
+        scheduler.push(make_item("short", duration=10))
+        assert drain(scheduler) == ["small", "short", "big", "unknown"]
+
+    def test_round_robin_between_playlists(self):
+        scheduler = QueueScheduler(SchedulingPolicy.ROUND_ROBIN)
+        for n in range(100):
+            scheduler.push(make_item(f"pl{n}", group="playlist"))
+        scheduler.pop()
+        scheduler.pop()
+        scheduler.push(make_item("interactive"))
+        assert scheduler.pop().title == "interactive"
+
+    def test_round_robin_interleaves_groups(self):
+        scheduler = QueueScheduler(SchedulingPolicy.ROUND_ROBIN)
+        for n in range(3):
+            scheduler.push(make_item(f"a{n}", group="A"))
+        for n in range(3):
+            scheduler.push(make_item(f"b{n}", group="B"))
+        assert drain(scheduler) == ["a0", "b0", "a1", "b1", "a2", "b2"]
+
+    def test_set_order_moves_item(self):
+        scheduler = QueueScheduler()
+        items = [make_item(name) for name in ("a", "b", "c")]
+        for item in items:
+            scheduler.push(item)
+        scheduler.set_order(items[2], -1.0)
+        assert drain(scheduler) == ["c", "a", "b"]
+
+    def test_set_policy_rebuilds(self):
+        scheduler = QueueScheduler()
+        scheduler.push(make_item("big", size=100))
+        scheduler.push(make_item("small", size=1))
+        scheduler.set_policy(SchedulingPolicy.SHORTEST_FIRST)
+        assert drain(scheduler) == ["small", "big"]
+
+    def test_dead_entries_are_compacted(self):
+        scheduler = QueueScheduler(SchedulingPolicy.PRIORITY)
+        item = make_item("a")
+        scheduler.push(item)
+        for n in range(1000):
+            scheduler.set_priority(item, n)
+        assert len(scheduler._heap) < 200
+        assert drain(scheduler) == ["a"]
+
+    def test_peek_does_not_remove(self):
+        scheduler = QueueScheduler(SchedulingPolicy.PRIORITY)
+        for name, priority in (("a", 0), ("b", 5), ("c", 1)):
+            scheduler.push(make_item(name, priority=priority))
+        scheduler.discard(make_item("c"))
+        assert [i.title for i in scheduler.peek(5)] == ["b", "a"]
+        assert drain(scheduler) == ["b", "a"]
+
+    def test_peek_matches_pop_order(self):
+        rng = random.Random(7)
+        scheduler = QueueScheduler(SchedulingPolicy.PRIORITY)
+        items = [make_item(f"i{n}", priority=rng.randrange(5)) for n in range(300)]
+        for item in items:
+            scheduler.push(item)
+        for item in rng.sample(items, 100):
+            scheduler.discard(item)
+        for item in rng.sample(items, 50):
+            scheduler.set_priority(item, rng.randrange(5))
+        peeked = [i.title for i in scheduler.peek(20)]
+        assert drain(scheduler)[:20] == peeked
+
+    def test_peek_visits_only_the_top(self):
+        scheduler = QueueScheduler()
+        for n in range(10_000):
+            scheduler.push(make_item(f"i{n}"))
+        heap = scheduler._heap
+
+        class Counting(list):
+            reads = 0
+
+            def __getitem__(self, index):
+                Counting.reads += 1
+                return list.__getitem__(self, index)
+
+        scheduler._heap = Counting(heap)
+        assert [i.title for i in scheduler.peek(3)] == ["i0", "i1", "i2"]
+        assert Counting.reads < 50
+
+    def test_estimate_audio_smaller_than_video(self):
+        video = make_item("v", duration=60)
+        audio = make_item("a", duration=60)
+        audio.format = DownloadFormat.AUDIO
+        assert estimate_item_bytes(audio) < estimate_item_bytes(video)
+
+
+class TestServiceScheduling:
+    """DownloadService + scheduler integration tests."""
+
+    def test_move_changes_claim_order(self):
+        service = DownloadService(AppSettings())
+        for name in ("a", "b", "c"):
+            service.add_to_queue(make_item(name))
+        service.move_in_queue(2, 0)
+        assert [i.title for i in service.queue] == ["c", "a", "b"]
+        assert service._claim_next_item().title == "c"
+        assert service._claim_next_item().title == "a"
+
+    def test_unknown_policy_falls_back_to_fifo(self):
+        service = DownloadService(AppSettings(scheduling_policy="bogus"))
+        assert service._scheduler.policy == SchedulingPolicy.FIFO
+
+    def test_removed_item_is_not_claimed(self):
+        service = DownloadService(AppSettings())
+        service.add_to_queue(make_item("a"))
+        service.add_to_queue(make_item("b"))
+        service.remove_from_queue(0)
+        assert service._claim_next_item().title == "b"
+        assert service._claim_next_item() is None
@@ -0,0 +1,168 @@
+"""
+Tests for services/ydl_pool.py — YoutubeDL pool tests.
+"""
+
+import sys
+import os
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest
+
+from config import AppSettings
+from services.ydl_pool import YoutubeDLPool, profile_key
+from services.downloader import DownloadService
+
+
+class FakeYDL:
+    """Stand-in for yt_dlp.YoutubeDL that records its lifecycle."""
+
+    instances = []
+
+    def __init__(self, params):
+        self.params = params
+        self.closed = False
+        self._download_retcode = 0
+        FakeYDL.instances.append(self)
+
+    def fire(self, key, d):
+        for hook in self.params.get(key, []):
+            hook(d)
+
+    def extract_info(self, url, download=False):
+        return {"id": url[-4:], "title": f"Title {url[-4:]}", "duration": 60}
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def reset_fake():
+    FakeYDL.instances = []
+
+
+@pytest.fixture
+def pool():
+    return YoutubeDLPool(max_idle=4, factory=FakeYDL)
+
+
+class TestYoutubeDLPool:
+    """YoutubeDLPool tests."""
+
+    def test_instance_reused_for_same_profile(self, pool):
+        with pool.checkout({"quiet": True}) as first:
+            pass
+        with pool.checkout({"quiet": True}) as second:
+            pass
+        assert first is second
+        assert pool.stats == {"created": 1, "reused": 1, "idle": 1}
+
+    def test_profiles_are_separate(self, pool):
+        with pool.checkout({"extract_flat": True}) as flat:
+            pass
+        with pool.checkout({"extract_flat": False}) as full:
+            pass
+        assert flat is not full
+
+    def test_hooks_do_not_split_profile(self):
+        assert profile_key({"quiet": True, "progress_hooks": [print]}) == \
+            profile_key({"quiet": True, "progress_hooks": [len]})
+
+    def test_tuned_options_applied_per_checkout(self, pool):
+        with pool.checkout({"quiet": True, "concurrent_fragment_downloads": 8,
+                            "http_chunk_size": 1024}) as first:
+            assert first.params["concurrent_fragment_downloads"] == 8
+        with pool.checkout({"quiet": True, "concurrent_fragment_downloads": 2}) as second:
+            assert second.params["concurrent_fragment_downloads"] == 2
+            assert "http_chunk_size" not in second.params
+        assert first is second
+
+    def test_hooks_rebound_per_checkout(self, pool):
+        seen = []
+        with pool.checkout({"progress_hooks": [lambda d: seen.append(("a", d))]}) as ydl:
+            ydl.fire("progress_hooks", 1)
+        with pool.checkout({"progress_hooks": [lambda d: seen.append(("b", d))]}) as ydl:
+            ydl.fire("progress_hooks", 2)
+        assert seen == [("a", 1), ("b", 2)]
+
+    def test_post_hooks_relayed(self, pool):
+        seen = []
+        with pool.checkout({"post_hooks": [seen.append]}) as ydl:
+            ydl.fire("post_hooks", "/d/final.mp4")
+        assert seen == ["/d/final.mp4"]
+
+    def test_idle_instance_has_no_hooks(self, pool):
+        seen = []
+        with pool.checkout({"progress_hooks": [seen.append]}) as ydl:
+            pass
+        ydl.fire("progress_hooks", 1)
+        assert seen == []
+
+    def test_failed_checkout_is_not_reused(self, pool):
+        with pytest.raises(RuntimeError):
+            with pool.checkout({}) as broken:
+                raise RuntimeError("boom")
+        assert broken.closed
+        with pool.checkout({}) as fresh:
+            pass
+        assert fresh is not broken
+
+    def test_concurrent_checkouts_are_exclusive(self, pool):
+        barrier = threading.Barrier(3, timeout=5)
+        held = []
+        lock = threading.Lock()
+
+        def worker():
+            with pool.checkout({}) as ydl:
+                with lock:
+                    held.append(ydl)
+                barrier.wait()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+        assert len({id(y) for y in held}) == 3
+
+    def test_idle_bounded_lru(self):
+        pool = YoutubeDLPool(max_idle=2, factory=FakeYDL)
+        for n in range(3):
+            with pool.checkout({"profile": n}):
+                pass
+        assert pool.idle_count == 2
+        assert FakeYDL.instances[0].closed
+        assert not FakeYDL.instances[2].closed
+
+    def test_warm_precreates(self, pool):
+        pool.warm({"quiet": True})
+        pool.warm({"quiet": True})
+        assert pool.stats["created"] == 1
+        with pool.checkout({"quiet": True}):
+            pass
+        assert pool.stats["reused"] == 1
+
+    def test_close_closes_idle_and_returns(self, pool):
+        with pool.checkout({}) as ydl:
+            pool.close()
+        assert ydl.closed
+        assert pool.idle_count == 0
+
+
+class TestServicePool:
+    """DownloadService + pool integration tests."""
+
+    def test_get_video_info_reuses_instance(self):
+        service = DownloadService(AppSettings())
+        service._ydl_pool = YoutubeDLPool(factory=FakeYDL)
+        service.get_video_info("https://youtube.com/watch?v=aaaa")
+        service.get_video_info("https://youtube.com/watch?v=bbbb")
+        assert len(FakeYDL.instances) == 1
+
+    def test_warm_up_then_fetch_creates_nothing(self):
+        service = DownloadService(AppSettings())
+        service._ydl_pool = YoutubeDLPool(factory=FakeYDL)
+        service.warm_up()
+        created = len(FakeYDL.instances)
+        service.get_video_info("https://youtube.com/watch?v=cccc")
+        assert len(FakeYDL.instances) == created
@@ -10,7 +10,10 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, simpledialog
 from typing import Optional, Callable, List, Dict, Any
 
-from config import THEME, COLORS, VIDEO_QUALITIES, AUDIO_QUALITIES, SPEED_LIMITS, SUBTITLE_LANGUAGES
+from config import (
+    THEME, COLORS, VIDEO_QUALITIES, AUDIO_QUALITIES, SPEED_LIMITS, SUBTITLE_LANGUAGES,
+    MAX_CONCURRENT_DOWNLOADS, SCHEDULING_POLICIES, MAX_CONCURRENT_FRAGMENTS, CHUNK_SIZES,
+)
 
 
 class VideoInfoCard(ttk.Frame):
@@ -188,7 +191,7 @@ class SettingsDialog(tk.Toplevel):
     def __init__(self, parent: tk.Widget, settings, on_save: Optional[Callable] = None):
         super().__init__(parent)
         self.title("⚙️ Settings")
-        self.geometry("500x550")
+        self.geometry("500x730")
         self.configure(bg=THEME["bg"])
         self.resizable(False, False)
         self.transient(parent)
@@ -239,13 +242,53 @@ class SettingsDialog(tk.Toplevel):
                      state="readonly", width=20).pack(side="left")
 
         row4 = ttk.Frame(dl_frame)
-        row4.pack(fill="x")
+        row4.pack(fill="x", pady=(0, 8))
         ttk.Label(row4, text="Speed Limit:").pack(side="left", padx=(0, 10))
         self._speed_var = tk.StringVar()
         ttk.Combobox(row4, textvariable=self._speed_var,
                      values=[s[0] for s in SPEED_LIMITS],
                      state="readonly", width=15).pack(side="left")
 
+        row5 = ttk.Frame(dl_frame)
+        row5.pack(fill="x")
+        ttk.Label(row5, text="Parallel Downloads:").pack(side="left", padx=(0, 10))
+        self._concurrent_var = tk.IntVar()
+        ttk.Spinbox(row5, textvariable=self._concurrent_var,
+                    from_=1, to=MAX_CONCURRENT_DOWNLOADS, state="readonly",
+                    width=5).pack(side="left")
+        self._adaptive_concurrency_var = tk.BooleanVar()
+        ttk.Checkbutton(row5, text="Adapt to throughput",
+                        variable=self._adaptive_concurrency_var).pack(side="left", padx=(15, 0))
+
+        row6 = ttk.Frame(dl_frame)
+        row6.pack(fill="x", pady=(8, 0))
+        ttk.Label(row6, text="Queue Order:").pack(side="left", padx=(0, 10))
+        self._policy_var = tk.StringVar()
+        ttk.Combobox(row6, textvariable=self._policy_var,
+                     values=[p[0] for p in SCHEDULING_POLICIES],
+                     state="readonly", width=22).pack(side="left")
+
+        row7 = ttk.Frame(dl_frame)
+        row7.pack(fill="x", pady=(8, 0))
+        ttk.Label(row7, text="Parallel Fragments:").pack(side="left", padx=(0, 10))
+        self._fragments_var = tk.IntVar()
+        ttk.Spinbox(row7, textvariable=self._fragments_var,
+                    from_=1, to=MAX_CONCURRENT_FRAGMENTS, state="readonly",
+                    width=5).pack(side="left")
+        ttk.Label(row7, text="Chunk Size:").pack(side="left", padx=(15, 10))
+        self._chunk_var = tk.StringVar()
+        ttk.Combobox(row7, textvariable=self._chunk_var,
+                     values=[c[0] for c in CHUNK_SIZES],
+                     state="readonly", width=8).pack(side="left")
+
+        self._adaptive_var = tk.BooleanVar()
+        ttk.Checkbutton(dl_frame, text="Tune fragments and chunk size automatically",
+                        variable=self._adaptive_var).pack(anchor="w", pady=(8, 0))
+
+        self._avoid_transcode_var = tk.BooleanVar()
+        ttk.Checkbutton(dl_frame, text="Avoid re-encoding (native M4A/Opus audio, copied video streams)",
+                        variable=self._avoid_transcode_var).pack(anchor="w", pady=(5, 0))
+
         # Subtitle settings
         sub_frame = ttk.LabelFrame(main, text="Subtitles", padding=10)
         sub_frame.pack(fill="x", pady=(0, 10))
@@ -283,6 +326,11 @@ class SettingsDialog(tk.Toplevel):
         self._sub_enabled.set(self._settings.subtitle_enabled)
         self._embed_subs.set(self._settings.embed_subtitles)
         self._clipboard_var.set(self._settings.clipboard_monitor)
+        self._concurrent_var.set(self._settings.max_concurrent)
+        self._adaptive_concurrency_var.set(self._settings.adaptive_concurrency)
+        self._fragments_var.set(self._settings.concurrent_fragments)
+        self._adaptive_var.set(self._settings.adaptive_fragments)
+        self._avoid_transcode_var.set(self._settings.avoid_transcode)
 
         # Audio quality
         for name, code in AUDIO_QUALITIES:
@@ -296,6 +344,18 @@ class SettingsDialog(tk.Toplevel):
                 self._speed_var.set(name)
                 break
 
+        # Scheduling policy
+        for name, value in SCHEDULING_POLICIES:
+            if value == self._settings.scheduling_policy:
+                self._policy_var.set(name)
+                break
+
+        # HTTP chunk size
+        for name, value in CHUNK_SIZES:
+            if value == self._settings.http_chunk_size:
+                self._chunk_var.set(name)
+                break
+
         # Subtitle language
         for name, code in SUBTITLE_LANGUAGES:
             if code == self._settings.subtitle_language:
@@ -308,6 +368,13 @@ class SettingsDialog(tk.Toplevel):
         self._settings.subtitle_enabled = self._sub_enabled.get()
         self._settings.embed_subtitles = self._embed_subs.get()
         self._settings.clipboard_monitor = self._clipboard_var.get()
+        self._settings.max_concurrent = max(
+            1, min(MAX_CONCURRENT_DOWNLOADS, self._concurrent_var.get()))
+        self._settings.adaptive_concurrency = self._adaptive_concurrency_var.get()
+        self._settings.concurrent_fragments = max(
+            1, min(MAX_CONCURRENT_FRAGMENTS, self._fragments_var.get()))
+        self._settings.adaptive_fragments = self._adaptive_var.get()
+        self._settings.avoid_transcode = self._avoid_transcode_var.get()
 
         # Audio quality
         audio_name = self._audio_q_var.get()
@@ -323,6 +390,20 @@ class SettingsDialog(tk.Toplevel):
                 self._settings.speed_limit = value
                 break
 
+        # Scheduling policy
+        policy_name = self._policy_var.get()
+        for name, value in SCHEDULING_POLICIES:
+            if name == policy_name:
+                self._settings.scheduling_policy = value
+                break
+
+        # HTTP chunk size
+        chunk_name = self._chunk_var.get()
+        for name, value in CHUNK_SIZES:
+            if name == chunk_name:
+                self._settings.http_chunk_size = value
+                break
+
         # Subtitle language
         lang_str = self._sub_lang_var.get()
         for name, code in SUBTITLE_LANGUAGES:
@@ -11,7 +11,7 @@ import logging
 import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
-from typing import Optional, List
+from typing import Dict, List, Optional, Tuple
 
 from config import (
     APP_NAME, APP_VERSION, APP_ICON, THEME, COLORS,
@@ -20,11 +20,14 @@ from config import (
 )
 from models import (
     DownloadItem, DownloadStatus, DownloadFormat,
-    DownloadProgress, VideoInfo,
+    DownloadProgress, QueueChange, VideoInfo,
 )
 from services.downloader import DownloadService, check_ffmpeg
 from services.thumbnail import ThumbnailService
 from services.history import HistoryService
+from services.journal import QueueJournal
+from services.metadata_store import MetadataStore
+from services.partials import PartialRegistry
 from ui.styles import setup_styles
 from ui.components import (
     VideoInfoCard, DownloadProgressCard, StyledText,
@@ -48,7 +51,11 @@ class MainWindow:
         self.settings = settings
 
         # Services
-        self.download_service = DownloadService(settings)
+        self.metadata_store = MetadataStore()
+        self.download_service = DownloadService(
+            settings, journal=QueueJournal(), metadata_store=self.metadata_store,
+            partials=PartialRegistry(),
+        )
         self.thumbnail_service = ThumbnailService()
         self.history_service = HistoryService()
 
@@ -58,13 +65,18 @@ class MainWindow:
         self._format_var = tk.StringVar(value=settings.format)
         self._quality_var = tk.StringVar(value=settings.video_quality)
         self._status_var = tk.StringVar(value="Ready to download")
-        self._speed_limit_var = tk.StringVar(value="No Limit")
+        self._speed_limit_var = tk.StringVar(value=next(
+            (name for name, value in SPEED_LIMITS if value == settings.speed_limit), "No Limit"))
         self._subtitle_var = tk.BooleanVar(value=settings.subtitle_enabled)
         self._subtitle_lang_var = tk.StringVar(value=settings.subtitle_language)
         self._embed_subs_var = tk.BooleanVar(value=settings.embed_subtitles)
         self._clipboard_last = ""
         self._current_thumbnail = None
         self._download_start_time = None
+        self._queue_lines: List[str] = []  # URL shown on each queue_text line
+        self._queue_line_index: Dict[str, int] = {}  # URL -> line (0-based)
+        self._pending_change: Optional[QueueChange] = None  # Not yet drawn
+        self._change_lock = threading.Lock()
 
         # Setup
         self._configure_window()
@@ -74,6 +86,24 @@ class MainWindow:
         self._setup_callbacks()
         self._setup_bindings()
         self._load_history()
+        self._restore_queue()
+
+        # Progress is pulled at a fixed rate, not pushed per chunk
+        self._progress_sampler = self.download_service.create_progress_sampler()
+        self._poll_progress()
+
+        # Pre-warm yt-dlp instances so the first URL doesn't pay for init
+        threading.Thread(
+            target=self.download_service.warm_up, daemon=True, name="YDLWarmUp",
+        ).start()
+
+        # Drop .part files nobody will resume (restored items keep theirs)
+        threading.Thread(
+            target=self.download_service.cleanup_partials, daemon=True, name="PartialCleanup",
+        ).start()
+        threading.Thread(
+            target=self.metadata_store.prune, daemon=True, name="MetadataPrune",
+        ).start()
 
         # FFmpeg check
         self._check_ffmpeg_on_start()
@@ -94,6 +124,17 @@ class MainWindow:
         self.root.configure(bg=THEME["bg"])
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+    def _restore_queue(self) -> None:
+        """Reload the queue saved by the previous session."""
+        try:
+            restored = self.download_service.restore_queue()
+        except Exception as e:
+            logger.error(f"Queue restore error: {e}")
+            return
+        if restored:
+            self._status_var.set(f"♻️ Restored {restored} queued item(s) from last session")
+            self._update_queue_display()
+
     def _check_ffmpeg_on_start(self) -> None:
         """Check FFmpeg availability and warn if missing."""
         if not check_ffmpeg():
@@ -289,10 +330,12 @@ class MainWindow:
         right2.pack(side="right")
 
         ttk.Label(right2, text="Speed:").pack(side="left", padx=(0, 8))
-        ttk.Combobox(
+        speed_combo = ttk.Combobox(
             right2, textvariable=self._speed_limit_var,
             values=[s[0] for s in SPEED_LIMITS], state="readonly", width=12,
-        ).pack(side="left")
+        )
+        speed_combo.pack(side="left")
+        speed_combo.bind("<<ComboboxSelected>>", lambda e: self._apply_speed_limit())
 
     def _build_output_dir(self, parent: ttk.Frame) -> None:
         """Build the output directory selector."""
@@ -326,6 +369,9 @@ class MainWindow:
         self._queue_context_menu.add_command(label="🔄 Retry Failed", command=self._retry_failed)
         self._queue_context_menu.add_command(label="✅ Remove Completed", command=self._remove_completed)
         self._queue_context_menu.add_separator()
+        self._queue_context_menu.add_command(label="⏯️ Pause/Resume Item", command=self._toggle_pause_selected)
+        self._queue_context_menu.add_command(label="⏹️ Cancel Item", command=self._cancel_selected)
+        self._queue_context_menu.add_separator()
         self._queue_context_menu.add_command(label="⬆️ Move Up", command=lambda: self._move_queue_item(-1))
         self._queue_context_menu.add_command(label="⬇️ Move Down", command=lambda: self._move_queue_item(1))
         self._queue_context_menu.add_separator()
@@ -410,10 +456,9 @@ class MainWindow:
     def _setup_callbacks(self) -> None:
         """Register download service callbacks."""
         self.download_service.set_callbacks(
-            on_progress=self._on_download_progress,
             on_complete=self._on_download_complete,
             on_error=self._on_download_error,
-            on_queue_changed=self._update_queue_display,
+            on_queue_delta=self._on_queue_delta,
             on_status_changed=self._on_status_changed,
             on_all_complete=self._on_all_downloads_complete,
         )
@@ -460,6 +505,33 @@ class MainWindow:
                 self._status_var.set(f"🗑️ Removed: {removed.title}")
                 self._update_queue_display()
 
+    def _get_queue_selected_item(self) -> Optional[DownloadItem]:
+        """Get the queue item under the cursor, if any."""
+        idx = self._get_queue_selected_index()
+        queue = self.download_service.queue
+        if 0 <= idx < len(queue):
+            return queue[idx]
+        return None
+
+    def _toggle_pause_selected(self) -> None:
+        """Pause or resume only the selected item."""
+        item = self._get_queue_selected_item()
+        if item is None:
+            return
+        if item.status == DownloadStatus.PAUSED:
+            if self.download_service.resume_item(item):
+                self._status_var.set(f"▶️ Resumed: {item.title}")
+        elif self.download_service.pause_item(item):
+            self._status_var.set(f"⏸️ Paused: {item.title}")
+        self._update_queue_display()
+
+    def _cancel_selected(self) -> None:
+        """Cancel only the selected item."""
+        item = self._get_queue_selected_item()
+        if item and self.download_service.cancel_item(item):
+            self._status_var.set(f"🚫 Cancelled: {item.title}")
+            self._update_queue_display()
+
     def _move_queue_item(self, direction: int) -> None:
         """Move a queue item up or down."""
         idx = self._get_queue_selected_index()
@@ -496,45 +568,41 @@ class MainWindow:
                 target=self._process_playlist, args=(url,), daemon=True,
             ).start()
         else:
-            threading.Thread(
-                target=self._process_single_url, args=(url,), daemon=True,
-            ).start()
+            # Resolved on the service's shared, bounded metadata pool
+            self.download_service.fetch_video_infos_async([url], self._on_info_fetched)
+
+    def _on_info_fetched(
+        self, url: str, info: Optional[VideoInfo], error: Optional[BaseException],
+    ) -> None:
+        """Queue a resolved URL (metadata pool thread)."""
+        if error is not None:
+            self.root.after(0, lambda: self._status_var.set(f"❌ Error: {str(error)}"))
+            return
+        item = DownloadItem(
+            video_info=info,
+            format=DownloadFormat(self._format_var.get()),
+            quality=self._quality_var.get(),
+        )
+        if self.download_service.add_to_queue(item):
+            self.root.after(0, lambda i=info: self._on_url_added(i))
+        else:
+            self.root.after(0, lambda: self._status_var.set("⚠️ Duplicate URL — skipped"))
 
-    def _process_single_url(self, url: str) -> None:
-        """Process a single URL (background thread)."""
-        try:
-            info = self.download_service.get_video_info(url)
-            item = DownloadItem(
-                video_info=info,
-                format=DownloadFormat(self._format_var.get()),
-                quality=self._quality_var.get(),
-            )
-            added = self.download_service.add_to_queue(item)
+    def _process_playlist(self, url: str) -> None:
+        """Process a playlist URL (background thread)."""
+        fmt = DownloadFormat(self._format_var.get())
+        quality = self._quality_var.get()
 
-            if added:
-                self.root.after(0, lambda i=info: self._on_url_added(i))
-            else:
-                self.root.after(0, lambda: self._status_var.set("⚠️ Duplicate URL — skipped"))
+        def make_item(video_info: VideoInfo) -> DownloadItem:
+            return DownloadItem(video_info=video_info, format=fmt, quality=quality, group=url)
 
-        except Exception as e:
-            self.root.after(0, lambda: self._status_var.set(f"❌ Error: {str(e)}"))
+        def on_chunk(added: int, skipped: int) -> None:
+            self.root.after(0, lambda: self._status_var.set(
+                f"📋 Playlist: {added} videos added so far..."))
 
-    def _process_playlist(self, url: str) -> None:
-        """Process a playlist URL (background thread)."""
         try:
-            items = self.download_service.get_playlist_items(url)
-            count = 0
-            skipped = 0
-            for video_info in items:
-                item = DownloadItem(
-                    video_info=video_info,
-                    format=DownloadFormat(self._format_var.get()),
-                    quality=self._quality_var.get(),
-                )
-                if self.download_service.add_to_queue(item):
-                    count += 1
-                else:
-                    skipped += 1
+            # Entries are queued chunk by chunk while the playlist is still enumerating
+            count, skipped = self.download_service.ingest_playlist(url, make_item, on_chunk)
 
             msg = f"✅ Playlist: {count} videos added"
             if skipped > 0:
@@ -578,11 +646,7 @@ class MainWindow:
         self.settings.output_dir = self._output_dir_var.get()
 
         # Speed limit
-        speed_name = self._speed_limit_var.get()
-        for name, value in SPEED_LIMITS:
-            if name == speed_name:
-                self.settings.speed_limit = value
-                break
+        self._apply_speed_limit()
 
         # Subtitle settings
         self.settings.subtitle_enabled = self._subtitle_var.get()
@@ -599,6 +663,14 @@ class MainWindow:
         self._pause_btn.config(state="normal")
         self._status_var.set("⬇️ Downloading...")
 
+    def _apply_speed_limit(self) -> None:
+        """Apply the selected speed limit (takes effect on running downloads)."""
+        speed_name = self._speed_limit_var.get()
+        for name, value in SPEED_LIMITS:
+            if name == speed_name:
+                self.download_service.set_speed_limit(value)
+                break
+
     def _toggle_pause(self) -> None:
         """Toggle pause/resume."""
         if self.download_service.is_paused:
@@ -637,7 +709,6 @@ class MainWindow:
     def _clear_queue(self) -> None:
         """Clear the download queue."""
         self.download_service.clear_queue()
-        self.queue_text.delete("1.0", tk.END)
         self.video_card.clear()
         self.progress_card.reset()
         self._status_var.set("Queue cleared")
@@ -666,9 +737,16 @@ class MainWindow:
     # Download Callbacks (background thread -> main thread)
     # ========================================================
 
-    def _on_download_progress(self, item: DownloadItem, progress: DownloadProgress) -> None:
-        """Progress callback (called from background thread)."""
-        self.root.after(0, lambda p=progress, i=item: self._update_progress_ui(i, p))
+    def _poll_progress(self) -> None:
+        """Sample active downloads' progress (main thread, self-rescheduling)."""
+        try:
+            changed = self._progress_sampler.poll()
+            if changed:
+                item, progress = changed[-1]
+                self._update_progress_ui(item, progress)
+        except Exception as e:
+            logger.error(f"Progress poll error: {e}")
+        self.root.after(max(10, self.settings.progress_interval_ms), self._poll_progress)
 
     def _update_progress_ui(self, item: DownloadItem, progress: DownloadProgress) -> None:
         """Update progress UI (main thread)."""
@@ -709,7 +787,21 @@ class MainWindow:
 
     def _on_status_changed(self, item: DownloadItem) -> None:
         """Status change callback."""
-        self.root.after(0, self._update_queue_display)
+        self._on_queue_delta(QueueChange(updated=[item]))
+
+    def _on_queue_delta(self, change: QueueChange) -> None:
+        """Queue change callback (any thread).
+
+        Changes arriving before the main loop gets to them are merged, so a
+        burst of events costs one patch of the queue view.
+        """
+        with self._change_lock:
+            scheduled = self._pending_change is not None
+            self._pending_change = (
+                self._pending_change.merge(change) if scheduled else change
+            )
+        if not scheduled:
+            self.root.after(0, self._apply_queue_change)
 
     def _on_all_downloads_complete(self) -> None:
         """Called when all downloads are finished (background thread)."""
@@ -750,33 +842,86 @@ class MainWindow:
     # ========================================================
 
     def _update_queue_display(self) -> None:
-        """Refresh the queue display."""
+        """Redraw the whole queue display."""
         self.queue_text.delete("1.0", tk.END)
-        for item in self.download_service.queue:
-            icon = item.status_icon
-            progress_str = f" [{item.progress:.0f}%]" if item.progress > 0 else ""
-
-            # Color by status
-            if item.status == DownloadStatus.DOWNLOADING:
-                tag = "info"
-            elif item.status == DownloadStatus.COMPLETED:
-                tag = "success"
-            elif item.status == DownloadStatus.FAILED:
-                tag = "error"
-            elif item.status == DownloadStatus.PAUSED:
-                tag = "warning"
-            else:
-                tag = "dim"
-
-            error_str = f" — {item.error_message[:50]}" if item.error_message else ""
-            self.queue_text.insert(
-                tk.END,
-                f"{icon} {item.title}{progress_str}{error_str}\n",
-                tag,
+        queue = self.download_service.queue
+        for item in queue:
+            text, tag = self._format_queue_line(item)
+            self.queue_text.insert(tk.END, text, tag)
+        self._queue_lines = [item.url for item in queue]
+        self._queue_line_index = {url: n for n, url in enumerate(self._queue_lines)}
+        self._update_tab_labels()
+        self._update_counter()
+
+    def _apply_queue_change(self) -> None:
+        """Patch the queue display with the pending change (main thread).
+
+        Only the affected lines are touched: a playlist chunk appends its
+        lines instead of redrawing every item already shown.
+        """
+        with self._change_lock:
+            change, self._pending_change = self._pending_change, None
+        if change is None:
+            return
+        if change.reordered:
+            self._update_queue_display()
+            return
+
+        if change.removed:
+            lines = sorted(
+                {self._queue_line_index[i.url] for i in change.removed
+                 if i.url in self._queue_line_index},
+                reverse=True,
             )
+            for n in lines:
+                self.queue_text.delete(f"{n + 1}.0", f"{n + 2}.0")
+                del self._queue_lines[n]
+            if lines:
+                self._queue_line_index = {url: n for n, url in enumerate(self._queue_lines)}
+
+        updated = list(change.updated)
+        for item in change.added:
+            if item.url in self._queue_line_index:
+                updated.append(item)  # Already drawn (e.g. by a full redraw)
+                continue
+            text, tag = self._format_queue_line(item)
+            self.queue_text.insert(f"{len(self._queue_lines) + 1}.0", text, tag)
+            self._queue_line_index[item.url] = len(self._queue_lines)
+            self._queue_lines.append(item.url)
+
+        for item in updated:
+            n = self._queue_line_index.get(item.url)
+            if n is None:
+                continue
+            text, tag = self._format_queue_line(item)
+            self.queue_text.delete(f"{n + 1}.0", f"{n + 2}.0")
+            self.queue_text.insert(f"{n + 1}.0", text, tag)
+
         self._update_tab_labels()
         self._update_counter()
 
+    @staticmethod
+    def _format_queue_line(item: DownloadItem) -> Tuple[str, str]:
+        """Text and color tag of one queue line."""
+        progress_str = f" [{item.progress:.0f}%]" if item.progress > 0 else ""
+
+        # Color by status
+        if item.status == DownloadStatus.DOWNLOADING:
+            tag = "info"
+        elif item.status == DownloadStatus.COMPLETED:
+            tag = "success"
+        elif item.status == DownloadStatus.FAILED:
+            tag = "error"
+        elif item.status == DownloadStatus.PAUSED:
+            tag = "warning"
+        else:
+            tag = "dim"
+
+        error_str = f" — {item.error_message[:50]}" if item.error_message else ""
+        path_str = (f" · {item.media_path.value}"
+                    if item.media_path and item.status == DownloadStatus.COMPLETED else "")
+        return f"{item.status_icon} {item.title}{progress_str}{path_str}{error_str}\n", tag
+
     def _update_tab_labels(self) -> None:
         """Update tab header labels."""
         try:
@@ -890,20 +1035,22 @@ class MainWindow:
         self._quality_var.set(self.settings.video_quality)
         self._subtitle_var.set(self.settings.subtitle_enabled)
         self._embed_subs_var.set(self.settings.embed_subtitles)
+        self.download_service.set_scheduling_policy(self.settings.scheduling_policy)
+        self.download_service.set_speed_limit(self.settings.speed_limit)
+        for name, value in SPEED_LIMITS:
+            if value == self.settings.speed_limit:
+                self._speed_limit_var.set(name)
+                break
         self._status_var.set("⚙️ Settings saved")
 
     def _show_batch_dialog(self) -> None:
         BatchURLDialog(self.root, on_submit=self._on_batch_submit)
 
     def _on_batch_submit(self, urls: List[str]) -> None:
-        valid_count = 0
-        for url in urls:
-            if is_valid_youtube_url(url):
-                threading.Thread(
-                    target=self._process_single_url, args=(url,), daemon=True,
-                ).start()
-                valid_count += 1
-        self._status_var.set(f"📋 {valid_count}/{len(urls)} URLs processing...")
+        valid = [url for url in urls if is_valid_youtube_url(url)]
+        # One bounded pool for the whole batch; results stream in as they resolve
+        self.download_service.fetch_video_infos_async(valid, self._on_info_fetched)
+        self._status_var.set(f"📋 {len(valid)}/{len(urls)} URLs processing...")
 
     def _show_statistics(self) -> None:
         stats = self.history_service.get_stats()
@@ -1019,5 +1166,5 @@ Right Click — Context menu (Queue tab)
         self.settings.window_height = self.root.winfo_height()
         self.settings.save()
 
-        self.download_service.cancel()
+        self.download_service.shutdown()
         self.root.destroy()